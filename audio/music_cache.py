@@ -0,0 +1,245 @@
+"""
+DRAGON'S LAIR RPG - Music Cache Module
+======================================
+
+This module keeps synthesized music tracks on disk, so the game only has
+to synthesize each track once instead of at every launch.
+
+WHAT THIS MODULE DOES:
+======================
+- Every track gets a key: a SHA-256 hash of everything that decides how
+  it sounds (the note tables, bpm, volume, sample rate and synth version).
+  Change one note and the key changes, so an old file is never played
+  for a new song ("content-addressed").
+- A track is stored as raw 16-bit PCM behind a small header, in a file
+  named after its key in the user's cache folder. Songs have 2 channels
+  (stereo); adaptive music stems are stored the same way with 4.
+- Loading memory-maps the file: the operating system pages the samples
+  in straight from disk, nothing is parsed or decoded.
+- Files are written to a temporary name first and then renamed, so a
+  crash halfway through a write never leaves a broken track behind.
+- The least recently used tracks are deleted once the cache is bigger
+  than MUSIC_CACHE_MAX_MB (tracks from an older synth version simply
+  stop being used and age out).
+
+FOR NOVICE CODERS:
+==================
+The cache is only a shortcut. If a file is missing, cut short or
+damaged (its checksum doesn't match), load() returns None and the music
+system synthesizes the track live, exactly like it would without a cache.
+
+    cache = MusicCache.default()
+    song = cache.load(key)          # None if not cached
+    if song is None:
+        song = synthesize()
+        cache.store(key, song)
+
+RESOURCE: This module provides the on-disk PCM cache for synthesized music.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+
+import numpy as np
+from config.constants import *
+
+# File header: magic, channels, bytes per sample, frames, CRC-32 of the samples
+PCM_HEADER = struct.Struct("<8sHHQI4x")
+PCM_MAGIC = b"DLPCM\x00\x00\x01"
+
+# Cached tracks end with this extension (temporary files start with a dot)
+PCM_EXTENSION = ".pcm"
+
+# Temporary files older than this (seconds) were left by a crash and are deleted
+STALE_TEMP_SECONDS = 3600
+
+
+def user_cache_dir(app_name="DragonsLair"):
+    """
+    Return the platform's folder for cached files
+
+    - Windows: %LOCALAPPDATA%/DragonsLair/Cache
+    - macOS: ~/Library/Caches/DragonsLair
+    - Android: the app's private folder/cache
+    - Linux and others: $XDG_CACHE_HOME/dragonslair (usually ~/.cache/dragonslair)
+    """
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+        return os.path.join(base, app_name, "Cache")
+    if sys.platform == "darwin":
+        return os.path.join(os.path.expanduser("~/Library/Caches"), app_name)
+    if "ANDROID_PRIVATE" in os.environ:
+        return os.path.join(os.environ["ANDROID_PRIVATE"], "cache")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, app_name.lower())
+
+
+def track_key(version, **parts):
+    """
+    Return the cache key for a track
+
+    Args:
+        version: Synthesizer version (bump it when the output changes)
+        **parts: Everything the track is made from (notes, bpm, volume, ...)
+
+    Returns:
+        str: 64 hex digits
+    """
+    description = json.dumps({"version": version, **parts}, sort_keys=True)
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+class MusicCache:
+    """
+    On-disk cache of synthesized tracks as memory-mapped raw PCM
+
+    Attributes:
+        directory (str): Folder the .pcm files live in
+        max_bytes (int): Size the cache is trimmed back to
+        hits (int): Tracks loaded from disk
+        misses (int): Tracks that were not cached (or were damaged)
+    """
+
+    def __init__(self, directory, max_bytes=MUSIC_CACHE_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def default(cls):
+        """The cache in MUSIC_CACHE_DIR (or the user cache folder), or None if disabled"""
+        if not MUSIC_CACHE_ENABLED:
+            return None
+        return cls(MUSIC_CACHE_DIR or os.path.join(user_cache_dir(), "music"))
+
+    def path(self, key):
+        """Return the file name for a key"""
+        return os.path.join(self.directory, key + PCM_EXTENSION)
+
+    def load(self, key):
+        """
+        Memory-map a cached track
+
+        Returns:
+            np.ndarray: Read-only (frames, channels) int16 samples, or None
+            if the track is missing or damaged (damaged files are deleted)
+        """
+        path = self.path(key)
+        try:
+            with open(path, "rb") as pcm_file:
+                header = pcm_file.read(PCM_HEADER.size)
+            magic, channels, sample_width, frames, checksum = PCM_HEADER.unpack(header)
+            if (magic != PCM_MAGIC or channels == 0 or sample_width != 2
+                    or os.path.getsize(path) != PCM_HEADER.size + frames * channels * sample_width):
+                raise ValueError("bad header or size")
+            if frames == 0:
+                song = np.zeros((0, channels), dtype=np.int16)
+            else:
+                song = np.memmap(path, dtype=np.int16, mode="r", offset=PCM_HEADER.size,
+                                 shape=(frames, channels))
+            if zlib.crc32(song) != checksum:
+                del song  # Unmap it, or Windows won't let us delete the file
+                raise ValueError("checksum mismatch")
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, struct.error) as error:
+            print(f"[WARNING] Damaged music cache file {path} ({error}) - synthesizing instead")
+            self.misses += 1
+            self.remove(path)
+            return None
+        self.hits += 1
+        try:
+            os.utime(path)  # Mark as recently used for eviction
+        except OSError:
+            pass
+        return song
+
+    def store(self, key, song):
+        """
+        Save a track (atomically) and trim the cache to max_bytes
+
+        Failing to write (read-only disk, disk full) is not an error: the
+        track just isn't cached.
+
+        Returns:
+            bool: True if the track was stored
+        """
+        song = np.ascontiguousarray(song, dtype=np.int16)
+        header = PCM_HEADER.pack(PCM_MAGIC, song.shape[1], 2, len(song), zlib.crc32(song))
+        temp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write next to the final file so the rename can't cross disks
+            handle, temp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=self.directory)
+            with os.fdopen(handle, "wb") as pcm_file:
+                pcm_file.write(header)
+                pcm_file.write(song.tobytes())
+                pcm_file.flush()
+                os.fsync(pcm_file.fileno())
+            os.replace(temp_path, self.path(key))
+        except OSError as error:
+            print(f"[WARNING] Could not write music cache ({error})")
+            if temp_path:
+                self.remove(temp_path)
+            return False
+        self.evict(keep=key)
+        return True
+
+    def evict(self, keep=None):
+        """
+        Delete least recently used tracks until the cache fits in max_bytes,
+        plus temporary files left behind by crashed writes
+
+        Args:
+            keep: Key that is never evicted (the track just stored)
+
+        Returns:
+            int: Files deleted
+        """
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return 0
+        now = time.time()
+        removed = 0
+        entries = []
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if name.startswith(".") and name.endswith(".tmp"):
+                if now - stat.st_mtime > STALE_TEMP_SECONDS:
+                    removed += self.remove(path)
+            elif name.endswith(PCM_EXTENSION) and name != f"{keep}{PCM_EXTENSION}":
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        if keep:
+            try:
+                total += os.path.getsize(self.path(keep))
+            except OSError:
+                pass
+        for _, size, path in sorted(entries):  # Oldest first
+            if total <= self.max_bytes:
+                break
+            if self.remove(path):
+                total -= size
+                removed += 1
+        return removed
+
+    def remove(self, path):
+        """Delete a file, ignoring errors (it may be in use on Windows)"""
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,273 @@
+"""
+DRAGON'S LAIR RPG - Music Player Module
+=======================================
+
+This module plays music tracks straight from their 16-bit samples on
+two reserved mixer channels, and crossfades between them.
+
+WHAT THIS MODULE DOES:
+======================
+- Tracks are NumPy int16 (frames, 2) arrays - the same samples the music
+  system synthesizes or memory-maps from the music cache. There is no WAV
+  file in between, so switching tracks parses and decodes nothing.
+- Short tracks are turned into one pygame Sound (Sound(buffer=...)) that
+  SDL loops by itself.
+- Long tracks are streamed: only a few seconds (one "chunk") is handed to
+  SDL at a time and the next chunk is queued behind it, so memory use
+  stays the same however long the track is.
+- A track change fades the old channel out while the new one fades in
+  (a crossfade), so there is never a gap of silence between themes.
+
+FOR NOVICE CODERS:
+==================
+A "deck" is one channel plus the track playing on it - like the two
+turntables of a DJ. While one deck plays, the other one is free for the
+next track:
+
+    player = MusicPlayer()
+    player.play("overworld", samples)   # fades in on deck A
+    player.play("battle", samples)      # deck A fades out, deck B fades in
+    player.update()                     # call every frame: fades and queues chunks
+
+RESOURCE: This module provides streaming, crossfading music playback.
+"""
+
+import time
+
+import numpy as np
+import pygame
+from config.constants import *
+from core import engine
+
+# Sample format of every track: 44.1 kHz, signed 16-bit, stereo
+TRACK_FORMAT = engine.MIXER_FORMAT
+
+
+def music_channel(index):
+    """Return reserved music channel `index` (engine.MUSIC_CHANNELS), starting the mixer if needed"""
+    engine.init_audio()
+    return pygame.mixer.Channel(index)
+
+
+def chunk_bounds(frames, chunk_frames):
+    """
+    Split a track into chunks
+
+    Args:
+        frames: Length of the track in sample frames
+        chunk_frames: Length of one chunk (the last chunk may be shorter)
+
+    Returns:
+        list: (start, end) frame of every chunk, in order
+    """
+    return [(start, min(start + chunk_frames, frames)) for start in range(0, frames, chunk_frames)]
+
+
+def samples_to_sound(samples):
+    """
+    Make a pygame Sound from int16 stereo samples
+
+    When the mixer runs in the tracks' own format, the samples are handed
+    to SDL as they are (Sound(buffer=...)). Otherwise pygame converts them
+    to whatever channel count the sound device was opened with.
+    """
+    if pygame.mixer.get_init() == TRACK_FORMAT:
+        return pygame.mixer.Sound(buffer=np.ascontiguousarray(samples, dtype=np.int16))
+    return pygame.sndarray.make_sound(np.ascontiguousarray(samples, dtype=np.int16))
+
+
+class MusicDeck:
+    """
+    One reserved mixer channel and the track playing on it
+
+    Attributes:
+        channel (pygame.mixer.Channel): The channel the deck plays on
+        name (str): Name of the track (None when the deck is free)
+        samples (np.ndarray): The track's int16 (frames, 2) samples
+        chunks (list): (start, end) frames of the chunks (one chunk = not streamed)
+        next_chunk (int): Index of the next chunk to hand to the channel
+        loop (bool): Start again from the first chunk after the last one
+        gain (float): Volume when the current fade started
+        target (float): Volume the deck is fading towards (0 = fading out)
+        fade_start (float): time.perf_counter() when the current fade started
+        fade_seconds (float): How long the current fade takes
+    """
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.clear()
+
+    def clear(self):
+        """Forget the track (the channel must already be stopped)"""
+        self.name = None
+        self.samples = None
+        self.chunks = []
+        self.next_chunk = 0
+        self.loop = False
+        self.gain = 0.0
+        self.target = 0.0
+        self.fade_start = 0.0
+        self.fade_seconds = 0.0
+
+    def load(self, name, samples, loop, chunk_frames):
+        """Get a track ready to play (it starts silent, call fade_to() next)"""
+        self.name = name
+        self.samples = samples
+        self.loop = loop
+        # Tracks up to two chunks long are not worth streaming
+        if len(samples) <= chunk_frames * 2:
+            self.chunks = [(0, len(samples))]
+        else:
+            self.chunks = chunk_bounds(len(samples), chunk_frames)
+        self.next_chunk = 0
+        self.gain = 0.0
+        self.target = 0.0
+
+    def volume(self, now):
+        """Volume of the deck at time `now` (a straight ramp from gain to target)"""
+        if self.fade_seconds <= 0:
+            return self.target
+        progress = min(1.0, (now - self.fade_start) / self.fade_seconds)
+        return self.gain + (self.target - self.gain) * progress
+
+    def fade_to(self, target, seconds, now):
+        """Start fading from the current volume to `target`"""
+        self.gain = self.volume(now)
+        self.target = target
+        self.fade_start = now
+        self.fade_seconds = seconds
+
+    def fading_out(self):
+        return self.name is not None and self.target == 0.0
+
+    def has_chunks_left(self):
+        return self.loop or self.next_chunk < len(self.chunks)
+
+    def take_chunk(self):
+        """Return the next chunk as a Sound and move past it (None at the end)"""
+        if self.next_chunk >= len(self.chunks):
+            if not self.loop:
+                return None
+            self.next_chunk = 0
+        start, end = self.chunks[self.next_chunk]
+        self.next_chunk += 1
+        return samples_to_sound(self.samples[start:end])
+
+    def feed(self):
+        """Keep the channel playing: start it, or queue the chunk after the current one"""
+        if len(self.chunks) == 1:
+            # Not streamed: one Sound that SDL loops by itself
+            if self.next_chunk == 0:
+                self.channel.play(self.take_chunk(), loops=-1 if self.loop else 0)
+            return
+        if not self.channel.get_busy():
+            # Just started (or the game stalled longer than a chunk)
+            sound = self.take_chunk()
+            if sound is None:
+                return
+            self.channel.play(sound)
+        if self.channel.get_queue() is None:
+            sound = self.take_chunk()
+            if sound is not None:
+                self.channel.queue(sound)
+
+    def is_playing(self):
+        """True while the track is audible or has more to play"""
+        if self.name is None:
+            return False
+        if len(self.chunks) == 1:
+            return self.channel.get_busy()
+        return self.channel.get_busy() or self.has_chunks_left()
+
+
+class MusicPlayer:
+    """
+    Plays music tracks on two reserved channels with crossfades
+
+    Attributes:
+        volume (float): Overall music volume (0.0 to 1.0)
+        crossfade_seconds (float): Length of the fade between two tracks
+        chunk_frames (int): Sample frames per streamed chunk
+        decks (list): The two MusicDecks (None until the mixer is first needed)
+    """
+
+    def __init__(self, volume=MUSIC_VOLUME, crossfade_ms=MUSIC_CROSSFADE_MS,
+                 chunk_seconds=MUSIC_STREAM_CHUNK_SECONDS):
+        self.volume = volume
+        self.crossfade_seconds = crossfade_ms / 1000
+        self.chunk_frames = max(1, int(TRACK_FORMAT[0] * chunk_seconds))
+        self.decks = None
+
+    def open(self):
+        """Set up the two decks on reserved music channels"""
+        if self.decks is None:
+            self.decks = [MusicDeck(music_channel(0)), MusicDeck(music_channel(1))]
+        return self.decks
+
+    @property
+    def current(self):
+        """The deck playing (or fading in) the current track, or None"""
+        for deck in self.decks or ():
+            if deck.name is not None and not deck.fading_out():
+                return deck
+        return None
+
+    def play(self, name, samples, loop=True, now=None):
+        """
+        Crossfade from the current track to a new one
+
+        Args:
+            name: Track name (playing the current track again does nothing)
+            samples: The track's int16 (frames, 2) samples
+            loop: Repeat the track until something else is played
+            now: Current time (time.perf_counter(), for tests)
+        """
+        now = time.perf_counter() if now is None else now
+        current = self.current
+        if current is not None and current.name == name:
+            return
+        decks = self.open()
+        self.stop(now=now)
+        # Take the free deck, or cut off the older of two fading decks
+        deck = min(decks, key=lambda d: (d.name is not None, d.volume(now)))
+        if deck.name is not None:
+            deck.channel.stop()
+            deck.clear()
+        deck.load(name, samples, loop, self.chunk_frames)
+        deck.fade_to(1.0, self.crossfade_seconds, now)
+        deck.channel.set_volume(0.0)
+        deck.feed()
+
+    def stop(self, now=None):
+        """Fade the current track out"""
+        now = time.perf_counter() if now is None else now
+        current = self.current
+        if current is not None:
+            current.fade_to(0.0, self.crossfade_seconds, now)
+
+    def stop_now(self):
+        """Silence every deck immediately"""
+        for deck in self.decks or ():
+            deck.channel.stop()
+            deck.clear()
+
+    def update(self, now=None):
+        """Move the fades along and keep streamed tracks fed (call every frame)"""
+        if self.decks is None:
+            return
+        now = time.perf_counter() if now is None else now
+        for deck in self.decks:
+            if deck.name is None:
+                continue
+            gain = deck.volume(now)
+            if deck.fading_out() and gain <= 0.0:
+                deck.channel.stop()
+                deck.clear()
+                continue
+            deck.channel.set_volume(gain * self.volume)
+            deck.feed()
+
+    def is_playing(self):
+        """True while the current track has not finished (one-shot tracks end)"""
+        current = self.current
+        return current is not None and current.is_playing()
@@ -3,18 +3,101 @@ DRAGON'S LAIR RPG - Music System Module
 =======================================
 
 This module contains the MusicSystem class for procedural music generation.
+
+Tracks are loaded from the on-disk music cache when possible. Tracks that
+aren't cached are synthesized by a pool of worker processes while the
+game is already running; the start menu theme always comes first, and
+update() starts each track the moment it is ready.
+
+Tracks are kept as int16 samples (memory-mapped from the cache when they
+come from there) and played by a MusicPlayer, which streams long tracks
+and crossfades from one theme to the next.
+
+With MUSIC_ADAPTIVE on, the overworld, town, battle and boss themes are
+played from their separate voices ("stems") by a StemMixer instead, so
+drums, bass and lead can follow the danger the player is in.
 """
 
 import pygame
 import numpy as np
-import io
-import wave
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from config.constants import *
+from core import engine
+from audio.music_cache import MusicCache, track_key
+from audio.music_player import MusicPlayer
+from audio.stem_mixer import StemMixer
+from audio.oscillator import ADSR, oscillator
+from systems.profiler import profiled
+
+# Samples per second of every generated track
+SAMPLE_RATE = 44100
+
+# Part of every music cache key: bump it whenever render_chiptune_song's
+# output changes, so tracks cached by an older version are not used
+SYNTH_VERSION = 2
+
+# (amplitude, waveform, envelope) of the melody, bass, percussion and lead voices
+CHIPTUNE_VOICES = (
+    (1.0, "sine", ADSR(attack=0.005, decay=0.08, sustain=0.85, release=0.03)),
+    (0.25, "square", ADSR(attack=0.004, decay=0.05, sustain=0.9, release=0.02)),
+    (0.18, "square", ADSR(attack=0.002, decay=0.12, sustain=0.3, release=0.02)),  # Drum-like hit
+    (0.18, "sine", ADSR(attack=0.003, decay=0.06, sustain=0.7, release=0.02)),
+)
+
+# Every track, in the order they are synthesized (the title theme is needed first)
+TRACKS = ("start_menu", "overworld", "town", "battle", "boss", "victory", "game_over")
+
+# The track each game state plays (overworld and battle also depend on area/boss)
+STATE_TRACKS = {
+    "start_menu": "start_menu",
+    "opening_cutscene": "start_menu",
+    "character_select": "start_menu",
+    "overworld": "overworld",
+    "battle": "battle",
+    "victory": "victory",
+    "game_over": "game_over",
+}
+
+# Tracks that play once instead of looping
+ONE_SHOT_TRACKS = ("victory", "game_over")
+
+# Tracks played from stems by the StemMixer when MUSIC_ADAPTIVE is on
+ADAPTIVE_TRACKS = ("overworld", "town", "battle", "boss")
+
+
+def chiptune_recipe(melody, bass, percussion=None, lead=None, bpm=220, volume=0.16):
+    """Pack everything a song is made from (the arguments of render_chiptune_song)"""
+    return {"melody": melody, "bass": bass, "percussion": percussion, "lead": lead,
+            "bpm": bpm, "volume": volume}
+
+
+def synthesize_track(name):
+    """
+    Build one track's samples - runs inside a worker process
+    
+    The worker has its own MusicSystem (without sound effects or workers)
+    and stores what it synthesizes in the shared on-disk cache. If the
+    track made it into the cache, None is returned and the game maps the
+    cached file instead of receiving a second copy of the samples.
+    """
+    music = MusicSystem.__new__(MusicSystem)
+    music.cache = MusicCache.default()
+    song = music.generate_track(name)
+    if music.cache is None:
+        return np.asarray(song)
+    if MUSIC_ADAPTIVE and name in ADAPTIVE_TRACKS:
+        music.track_stems(name)  # Cached for when the theme first plays
+    if music.cached_track(name) is not None:
+        return None
+    return np.asarray(song)
+
 
 class MusicSystem:
     """
     Generates dynamic chiptune music that changes based on game state.
     Creates different musical themes for different areas and situations.
+    Synthesized tracks are kept in an on-disk MusicCache between launches.
     
     Music Types:
     - Start Menu: Epic title theme
@@ -25,27 +108,167 @@ class MusicSystem:
     - Victory: Triumphant victory theme
     - Game Over: Somber ending theme
     """
-    def __init__(self):
+    # On-disk track cache (None = always synthesize)
+    cache = None
+    
+    def __init__(self, workers=MUSIC_WORKERS, adaptive=MUSIC_ADAPTIVE):
+        """
+        Load or start synthesizing every track
+        
+        Args:
+            workers: Background processes for tracks that aren't cached
+                     (0 = synthesize them all right here before returning)
+            adaptive: Play ADAPTIVE_TRACKS from stems that follow the action
+        """
+        self.cache = MusicCache.default()
         self.current_track = None
         self.last_state = None
+        self.last_area_type = None
         self.boss_battle_active = False
+        self.wanted_track = None
+        self.tracks = {}    # Track name -> int16 samples (None if it couldn't be made)
+        self.pending = {}   # Track name -> Future of a track still being synthesized
+        self.pool = None
+        self.player = MusicPlayer()
+        self.stem_mixer = StemMixer() if adaptive else None
+        self.stems = {}     # Track name -> int16 (frames, 4) stems, made the first time a theme plays
+        
+        # Cached tracks load in a few milliseconds, so they are read right away
+        missing = []
+        for name in TRACKS:
+            song = self.cached_track(name)
+            if song is None:
+                missing.append(name)
+            else:
+                self.tracks[name] = song
         
+        # The title theme is needed before anything else: make it here
+        if missing and (workers <= 0 or missing[0] == "start_menu"):
+            self.build_track(missing.pop(0))
+        if missing and workers > 0:
+            self.pool = self.create_pool(min(workers, len(missing)))
+            for name in missing:
+                self.pending[name] = self.pool.submit(synthesize_track, name)
+        else:
+            for name in missing:
+                self.build_track(name)
+    
+    def create_pool(self, workers):
+        """
+        Start the worker pool for background synthesis
+        
+        NumPy synthesis is CPU-bound, so it runs in separate processes
+        (started fresh with "spawn", never forked from a running game).
+        Platforms without multiprocessing fall back to a thread.
+        """
         try:
-            # Store raw bytes instead of BytesIO objects
-            self.start_menu_music_bytes = self.sound_to_wav_bytes(self.generate_start_menu_music())
-            self.overworld_music_bytes = self.sound_to_wav_bytes(self.generate_overworld_music())
-            self.town_music_bytes = self.sound_to_wav_bytes(self.generate_town_music())
-            self.battle_music_bytes = self.sound_to_wav_bytes(self.generate_battle_music())
-            self.boss_music_bytes = self.sound_to_wav_bytes(self.generate_boss_music())
-            self.victory_music_bytes = self.sound_to_wav_bytes(self.generate_victory_music())
-            self.game_over_music_bytes = self.sound_to_wav_bytes(self.generate_game_over_music())
-            print('Music bytes created successfully')
+            return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        except (OSError, NotImplementedError, ImportError, ValueError) as e:
+            print(f"[WARNING] No music worker processes ({e}) - using a thread")
+            return ThreadPoolExecutor(1)
+    
+    def build_track(self, name):
+        """Load or synthesize a track right now (None if it fails)"""
+        try:
+            self.tracks[name] = self.generate_track(name)
         except Exception as e:
-            print(f"Failed to create music bytes: {e}")
-            self.start_menu_music_bytes = self.overworld_music_bytes = self.battle_music_bytes = None
-            self.boss_music_bytes = self.victory_music_bytes = self.game_over_music_bytes = None
+            print(f"Failed to create {name} music: {e}")
+            self.tracks[name] = None
+    
+    def collect_tracks(self):
+        """Take in tracks the workers have finished"""
+        for name, future in list(self.pending.items()):
+            if not future.done():
+                continue
+            del self.pending[name]
+            try:
+                song = future.result()
+            except Exception as e:
+                print(f"Failed to create {name} music in the background: {e}")
+                song = None
+            if song is None:
+                song = self.cached_track(name)  # Where the worker left it
+            if song is None:
+                self.build_track(name)  # Try once more here
+            else:
+                self.tracks[name] = song
+        if not self.pending and self.pool:
+            self.pool.shutdown(wait=False)
+            self.pool = None
+    
+    def wait_for_tracks(self, names=TRACKS):
+        """Block until the given tracks are ready (used by tools that need every track)"""
+        for name in names:
+            future = self.pending.get(name)
+            if future is not None:
+                try:
+                    future.result()
+                except Exception:
+                    pass
+        self.collect_tracks()
+    
+    def progress(self):
+        """Return (tracks ready, total tracks) for the loading indicator"""
+        return len(self.tracks), len(TRACKS)
+    
+    def shutdown(self):
+        """Stop the workers (unfinished tracks are dropped) and the music"""
+        if self.pool:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+        self.pending.clear()
+        self.player.stop_now()
+        if self.stem_mixer is not None:
+            self.stem_mixer.close()
+    
+    def is_playing(self):
+        """True until the current track has finished (only one-shot tracks finish)"""
+        if self.stem_mixer is not None and self.stem_mixer.is_playing():
+            return True
+        return self.player.is_playing()
+    
+    def set_intensity(self, proximity, health, boss_tier):
+        """
+        Tell the adaptive music how dangerous things are (each 0.0 to 1.0)
+        
+        Args:
+            proximity: How close the nearest enemy is (1.0 = in battle)
+            health: Player HP as a fraction of max HP
+            boss_tier: Evolution tier of the boss being fought (0.0 = no boss)
+        """
+        if self.stem_mixer is not None:
+            self.stem_mixer.set_signals(proximity, health, boss_tier)
     
-    def generate_start_menu_music(self):
+    def track_recipe(self, name):
+        """Return the notes, bpm and volume of a track"""
+        return getattr(self, f"{name}_notes")()
+    
+    def track_cache_key(self, name):
+        """Return the music cache key of a track"""
+        return track_key(SYNTH_VERSION, sample_rate=SAMPLE_RATE, **self.track_recipe(name))
+    
+    def cached_track(self, name):
+        """Return a track's samples if the cache has it, otherwise None"""
+        if self.cache is None:
+            return None
+        return self.cache.load(self.track_cache_key(name))
+    
+    def generate_track(self, name):
+        """Return a track's samples (from the cache, or synthesized and cached)"""
+        return self.chiptune_song(**self.track_recipe(name))
+    
+    def track_stems(self, name):
+        """Return a track's stems (from the cache, or synthesized and cached)"""
+        recipe = self.track_recipe(name)
+        key = track_key(SYNTH_VERSION, sample_rate=SAMPLE_RATE, stems=True, **recipe)
+        stems = self.cache.load(key) if self.cache is not None else None
+        if stems is None:
+            stems = self.render_chiptune_stems(**recipe)
+            if self.cache is not None:
+                self.cache.store(key, stems)
+        return stems
+    
+    def start_menu_notes(self):
         # Epic title screen theme
         melody = [
             (523.25, 0.5), (659.25, 0.5), (783.99, 0.5), (987.77, 0.5),  # C5, E5, G5, B5
@@ -64,71 +287,69 @@ class MusicSystem:
             (200, 0.5), (0, 0.5), (150, 0.5), (0, 0.5)
         ] * 4
         
-        return self.generate_chiptune_song(melody, bass, percussion=percussion, bpm=80, volume=0.25)
+        return chiptune_recipe(melody, bass, percussion=percussion, bpm=80, volume=0.25)
     
-    def sound_to_wav_bytes(self, sound):
-        try:
-            arr = pygame.sndarray.array(sound)
-            memfile = io.BytesIO()
-            with wave.open(memfile, 'wb') as wf:
-                wf.setnchannels(2)
-                wf.setsampwidth(2)  # 16 bits
-                wf.setframerate(44100)
-                wf.writeframes(arr.astype(np.int16).tobytes())
-            return memfile.getvalue()  # Return the bytes content
-        except Exception as e:
-            print(f"Error converting sound to WAV: {e}")
-            return None
+    def track_for_state(self, game_state, is_boss_battle=False, current_area=None):
+        """Return the track a game state should play (None for states without music)"""
+        name = STATE_TRACKS.get(game_state)
+        if name == "overworld" and current_area and current_area.area_type == "town":
+            name = "town"
+        elif name == "battle" and is_boss_battle:
+            name = "boss"
+        # A track that failed to build falls back to the plain overworld/battle theme
+        if name in ("town", "boss") and name not in self.pending and self.tracks.get(name) is None:
+            name = "overworld" if name == "town" else "battle"
+        return name
     
+    @profiled("music.update")
     def update(self, game_state, is_boss_battle=False, current_area=None):
-        # Only update when state or boss battle status changes
-        if game_state == self.last_state and is_boss_battle == self.boss_battle_active:
+        self.player.update()  # Crossfades and streaming move on every frame
+        if self.pending:
+            self.collect_tracks()
+        # Only switch when state, area type or boss battle status changes (or a track we wait for arrives)
+        area_type = current_area.area_type if current_area else None
+        if (game_state == self.last_state and is_boss_battle == self.boss_battle_active
+                and area_type == self.last_area_type and self.wanted_track is None):
             return
         
         self.last_state = game_state
+        self.last_area_type = area_type
         self.boss_battle_active = is_boss_battle
-        pygame.mixer.music.stop()
-        pygame.mixer.music.set_volume(0.5)
+        name = self.track_for_state(game_state, is_boss_battle, current_area)
+        if name in self.pending:
+            # Still being synthesized: keep playing the previous track (or
+            # silence) and start this one as soon as it is ready
+            self.wanted_track = name
+            return
+        self.wanted_track = None
         
-        try:
-            if game_state == "start_menu" and self.start_menu_music_bytes:
-                pygame.mixer.music.load(io.BytesIO(self.start_menu_music_bytes))
-                pygame.mixer.music.play(-1)
-            elif game_state == "opening_cutscene" and self.start_menu_music_bytes:
-                pygame.mixer.music.load(io.BytesIO(self.start_menu_music_bytes))
-                pygame.mixer.music.play(-1)
-            elif game_state == "character_select" and self.start_menu_music_bytes:
-                pygame.mixer.music.load(io.BytesIO(self.start_menu_music_bytes))
-                pygame.mixer.music.play(-1)
-            elif game_state == "overworld":
-                # Check if we're in a town area
-                if current_area and current_area.area_type == "town" and self.town_music_bytes:
-                    pygame.mixer.music.load(io.BytesIO(self.town_music_bytes))
-                    pygame.mixer.music.play(-1)
-                elif self.overworld_music_bytes:
-                    pygame.mixer.music.load(io.BytesIO(self.overworld_music_bytes))
-                    pygame.mixer.music.play(-1)
-            elif game_state == "battle":
-                if is_boss_battle and self.boss_music_bytes:
-                    pygame.mixer.music.load(io.BytesIO(self.boss_music_bytes))
-                    pygame.mixer.music.play(-1)
-                elif self.battle_music_bytes:
-                    pygame.mixer.music.load(io.BytesIO(self.battle_music_bytes))
-                    pygame.mixer.music.play(-1)
-                else:
-                    print('MusicSystem: WARNING - No battle music available!')
-            elif game_state == "victory" and self.victory_music_bytes:
-                pygame.mixer.music.load(io.BytesIO(self.victory_music_bytes))
-                pygame.mixer.music.play(0)
-            elif game_state == "game_over" and self.game_over_music_bytes:
-                pygame.mixer.music.load(io.BytesIO(self.game_over_music_bytes))
-                pygame.mixer.music.play(0)
+        samples = self.tracks.get(name)
+        if samples is None:
+            self.player.stop()
+            if self.stem_mixer is not None:
+                self.stem_mixer.stop()
+            self.current_track = None
+            if name == "battle":
+                print('MusicSystem: WARNING - No battle music available!')
             else:
                 print(f'MusicSystem: No music for state: {game_state}')
-        except Exception as e:
+            return
+        try:
+            # The same track keeps playing; a new one crossfades in
+            if self.stem_mixer is not None and name in ADAPTIVE_TRACKS:
+                self.player.stop()
+                if name not in self.stems:
+                    self.stems[name] = self.track_stems(name)
+                self.stem_mixer.play(name, self.stems[name], self.track_recipe(name)["volume"])
+            else:
+                if self.stem_mixer is not None:
+                    self.stem_mixer.stop()
+                self.player.play(name, samples, loop=name not in ONE_SHOT_TRACKS)
+            self.current_track = name
+        except pygame.error as e:
             print(f"Music playback error: {e}")
     
-    def generate_overworld_music(self):
+    def overworld_notes(self):
         # Calm adventure theme
         melody = [
             (440, 0.5), (523.25, 0.5), (659.25, 0.5), (783.99, 0.5),  # A4, C5, E5, G5
@@ -140,9 +361,9 @@ class MusicSystem:
             (130.81, 1), (146.83, 1), (164.81, 1), (174.61, 1),  # C3, D3, E3, F3
             (196.00, 1), (220.00, 1), (246.94, 1), (261.63, 1)   # G3, A3, B3, C4
         ]
-        return self.generate_chiptune_song(melody, bass, bpm=90, volume=0.2)
+        return chiptune_recipe(melody, bass, bpm=90, volume=0.2)
     
-    def generate_town_music(self):
+    def town_notes(self):
         # Peaceful town theme with bells and gentle melody
         melody = [
             (523.25, 0.5), (587.33, 0.5), (659.25, 0.5), (698.46, 0.5),  # C5, D5, E5, F5
@@ -164,9 +385,9 @@ class MusicSystem:
             (880.00, 0.25), (0, 0.25), (784.00, 0.25), (0, 0.25),  # A5, rest, G5, rest
             (659.25, 0.25), (0, 0.25), (587.33, 0.25), (0, 0.25)   # E5, rest, D5, rest
         ]
-        return self.generate_chiptune_song(melody, bass, percussion, lead, bpm=120, volume=0.15)
+        return chiptune_recipe(melody, bass, percussion, lead, bpm=120, volume=0.15)
     
-    def generate_battle_music(self):
+    def battle_notes(self):
         # Intense battle theme
         melody = [
             (587.33, 0.25), (659.25, 0.25), (783.99, 0.25), (659.25, 0.25),  # D5, E5, G5, E5
@@ -182,9 +403,9 @@ class MusicSystem:
             (150, 0.25), (0, 0.25), (100, 0.25), (0, 0.25),  # Kick, rest, snare, rest
             (150, 0.25), (0, 0.25), (100, 0.25), (0, 0.25)
         ] * 4
-        return self.generate_chiptune_song(melody, bass, percussion=percussion, bpm=140, volume=0.25)
+        return chiptune_recipe(melody, bass, percussion=percussion, bpm=140, volume=0.25)
     
-    def generate_boss_music(self):
+    def boss_notes(self):
         # Epic boss battle theme
         melody = [
             (220, 0.25), (261.63, 0.25), (329.63, 0.25), (392.00, 0.25),  # A3, C4, E4, G4
@@ -208,9 +429,9 @@ class MusicSystem:
             (880.00, 0.25), (0, 0.25), (698.46, 0.25), (0, 0.25),  # A5, rest, F5, rest
             (587.33, 0.25), (0, 0.25), (493.88, 0.25), (0, 0.25)   # D5, rest, B4, rest
         ]
-        return self.generate_chiptune_song(melody, bass, percussion, lead, bpm=160, volume=0.3)
+        return chiptune_recipe(melody, bass, percussion, lead, bpm=160, volume=0.3)
     
-    def generate_victory_music(self):
+    def victory_notes(self):
         # Triumphant victory theme
         melody = [
             (659.25, 0.3), (783.99, 0.3), (987.77, 0.3), (880.00, 0.5),  # E5, G5, B5, A5
@@ -226,9 +447,9 @@ class MusicSystem:
             (500, 0.1), (0, 0.1), (600, 0.1), (0, 0.1),
             (700, 0.5)  # Cymbal crash
         ]
-        return self.generate_chiptune_song(melody, bass, percussion, bpm=120, volume=0.3)
+        return chiptune_recipe(melody, bass, percussion, bpm=120, volume=0.3)
     
-    def generate_game_over_music(self):
+    def game_over_notes(self):
         # Somber game over theme
         melody = [
             (261.63, 1.0), (246.94, 1.0), (220.00, 1.0), (196.00, 2.0),  # C4, B3, A3, G3
@@ -238,7 +459,7 @@ class MusicSystem:
             (65.41, 2.0), (61.74, 2.0), (55.00, 2.0), (49.00, 4.0),  # C2, B1, A1, G1
             (43.65, 2.0), (41.20, 2.0), (36.71, 2.0), (32.70, 4.0)   # F1, E1, D1, C1
         ]
-        return self.generate_chiptune_song(melody, bass, bpm=60, volume=0.25)
+        return chiptune_recipe(melody, bass, bpm=60, volume=0.25)
     
     def generate_chiptune_song(self, melody, bass, percussion=None, lead=None, bpm=220, volume=0.16):
         """
@@ -252,67 +473,127 @@ class MusicSystem:
             bpm: Beats per minute for tempo
             volume: Overall volume level (0.0 to 1.0)
         """
-        melody = [list(note) for note in melody]
-        bass = [list(note) for note in bass]
-        if percussion is not None:
-            percussion = [list(note) for note in percussion]
-        if lead is not None:
-            lead = [list(note) for note in lead]
-        song = np.zeros((0, 2), dtype=np.int16)
-        melody_idx = bass_idx = perc_idx = lead_idx = 0
-        melody_len = len(melody)
-        bass_len = len(bass)
-        perc_len = len(percussion) if percussion is not None else 0
-        lead_len = len(lead) if lead is not None else 0
-        while (melody_idx < melody_len or bass_idx < bass_len or
-               (percussion is not None and perc_idx < perc_len) or
-               (lead is not None and lead_idx < lead_len)):
-            if melody_idx < melody_len:
-                m_freq, m_beats = melody[melody_idx]
-            else:
-                m_freq, m_beats = 0, 0.25
-            if bass_idx < bass_len:
-                b_freq, b_beats = bass[bass_idx]
-            else:
-                b_freq, b_beats = 0, 0.25
-            if percussion is not None and perc_idx < perc_len:
-                p_freq, p_beats = percussion[perc_idx]
-            else:
-                p_freq, p_beats = 0, 0.25
-            if lead is not None and lead_idx < lead_len:
-                l_freq, l_beats = lead[lead_idx]
-            else:
-                l_freq, l_beats = 0, 0.25
-            step_beats = min(m_beats, b_beats, p_beats, l_beats)
-            step_duration = 60 / bpm * step_beats
-            t = np.linspace(0, step_duration, int(44100 * step_duration), False)
-            # Generate waves
-            m_wave = np.sin(m_freq * 2 * np.pi * t) if m_freq > 0 else np.zeros_like(t)
-            b_wave = 0.25 * np.sign(np.sin(b_freq * 2 * np.pi * t)) if b_freq > 0 else np.zeros_like(t)
-            p_wave = 0.18 * np.sign(np.sin(p_freq * 2 * np.pi * t)) if percussion is not None and p_freq > 0 else np.zeros_like(t)
-            l_wave = 0.18 * np.sin(l_freq * 2 * np.pi * t) if lead is not None and l_freq > 0 else np.zeros_like(t)
-            # Combine waves
-            wave = m_wave + b_wave + p_wave + l_wave
-            wave = np.clip(wave, -1, 1)
-            # Convert to audio
-            audio = (wave * volume * 32767).astype(np.int16)
-            audio_stereo = np.column_stack((audio, audio))
-            song = np.concatenate((song, audio_stereo))
-            # Update note durations
-            if melody_idx < melody_len:
-                melody[melody_idx][1] -= step_beats
-                if melody[melody_idx][1] <= 0:
-                    melody_idx += 1
-            if bass_idx < bass_len:
-                bass[bass_idx][1] -= step_beats
-                if bass[bass_idx][1] <= 0:
-                    bass_idx += 1
-            if percussion is not None and perc_idx < perc_len:
-                percussion[perc_idx][1] -= step_beats
-                if percussion[perc_idx][1] <= 0:
-                    perc_idx += 1
-            if lead is not None and lead_idx < lead_len:
-                lead[lead_idx][1] -= step_beats
-                if lead[lead_idx][1] <= 0:
-                    lead_idx += 1
-        return pygame.sndarray.make_sound(song) 
\ No newline at end of file
+        engine.init_audio()  # Sounds need a running mixer
+        return pygame.sndarray.make_sound(self.chiptune_song(melody, bass, percussion, lead, bpm, volume))
+    
+    def chiptune_song(self, melody, bass, percussion=None, lead=None, bpm=220, volume=0.16):
+        """
+        Return a song's samples from the music cache, synthesizing (and
+        caching) it if it isn't there. Without a cache it always synthesizes.
+        """
+        if self.cache is None:
+            return self.render_chiptune_song(melody, bass, percussion, lead, bpm, volume)
+        key = track_key(SYNTH_VERSION, sample_rate=SAMPLE_RATE,
+                        **chiptune_recipe(melody, bass, percussion, lead, bpm, volume))
+        song = self.cache.load(key)
+        if song is None:
+            song = self.render_chiptune_song(melody, bass, percussion, lead, bpm, volume)
+            self.cache.store(key, song)
+        return song
+    
+    def chiptune_notes(self, melody, bass, percussion=None, lead=None, bpm=220):
+        """
+        Work out where every note of the four voices starts and ends.
+        
+        The voices are walked together in steps: each step lasts until the
+        next note change in any voice, and is int(SAMPLE_RATE * seconds)
+        samples long, so every voice lines up on the same sample grid. A
+        voice that has run out of notes (or is None) is silent and counts
+        as a quarter beat.
+        
+        Returns:
+            tuple: (song length in samples, one list of (start, samples,
+            frequency) notes per voice, rests left out)
+        """
+        voices = [[list(note) for note in voice] if voice is not None else []
+                  for voice in (melody, bass, percussion, lead)]
+        positions = [0, 0, 0, 0]
+        starts = [0, 0, 0, 0]     # Sample where each voice's current note began
+        notes = [[], [], [], []]
+        length = 0
+        while any(position < len(voice) for position, voice in zip(positions, voices)):
+            step_beats = min(voice[position][1] if position < len(voice) else 0.25
+                             for position, voice in zip(positions, voices))
+            length += int(SAMPLE_RATE * 60 / bpm * step_beats)
+            # Use up the step's beats; a finished note moves its voice to the next one
+            for i, voice in enumerate(voices):
+                if positions[i] < len(voice):
+                    note = voice[positions[i]]
+                    note[1] -= step_beats
+                    if note[1] <= 0:
+                        if note[0] > 0 and length > starts[i]:
+                            notes[i].append((starts[i], length - starts[i], note[0]))
+                        positions[i] += 1
+                        starts[i] = length
+        return length, notes
+    
+    def chiptune_note_waves(self, melody, bass, percussion=None, lead=None, bpm=220):
+        """
+        Synthesize every note of a song.
+        
+        Every note is played by the wavetable oscillator (band-limited, so
+        the square waves don't alias) and shaped by its voice's ADSR
+        envelope, so it starts and ends at silence without a click. Songs
+        repeat a lot, so each (voice, note, length) is made once and handed
+        out again wherever it comes back.
+        
+        Returns:
+            tuple: (song length in samples, list of (voice, start, float32
+            wave) with each wave already at its voice's amplitude)
+        """
+        length, notes = self.chiptune_notes(melody, bass, percussion, lead, bpm)
+        waves = {}
+        envelopes = {}
+        placed = []
+        for voice, (voice_notes, (amplitude, waveform, envelope)) in enumerate(zip(notes, CHIPTUNE_VOICES)):
+            for start, samples, freq in voice_notes:
+                wave = waves.get((voice, samples, freq))
+                if wave is None:
+                    shape = envelopes.get((voice, samples))
+                    if shape is None:
+                        shape = envelopes[(voice, samples)] = envelope.shape(samples) * np.float32(amplitude)
+                    wave, _ = oscillator(waveform, freq, samples)
+                    wave *= shape
+                    waves[(voice, samples, freq)] = wave
+                placed.append((voice, start, wave))
+        return length, placed
+    
+    def render_chiptune_song(self, melody, bass, percussion=None, lead=None, bpm=220, volume=0.16):
+        """
+        Synthesize a song into one int16 stereo array.
+        
+        The notes from chiptune_note_waves() are added into one buffer,
+        clipped to -1..1 and scaled by the song's volume.
+        
+        Returns:
+            np.ndarray: (samples, 2) int16 audio at SAMPLE_RATE
+        """
+        length, placed = self.chiptune_note_waves(melody, bass, percussion, lead, bpm)
+        wave = np.zeros(length, dtype=np.float32)
+        for _, start, note in placed:
+            wave[start:start + len(note)] += note
+        np.clip(wave, -1, 1, out=wave)
+        wave *= volume * 32767
+        song = np.empty((length, 2), dtype=np.int16)
+        song[:] = wave[:, None]  # Both channels in one pass
+        return song
+    
+    def render_chiptune_stems(self, melody, bass, percussion=None, lead=None, bpm=220, volume=0.16):
+        """
+        Synthesize a song as four separate voices ("stems") for the StemMixer.
+        
+        The voices are the same as in render_chiptune_song(), already scaled
+        by the song's volume, but nothing is added up or clipped - the
+        StemMixer does that while playing, with its own volume per stem.
+        Added up and clipped at full volume they give the normal song
+        (to within rounding).
+        
+        Returns:
+            np.ndarray: (samples, 4) int16 melody, bass, percussion and lead at SAMPLE_RATE
+        """
+        length, placed = self.chiptune_note_waves(melody, bass, percussion, lead, bpm)
+        stems = np.zeros((length, len(CHIPTUNE_VOICES)), dtype=np.int16)
+        scale = volume * 32767
+        for voice, start, note in placed:
+            stems[start:start + len(note), voice] = note * scale
+        return stems
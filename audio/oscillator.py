@@ -0,0 +1,201 @@
+"""
+DRAGON'S LAIR RPG - Wavetable Oscillator Module
+===============================================
+
+This module makes the raw waves that the music and the sound effects are
+built from, by looking them up in precomputed tables instead of calling
+np.sin for every sample.
+
+WHAT THIS MODULE DOES:
+======================
+- One cycle of every waveform (sine, square, saw, noise) is stored in a
+  table of TABLE_SIZE samples. Playing a note just walks through the table
+  at the note's speed ("phase accumulation") and reads the values out.
+- The phase is a 32-bit whole number that counts 2**32 steps per cycle.
+  When it passes the end of the cycle it simply overflows back to the
+  start, so no division or remainder is needed; its top 12 bits are the
+  table entry.
+- Square, saw and noise are "band-limited": each table is built from
+  sine harmonics, and only harmonics below half the sample rate are used.
+  A naive square wave (np.sign(np.sin(...))) has harmonics far above
+  that, which fold back down as harsh, out-of-tune noise (aliasing).
+- High notes need fewer harmonics than low notes, so every waveform has
+  several tables ("mip levels") with fewer and fewer harmonics; each note
+  uses the richest table that is still safe at its pitch.
+- ADSR envelopes (attack, decay, sustain, release) shape each note's
+  volume: every note starts and ends at silence, so there are no clicks
+  at note boundaries.
+
+FOR NOVICE CODERS:
+==================
+    wave, phase = oscillator("square", 440, 4410)      # 0.1 s of A4
+    wave *= ADSR(attack=0.005, release=0.02).shape(4410)
+    more, phase = oscillator("square", 440, 4410, phase)  # carries on seamlessly
+    waves = oscillator_bank(["sine", "saw"], [440, 660], 4410)  # many at once
+
+Tables are built the first time a waveform is used, not on import.
+
+RESOURCE: This module provides band-limited wavetable oscillators and ADSR envelopes.
+"""
+
+import numpy as np
+from core import engine
+
+# Samples in one cycle of every table (2**TABLE_BITS)
+TABLE_BITS = 12
+TABLE_SIZE = 1 << TABLE_BITS
+
+# The phase accumulator is an unsigned 32-bit number: 2**32 = one full cycle
+PHASE_STEPS = 1 << 32
+
+# Harmonics in each mip level of square, saw and noise, richest first
+MIP_HARMONICS = (512, 256, 128, 64, 32, 16, 8, 4, 2, 1)
+
+# Waveforms oscillator() can play
+WAVEFORMS = ("sine", "square", "saw", "noise")
+
+# Default sample rate (the mixer's)
+SAMPLE_RATE = engine.MIXER_FORMAT[0]
+
+# Built tables: waveform -> (levels, TABLE_SIZE) array
+_tables = {}
+
+
+def harmonic_amplitudes(waveform, harmonics):
+    """
+    Sine amplitude of harmonics 1..harmonics of a waveform
+
+    The Lanczos sigma factor softens the highest harmonics, which keeps
+    the ripple at a square wave's edges (Gibbs effect) small.
+    """
+    k = np.arange(1, harmonics + 1, dtype=np.float64)
+    if waveform == "square":
+        amplitudes = np.where(k % 2 == 1, 4 / (np.pi * k), 0.0)
+    elif waveform == "saw":
+        amplitudes = 2 / (np.pi * k) * np.where(k % 2 == 1, 1.0, -1.0)
+    elif waveform == "noise":
+        # Flat spectrum with fixed random signs: the same noise every launch
+        amplitudes = np.random.default_rng(7).choice([-1.0, 1.0], harmonics) / np.sqrt(harmonics)
+    else:
+        amplitudes = np.zeros(harmonics)
+        amplitudes[0] = 1.0
+    return amplitudes * np.sinc(k / (harmonics + 1))
+
+
+def build_table(waveform, harmonics):
+    """One cycle made of the first `harmonics` harmonics, peak 1.0"""
+    spectrum = np.zeros(TABLE_SIZE // 2 + 1, dtype=np.complex128)
+    # A harmonic of amplitude a is a bin of -i * a * N/2 (inverse FFT of a sine)
+    spectrum[1:harmonics + 1] = -1j * harmonic_amplitudes(waveform, harmonics) * (TABLE_SIZE / 2)
+    table = np.fft.irfft(spectrum, n=TABLE_SIZE)
+    table /= np.abs(table).max()
+    return table.astype(np.float32)  # Plenty for 16-bit audio, and half the memory traffic
+
+
+def wavetable(waveform):
+    """Return every mip level of a waveform, building them the first time"""
+    tables = _tables.get(waveform)
+    if tables is None:
+        if waveform not in WAVEFORMS:
+            raise ValueError(f"Unknown waveform: {waveform}")
+        levels = (1,) if waveform == "sine" else MIP_HARMONICS
+        tables = _tables[waveform] = np.stack([build_table(waveform, h) for h in levels])
+    return tables
+
+
+def mip_level(waveform, frequency, sample_rate=SAMPLE_RATE):
+    """Index of the richest table whose harmonics all stay below half the sample rate"""
+    if waveform == "sine":
+        return 0
+    allowed = (sample_rate / 2) / max(frequency, 1e-9)
+    for level, harmonics in enumerate(MIP_HARMONICS):
+        if harmonics <= allowed:
+            return level
+    return len(MIP_HARMONICS) - 1  # Above Nyquist: the plain sine is the best there is
+
+
+def oscillator(waveform, frequency, samples, phase=0.0, sample_rate=SAMPLE_RATE):
+    """
+    Play a waveform at a steady frequency
+
+    Args:
+        waveform: "sine", "square", "saw" or "noise"
+        frequency: Pitch in Hz
+        samples: Number of samples to make
+        phase: Where in the cycle to start (0.0 to 1.0), e.g. the phase
+               returned by the previous call
+        sample_rate: Samples per second
+
+    Returns:
+        tuple: (float32 wave from -1.0 to 1.0, phase after the last sample)
+    """
+    table = wavetable(waveform)[mip_level(waveform, frequency, sample_rate)]
+    increment = round(frequency / sample_rate * PHASE_STEPS) % PHASE_STEPS
+    start = int(phase * PHASE_STEPS) % PHASE_STEPS
+    # The phase of every sample; uint32 arithmetic wraps around at the end of a cycle
+    accumulator = np.arange(samples, dtype=np.uint32)
+    accumulator *= np.uint32(increment)
+    accumulator += np.uint32(start)
+    accumulator >>= 32 - TABLE_BITS
+    return table[accumulator], (start + samples * increment) % PHASE_STEPS / PHASE_STEPS
+
+
+def oscillator_bank(waveforms, frequencies, samples, sample_rate=SAMPLE_RATE):
+    """
+    Play many waves at once in one vectorized pass, one wave per row
+
+    Args:
+        waveforms: Waveform of every row
+        frequencies: Pitch of every row in Hz
+        samples: Samples per row
+        sample_rate: Samples per second
+
+    Returns:
+        np.ndarray: (rows, samples) float32 waves, each starting at phase 0
+    """
+    tables = np.stack([wavetable(waveform)[mip_level(waveform, frequency, sample_rate)]
+                       for waveform, frequency in zip(waveforms, frequencies)])
+    increments = np.array([round(frequency / sample_rate * PHASE_STEPS) % PHASE_STEPS
+                           for frequency in frequencies], dtype=np.uint32)
+    accumulator = np.arange(samples, dtype=np.uint32)[None, :] * increments[:, None]
+    accumulator >>= 32 - TABLE_BITS
+    return np.take_along_axis(tables, accumulator, axis=1)
+
+
+class ADSR:
+    """
+    Attack-decay-sustain-release volume envelope
+
+    The note rises from silence to full volume (attack), falls to the
+    sustain level (decay), holds, and fades back to silence at its end
+    (release). Notes too short for the whole shape get shorter attack
+    and release so they still start and end at silence.
+
+    Attributes:
+        attack (float): Seconds from silence to full volume
+        decay (float): Seconds from full volume down to the sustain level
+        sustain (float): Volume held until the release (0.0 to 1.0)
+        release (float): Seconds from the sustain level back to silence
+    """
+
+    def __init__(self, attack=0.005, decay=0.05, sustain=0.8, release=0.02):
+        self.attack = attack
+        self.decay = decay
+        self.sustain = sustain
+        self.release = release
+
+    def shape(self, samples, sample_rate=SAMPLE_RATE):
+        """Return the envelope of a note `samples` long (float32, 0.0 to 1.0)"""
+        attack = min(int(self.attack * sample_rate), samples // 4)
+        release = min(int(self.release * sample_rate), samples // 4)
+        decay = max(int(self.decay * sample_rate), 1)
+        envelope = np.full(samples, self.sustain, dtype=np.float32)
+        # Decay from 1.0 towards the sustain level, starting after the attack
+        decay_end = min(attack + decay, samples)
+        envelope[attack:decay_end] = 1.0 - (1.0 - self.sustain) * (
+            np.arange(decay_end - attack, dtype=np.float32) / decay)
+        if attack:
+            envelope[:attack] = np.arange(attack, dtype=np.float32) / attack
+        if release:
+            envelope[samples - release:] *= np.arange(release - 1, -1, -1, dtype=np.float32) / release
+        return envelope
@@ -0,0 +1,173 @@
+"""
+DRAGON'S LAIR RPG - Sound Effect Bank Module
+============================================
+
+This module makes every sound effect of the game once, at startup, and
+plays them back on request.
+
+WHAT THIS MODULE DOES:
+======================
+- SFX_RECIPES describes each sound effect: waveform, pitch, length and
+  volume.
+- Every sound comes in SFX_VARIATIONS slightly different versions (a
+  little higher or lower, a little quieter), so pressing an arrow key ten
+  times doesn't play the exact same sample ten times.
+- All versions of all sounds are synthesized together in one vectorized
+  pass (oscillator_bank), shaped by a short ADSR envelope.
+- The finished bank is kept in the music cache folder, next to the
+  music, so later launches only have to load it.
+- play(name) picks one of the versions (never the same one twice in a
+  row) - nothing is synthesized while the game is running. Effects play
+  on any free channel except the music channels, which engine.init_audio()
+  reserves as it starts the mixer.
+
+FOR NOVICE CODERS:
+==================
+    sfx = SfxBank()        # build or load every sound effect
+    sfx.play("arrow")      # play one version of the arrow sound
+
+Adding a sound effect is one line in SFX_RECIPES.
+
+RESOURCE: This module provides the pre-rendered, varied sound effect bank.
+"""
+
+import random
+
+import numpy as np
+import pygame
+from config.constants import *
+from core import engine
+from audio.music_cache import MusicCache, track_key
+from audio.music_player import samples_to_sound
+from audio.oscillator import ADSR, SAMPLE_RATE, oscillator_bank
+
+# Part of the cache key: bump it whenever render_bank's output changes
+SFX_VERSION = 1
+
+# name: (waveform, frequency in Hz, length in ms, volume)
+SFX_RECIPES = {
+    "click": ("square", 800, 60, 0.5),
+    "attack": ("square", 200, 120, 0.5),
+    "magic": ("sine", 1200, 200, 0.5),
+    "item": ("sine", 1000, 80, 0.5),
+    "levelup": ("sine", 1500, 300, 0.5),
+    "gameover": ("sine", 100, 400, 0.5),
+    "victory": ("sine", 900, 500, 0.5),
+    "arrow": ("square", 600, 40, 0.4),
+    "enter": ("sine", 1200, 80, 0.5),
+}
+
+# Short attack and release so effects don't click
+SFX_ENVELOPE = ADSR(attack=0.002, decay=0.03, sustain=0.8, release=0.01)
+
+# Seed of the pitch/gain jitter (the same versions every launch)
+SFX_SEED = 1
+
+
+def variation_jitter(variations, pitch_jitter=SFX_PITCH_JITTER, gain_jitter=SFX_GAIN_JITTER):
+    """
+    Pitch and gain of every version of a sound
+
+    Version 0 is always the sound exactly as its recipe says.
+
+    Returns:
+        tuple: (pitch factors, gains), one per version
+    """
+    jitter = np.random.default_rng(SFX_SEED).uniform(-1.0, 1.0, (variations, 2))
+    jitter[0] = 0.0
+    pitches = 2.0 ** (jitter[:, 0] * pitch_jitter / 12)
+    gains = 1.0 - gain_jitter * np.abs(jitter[:, 1])
+    return pitches, gains
+
+
+def sound_samples(recipe):
+    """Length of a sound in samples"""
+    return int(SAMPLE_RATE * recipe[2] / 1000)
+
+
+def render_bank(recipes=SFX_RECIPES, variations=SFX_VARIATIONS):
+    """
+    Synthesize every version of every sound
+
+    Returns:
+        np.ndarray: (longest sound, sounds * variations) int16, one column
+        per version, in recipe order; shorter sounds are padded with silence
+    """
+    pitches, gains = variation_jitter(variations)
+    waveforms, frequencies = [], []
+    for waveform, frequency, _, _ in recipes.values():
+        waveforms += [waveform] * variations
+        frequencies += list(frequency * pitches)
+    longest = max(sound_samples(recipe) for recipe in recipes.values())
+    waves = oscillator_bank(waveforms, frequencies, longest)
+
+    # Envelope, volume and gain per row; everything after a sound's end is silence
+    scale = np.zeros((len(waveforms), longest), dtype=np.float32)
+    for i, recipe in enumerate(recipes.values()):
+        samples = sound_samples(recipe)
+        rows = slice(i * variations, (i + 1) * variations)
+        scale[rows, :samples] = SFX_ENVELOPE.shape(samples) * recipe[3] * 32767
+        scale[rows] *= gains[:, None].astype(np.float32)
+    waves *= scale
+    return waves.T.astype(np.int16, order="C")
+
+
+class SfxBank:
+    """
+    Every sound effect as a pool of ready-to-play variations
+
+    Attributes:
+        sounds (dict): Sound name -> list of pygame Sounds (its versions)
+        last (dict): Sound name -> index of the version played last
+        random (random.Random): Picks versions (separate from the game's
+                                rng, so sounds never change gameplay)
+    """
+
+    def __init__(self, recipes=SFX_RECIPES, variations=SFX_VARIATIONS, cache=None):
+        self.sounds = {}
+        self.last = {}
+        self.random = random.Random(SFX_SEED)
+        try:
+            engine.init_audio()
+            bank = self.load_bank(recipes, variations, cache or MusicCache.default())
+            for i, (name, recipe) in enumerate(recipes.items()):
+                samples = sound_samples(recipe)
+                self.sounds[name] = [
+                    samples_to_sound(np.repeat(bank[:samples, column, None], 2, axis=1))
+                    for column in range(i * variations, (i + 1) * variations)]
+        except (pygame.error, ValueError, OSError) as e:
+            print("[WARNING] Could not generate sound effects:", e)
+            self.sounds = {}
+
+    def load_bank(self, recipes, variations, cache):
+        """Return the rendered bank from the cache, rendering (and caching) it if needed"""
+        if cache is None:
+            return render_bank(recipes, variations)
+        key = track_key(SFX_VERSION, kind="sfx_bank", sample_rate=SAMPLE_RATE, recipes=recipes,
+                        variations=variations, pitch_jitter=SFX_PITCH_JITTER, gain_jitter=SFX_GAIN_JITTER)
+        bank = cache.load(key)
+        if bank is None:
+            bank = render_bank(recipes, variations)
+            cache.store(key, bank)
+        return bank
+
+    def pick(self, name):
+        """Index of the version to play next (never the one played last)"""
+        count = len(self.sounds[name])
+        last = self.last.get(name)
+        if last is None or count == 1:
+            index = self.random.randrange(count)
+        else:
+            index = (last + 1 + self.random.randrange(count - 1)) % count
+        self.last[name] = index
+        return index
+
+    def play(self, name):
+        """
+        Play one version of a sound effect (does nothing if sounds are unavailable)
+
+        Sound.play() only picks unreserved channels, so effects never cut
+        into the music decks or the stem mixer.
+        """
+        if name in self.sounds:
+            self.sounds[name][self.pick(name)].play()
@@ -0,0 +1,272 @@
+"""
+DRAGON'S LAIR RPG - Stem Mixer Module
+=====================================
+
+This module plays the adaptive versions of the overworld, town, battle
+and boss themes: every theme is split into its four voices ("stems") and
+a background thread mixes them together live, turning each voice up or
+down with what is happening in the game.
+
+WHAT THIS MODULE DOES:
+======================
+- A theme's stems are one int16 (frames, 4) array: melody, bass,
+  percussion and lead, exactly the voices of the chiptune synthesizer.
+  With every stem at full volume they add up to the normal track.
+- stem_gains() turns three gameplay signals into four stem volumes:
+  enemies close by bring in the drums, low HP and an evolved boss bring
+  in the lead, any danger fattens the bass. The melody always plays.
+- A mixer thread makes one small block (MUSIC_STEM_BLOCK_FRAMES, about
+  23 ms) at a time and queues it on its own reserved channel, so a change
+  in the game is heard within two blocks.
+- Volumes glide to their new values (no clicks), and changing theme
+  crossfades from the old stems to the new ones inside the same mix.
+- All four stems of a theme share one playhead, so they can never drift
+  apart.
+
+CPU BUDGET:
+===========
+Every block is timed. A block that takes longer than MUSIC_STEM_BUDGET_MS
+switches the mixer to a cheaper mode (one volume per stem for the whole
+block instead of a smooth glide); it switches back once blocks are
+comfortably inside the budget again. `overruns` counts the slow blocks.
+
+RESOURCE: This module provides the adaptive stem music mixer thread.
+"""
+
+import threading
+import time
+
+import numpy as np
+from config.constants import *
+from audio.music_player import TRACK_FORMAT, music_channel, samples_to_sound
+
+# The stems of a theme, in column order
+STEMS = ("melody", "bass", "percussion", "lead")
+
+# Channel the mixer queues its blocks on (0 and 1 belong to the MusicPlayer)
+STEM_CHANNEL = 2
+
+# Seconds a stem volume takes to glide all the way from 0 to 1
+GAIN_GLIDE_SECONDS = 0.5
+
+
+def stem_gains(proximity, health, boss_tier):
+    """
+    Turn gameplay signals into stem volumes
+
+    Args:
+        proximity: 0.0 (no enemy near) to 1.0 (enemy next to the player, or in battle)
+        health: Player HP as a fraction of max HP (1.0 = full)
+        boss_tier: 0.0 (no boss) to 1.0 (fully evolved boss)
+
+    Returns:
+        np.ndarray: float32 melody, bass, percussion and lead volumes
+        (all 1.0 = the track as composed)
+    """
+    proximity = min(max(proximity, 0.0), 1.0)
+    urgency = min(max(max(1.0 - health, boss_tier), 0.0), 1.0)
+    danger = max(proximity, urgency)
+    return np.array([1.0, 0.6 + 0.4 * danger, 0.3 + 0.7 * proximity, 0.4 + 0.6 * urgency],
+                    dtype=np.float32)
+
+
+class StemLayer:
+    """
+    One theme's stems being mixed
+
+    Attributes:
+        name (str): Track name
+        stems (np.ndarray): int16 (frames, 4) stems
+        limit (float): Loudest sample the theme may reach (its volume, like the synthesizer's clip)
+        position (int): Playhead shared by all four stems
+        gain (float): Fade volume of the whole theme
+        target (float): Fade target (1.0 = playing, 0.0 = fading out)
+    """
+
+    def __init__(self, name, stems, volume):
+        self.name = name
+        self.stems = stems
+        self.limit = volume * 32767
+        self.position = 0
+        self.gain = 0.0
+        self.target = 1.0
+
+
+class StemMixer:
+    """
+    Background thread that mixes theme stems into blocks with live volumes
+
+    Attributes:
+        block_frames (int): Sample frames per block
+        budget (float): Seconds of CPU time one block may take
+        volume (float): Channel volume of the mix
+        layers (list): StemLayers being mixed (more than one during a crossfade)
+        gains (np.ndarray): Current volume of each stem
+        targets (np.ndarray): Volumes the stems are gliding to (from stem_gains())
+        smooth (bool): Glide volumes sample by sample (False while over budget)
+        blocks (int): Blocks mixed so far
+        overruns (int): Blocks that took longer than the budget
+        lock (threading.Lock): Guards everything above between the game and the thread
+    """
+
+    def __init__(self, block_frames=MUSIC_STEM_BLOCK_FRAMES, budget_ms=MUSIC_STEM_BUDGET_MS,
+                 volume=MUSIC_VOLUME, crossfade_ms=MUSIC_CROSSFADE_MS):
+        self.block_frames = block_frames
+        self.budget = budget_ms / 1000
+        self.volume = volume
+        self.layers = []
+        self.gains = stem_gains(0.0, 1.0, 0.0)
+        self.targets = self.gains.copy()
+        self.smooth = True
+        self.blocks = 0
+        self.overruns = 0
+        self.lock = threading.Lock()
+        self.thread = None
+        self.running = False
+        self.channel = None
+
+        block_seconds = block_frames / TRACK_FORMAT[0]
+        self.gain_step = block_seconds / GAIN_GLIDE_SECONDS
+        self.fade_step = block_seconds / max(crossfade_ms / 1000, block_seconds)
+
+        # Work buffers, made once so mixing a block allocates nothing
+        self.ramp = np.arange(1, block_frames + 1, dtype=np.float32) / block_frames
+        self.previous = np.empty(len(STEMS), dtype=np.float32)
+        self.delta = np.empty(len(STEMS), dtype=np.float32)
+        self.gain_matrix = np.empty((block_frames, len(STEMS)), dtype=np.float32)
+        self.block = np.empty((block_frames, len(STEMS)), dtype=np.float32)
+        self.layer_mix = np.empty(block_frames, dtype=np.float32)
+        self.layer_fade = np.empty(block_frames, dtype=np.float32)
+        self.mix = np.empty(block_frames, dtype=np.float32)
+        self.pcm = np.empty((block_frames, 2), dtype=np.int16)
+
+    def set_signals(self, proximity, health, boss_tier):
+        """Set the gameplay signals the stem volumes follow (see stem_gains())"""
+        targets = stem_gains(proximity, health, boss_tier)
+        with self.lock:
+            self.targets[:] = targets
+
+    def play(self, name, stems, volume):
+        """
+        Crossfade to a theme's stems (playing the current theme again does nothing)
+
+        Args:
+            name: Track name
+            stems: int16 (frames, 4) stems
+            volume: The theme's volume (how loud its mix may get)
+        """
+        with self.lock:
+            if self.layers and self.layers[-1].name == name and self.layers[-1].target > 0:
+                return
+            for layer in self.layers:
+                layer.target = 0.0
+            self.layers.append(StemLayer(name, stems, volume))
+        self.start()
+
+    def stop(self):
+        """Fade every theme out (the thread idles once they are silent)"""
+        with self.lock:
+            for layer in self.layers:
+                layer.target = 0.0
+
+    def is_playing(self):
+        """True while a theme is playing or fading in"""
+        with self.lock:
+            return any(layer.target > 0 for layer in self.layers)
+
+    def read(self, layer):
+        """Copy the layer's next block of stems into self.block and move its playhead"""
+        frames = len(layer.stems)
+        done = 0
+        while done < self.block_frames:
+            take = min(self.block_frames - done, frames - layer.position)
+            self.block[done:done + take] = layer.stems[layer.position:layer.position + take]
+            done += take
+            layer.position = (layer.position + take) % frames
+
+    def mix_block(self):
+        """
+        Mix the next block of every layer
+
+        Returns:
+            np.ndarray: int16 (block_frames, 2) samples (reused by the next call)
+        """
+        start = time.perf_counter()
+        with self.lock:
+            # Stem volumes glide towards their targets, a limited step per block
+            self.previous[:] = self.gains
+            np.subtract(self.targets, self.gains, out=self.delta)
+            np.clip(self.delta, -self.gain_step, self.gain_step, out=self.delta)
+            self.gains += self.delta
+            if self.smooth:
+                np.multiply(self.ramp[:, None], self.delta, out=self.gain_matrix)
+                self.gain_matrix += self.previous
+            else:
+                self.gain_matrix[:] = self.gains
+
+            self.mix.fill(0.0)
+            for layer in self.layers:
+                self.read(layer)
+                self.block *= self.gain_matrix
+                self.block.sum(axis=1, out=self.layer_mix)
+                np.clip(self.layer_mix, -layer.limit, layer.limit, out=self.layer_mix)
+                # The whole theme fades in or out, also a limited step per block
+                previous_gain = layer.gain
+                step = min(self.fade_step, abs(layer.target - layer.gain))
+                layer.gain += step if layer.target > layer.gain else -step
+                if layer.gain == previous_gain:
+                    self.layer_mix *= layer.gain
+                else:
+                    np.multiply(self.ramp, layer.gain - previous_gain, out=self.layer_fade)
+                    self.layer_fade += previous_gain
+                    self.layer_mix *= self.layer_fade
+                self.mix += self.layer_mix
+            self.layers = [layer for layer in self.layers if layer.target > 0 or layer.gain > 0]
+
+            np.clip(self.mix, -32768, 32767, out=self.mix)
+            self.pcm[:, 0] = self.mix
+            self.pcm[:, 1] = self.mix
+
+        elapsed = time.perf_counter() - start
+        self.blocks += 1
+        if elapsed > self.budget:
+            self.overruns += 1
+            self.smooth = False
+        elif elapsed < self.budget / 2:
+            self.smooth = True
+        return self.pcm
+
+    def start(self):
+        """Start the mixer thread (only the first time)"""
+        if self.running:
+            return
+        self.channel = music_channel(STEM_CHANNEL)
+        self.channel.set_volume(self.volume)
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="stem-mixer", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """Mixer thread: keep one block playing and the next one queued behind it"""
+        wait = self.block_frames / TRACK_FORMAT[0] / 4
+        try:
+            while self.running:
+                if self.channel.get_queue() is not None or not self.layers:
+                    time.sleep(wait)
+                    continue
+                # Queuing on an idle channel starts the sound right away
+                self.channel.queue(samples_to_sound(self.mix_block()))
+        except Exception as e:
+            print(f"Stem mixer stopped: {e}")
+            self.running = False
+
+    def close(self):
+        """Stop the thread and silence the channel"""
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+        if self.channel is not None:
+            self.channel.stop()
+        with self.lock:
+            self.layers = []
@@ -0,0 +1,27 @@
+"""
+DRAGON'S LAIR RPG - Benchmark Suite
+===================================
+
+Headless timing benchmarks for drawing, simulation and audio.
+
+Run every scenario with one command:
+
+    python -m benchmarks
+
+Useful options:
+    --only town_draw particle_storm   run some scenarios only
+    --json results.json               save the results as JSON
+    --save-baseline                   store the results as the new baseline
+    --threshold 0.15                  how much slower (15%) counts as a regression
+
+Each scenario reports the mean, median and p95 time per iteration, plus
+how much Python memory one iteration allocates. If a baseline file exists,
+every scenario's median is compared against it and the run fails (exit
+code 1) when something got slower than the threshold allows.
+
+Baselines only make sense on the machine they were recorded on, so the
+baseline file is not part of the repository - record one before you
+start optimizing, then compare after each change.
+
+RESOURCE: This package provides the headless benchmark scenarios and runner.
+"""
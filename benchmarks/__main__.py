@@ -0,0 +1,77 @@
+"""
+Run the benchmark suite: python -m benchmarks [--only NAME ...] [--json FILE]
+                                              [--baseline FILE] [--save-baseline]
+                                              [--threshold 0.15] [--quick]
+"""
+
+import argparse
+import os
+import sys
+
+# Benchmarks never open a window or play sound. SDL's dummy drivers must be
+# picked BEFORE core.engine starts the window and mixer.
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from benchmarks.harness import run_scenario, compare, load_baseline, save_results
+from benchmarks.scenarios import SCENARIOS
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def parse_args(argv=None):
+    """Read the command line options"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Dragon's Lair RPG benchmarks")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="run only these scenarios")
+    parser.add_argument("--json", metavar="FILE", help="write the results to a JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline file to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="slowdown that counts as a regression (default 0.15 = 15%%)")
+    parser.add_argument("--quick", action="store_true", help="run 10%% of the iterations (smoke test)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the scenarios, print a table and compare with the baseline"""
+    args = parse_args(argv)
+    scenarios = [s for s in SCENARIOS if not args.only or s.name in args.only]
+    unknown = set(args.only or []) - {s.name for s in scenarios}
+    if unknown:
+        print(f"Unknown scenario(s): {', '.join(sorted(unknown))}")
+        print(f"Available: {', '.join(s.name for s in SCENARIOS)}")
+        return 2
+
+    baseline = load_baseline(args.baseline)
+    results = {}
+    print(f"{'scenario':<28}{'mean ms':>10}{'median':>10}{'p95 ms':>10}{'alloc KB':>10}{'blocks':>8}  vs baseline")
+    for scenario in scenarios:
+        result = run_scenario(scenario, scale=0.1 if args.quick else 1.0)
+        results[scenario.name] = result
+        verdict = compare({scenario.name: result}, baseline, args.threshold).get(scenario.name)
+        note = "" if verdict is None else f"{verdict[0]:6.2f}x" + ("  ❌ REGRESSION" if verdict[1] else "")
+        print(f"{scenario.name:<28}{result['mean_ms']:>10.3f}{result['median_ms']:>10.3f}{result['p95_ms']:>10.3f}"
+              f"{result['alloc_peak_kb']:>10.1f}{result['blocks_per_iter']:>8.1f}  {note}")
+
+    if args.json:
+        save_results(args.json, results)
+        print(f"💾 Results written to {args.json}")
+    if args.save_baseline:
+        save_results(args.baseline, {**baseline, **results})
+        print(f"📌 Baseline saved to {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"(no baseline at {args.baseline} - run with --save-baseline to create one)")
+        return 0
+    regressions = [name for name, (_, regressed) in compare(results, baseline, args.threshold).items()
+                   if regressed]
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print("✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
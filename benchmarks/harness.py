@@ -0,0 +1,151 @@
+"""
+DRAGON'S LAIR RPG - Benchmark Harness
+=====================================
+
+Times scenarios, measures their memory allocations and compares the
+results with a baseline.
+
+WHAT A SCENARIO IS:
+===================
+A Scenario has a name and a setup() function. setup() builds everything
+the scenario needs (untimed) and returns the function to time. That
+function is called `warmup` times first (to fill caches), then
+`iterations` times with a timer around each call.
+
+Allocations are measured in a second, separate pass with tracemalloc
+turned on (tracemalloc makes code slower, so it never runs while timing):
+- alloc_peak_kb: the most extra Python memory one iteration needed
+- blocks_per_iter: Python memory blocks still alive after each iteration
+  (should be 0 in a steady state - anything else is a cache or a leak)
+
+Memory allocated inside SDL (surface pixels) isn't visible to tracemalloc.
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+
+class Scenario:
+    """
+    One benchmark scenario
+
+    Attributes:
+        name (str): Scenario name (used in JSON and baselines)
+        setup (callable): setup() -> function to time
+        iterations (int): Timed calls
+        warmup (int): Untimed calls before timing
+        description (str): One line shown in the report
+    """
+
+    def __init__(self, name, setup, iterations=200, warmup=10, description=""):
+        self.name = name
+        self.setup = setup
+        self.iterations = iterations
+        self.warmup = warmup
+        self.description = description
+
+
+def measure_allocations(func, iterations):
+    """Return (peak KB per iteration, live blocks left per iteration)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        blocks_before = sys.getallocatedblocks()
+        peak = 0
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            start_size, _ = tracemalloc.get_traced_memory()
+            func()
+            _, peak_size = tracemalloc.get_traced_memory()
+            peak = max(peak, peak_size - start_size)
+        gc.collect()
+        blocks = (sys.getallocatedblocks() - blocks_before) / iterations
+    finally:
+        tracemalloc.stop()
+    return peak / 1024, blocks
+
+
+def run_scenario(scenario, scale=1.0):
+    """
+    Time one scenario
+
+    Args:
+        scenario (Scenario): What to run
+        scale (float): Multiplies the iteration counts (0.1 for a quick run)
+
+    Returns:
+        dict: mean_ms, median_ms, p95_ms, min_ms, iterations, alloc_peak_kb, blocks_per_iter
+    """
+    func = scenario.setup()
+    iterations = max(3, int(scenario.iterations * scale))
+    for _ in range(max(1, int(scenario.warmup * scale))):
+        func()
+
+    gc.collect()
+    times = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter()
+        func()
+        times[i] = time.perf_counter() - start
+    times *= 1000
+
+    alloc_peak_kb, blocks = measure_allocations(func, max(3, min(iterations, 50)))
+    return {
+        "mean_ms": float(times.mean()),
+        "median_ms": float(np.median(times)),
+        "p95_ms": float(np.percentile(times, 95)),
+        "min_ms": float(times.min()),
+        "iterations": iterations,
+        "alloc_peak_kb": round(alloc_peak_kb, 2),
+        "blocks_per_iter": round(blocks, 2),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a baseline
+
+    Median times are compared: unlike the mean, one hiccup (a garbage
+    collection, another program waking up) can't flag a regression.
+
+    Args:
+        results (dict): name -> result from run_scenario
+        baseline (dict): name -> result from an earlier run
+        threshold (float): Allowed slowdown (0.15 = 15% slower than the baseline)
+
+    Returns:
+        dict: name -> (ratio of median times, True if it is a regression)
+    """
+    verdicts = {}
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous or not previous.get("median_ms"):
+            continue
+        ratio = result["median_ms"] / previous["median_ms"]
+        verdicts[name] = (ratio, ratio > 1 + threshold)
+    return verdicts
+
+
+def load_baseline(path):
+    """Read a baseline file (an empty dict if there is none)"""
+    try:
+        with open(path) as baseline_file:
+            return json.load(baseline_file)["scenarios"]
+    except FileNotFoundError:
+        return {}
+
+
+def save_results(path, results):
+    """Write results as JSON (the same format is used for baselines)"""
+    with open(path, "w") as results_file:
+        json.dump({
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "scenarios": results,
+        }, results_file, indent=2)
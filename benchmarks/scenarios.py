@@ -0,0 +1,225 @@
+"""
+DRAGON'S LAIR RPG - Benchmark Scenarios
+=======================================
+
+The scenarios timed by `python -m benchmarks`. Every setup function builds
+its scene from a fixed seed, so two runs time exactly the same work.
+
+Scenarios:
+- town_draw: one overworld frame drawn in the town
+- overworld_draw: one overworld frame with 3 enemies and 2 items
+- boss_battle_draw: one battle frame against a DragonBoss (with its aura)
+- particle_storm: update + draw of 5,000 live particles
+- music_track_synthesis: synthesizing the overworld track
+- music_state_switch: switching between the overworld and battle themes
+- stem_mix_block: one adaptive music block while battle crossfades into boss
+- game_cold_construction: Game() from scratch (music, world, UI)
+- battle_screen_construction: how long starting a battle takes
+- horde_tick: moving 5,000 horde enemies one tick, plus the player's collision and music checks
+- horde_draw: one overworld frame in a horde area of 5,000 enemies
+- idle_enemy_timers: one area tick with 3,000 enemies waiting on their movement timers
+- enemy_pursuit: one town tick with 3,000 enemies chasing a player who changes square every tick
+"""
+
+import numpy as np
+from config.constants import *
+from core import engine
+from core.game import Game
+from entities.player_characters.character import Character
+from entities.enemy import Enemy
+from world.world_area import WorldArea
+from entities.boss_dragons import DragonBoss
+from audio.music_system import MusicSystem
+from audio.stem_mixer import StemMixer, StemLayer
+from systems.particle_system import ParticleSystem
+from systems.rng import rng
+from ui.battle_screen import BattleScreen
+from benchmarks.harness import Scenario
+
+# Every scene is built from this seed
+BENCHMARK_SEED = 1234
+
+# Grid position of the town on the world map
+TOWN_AREA = (1, 2)
+
+
+def make_overworld_game(area=None, horde=False):
+    """Return a Game in the overworld with a Warrior (in `area` if given)"""
+    rng.reseed(BENCHMARK_SEED)
+    game = Game(dirty_rects=False, horde=horde)
+    game.player = Character("Warrior")
+    game.start_game()
+    game.state = "overworld"
+    if area:
+        game.player.x = area[0] * AREA_WIDTH + AREA_WIDTH // 2
+        game.player.y = area[1] * AREA_HEIGHT + 260
+        game.world_map.check_area_transition(game.player.x, game.player.y)
+    game.world_map.update_camera(game.player.x, game.player.y)
+    return game
+
+
+def setup_town_draw():
+    game = make_overworld_game(TOWN_AREA)
+    return lambda: game.draw(engine.screen)
+
+
+def setup_overworld_draw():
+    game = make_overworld_game()
+    assert len(game.enemies) == 3 and len(game.items) == 2, "start area should have 3 enemies, 2 items"
+    return lambda: game.draw(engine.screen)
+
+
+def setup_boss_battle_draw():
+    screen = engine.init()
+    rng.reseed(BENCHMARK_SEED)
+    battle = BattleScreen(Character("Warrior"), DragonBoss(3))
+    return lambda: battle.draw(screen)
+
+
+def setup_particle_storm(count=5000):
+    screen = engine.init()
+    rng.reseed(BENCHMARK_SEED)
+    particles = ParticleSystem(capacity=count)
+    generator = np.random.default_rng(BENCHMARK_SEED)
+    colors = [FIRE_COLORS[0], MAGIC_COLORS[0], HEALTH_COLOR, MANA_COLOR]
+    per_color = count // len(colors)
+    for i, color in enumerate(colors):
+        particles.emit(generator.uniform(0, SCREEN_WIDTH, per_color),
+                       generator.uniform(0, SCREEN_HEIGHT, per_color),
+                       generator.uniform(-0.3, 0.3, per_color),
+                       generator.uniform(-0.3, 0.3, per_color),
+                       generator.uniform(2, 6, per_color),
+                       np.full(per_color, 10 ** 6),  # Nobody dies during the benchmark
+                       color, additive=(i % 2 == 1))
+
+    def frame():
+        particles.update()
+        particles.draw(screen)
+    return frame
+
+
+def setup_music_track_synthesis():
+    music = MusicSystem.__new__(MusicSystem)  # Skip building every track up front
+    return lambda: music.generate_track("overworld")
+
+
+def setup_music_state_switch():
+    music = MusicSystem(0, adaptive=False)  # Whole tracks on the MusicPlayer
+    states = iter(["overworld", "battle"] * 10 ** 6)
+
+    def switch():
+        music.update(next(states))
+    return switch
+
+
+def setup_stem_mix_block():
+    music = MusicSystem.__new__(MusicSystem)  # Stems only, no tracks or thread
+    mixer = StemMixer(crossfade_ms=10 ** 9)   # A crossfade that never ends: two layers every block
+    for name in ("battle", "boss"):
+        mixer.layers.append(StemLayer(name, music.track_stems(name), music.track_recipe(name)["volume"]))
+    mixer.layers[0].gain = 1.0
+    mixer.layers[0].target = 0.0
+    signals = iter([(1.0, 0.5, 0.3), (1.0, 0.2, 0.8)] * 10 ** 6)
+
+    def block():
+        mixer.set_signals(*next(signals))
+        mixer.mix_block()
+    return block
+
+
+def setup_game_cold_construction():
+    return lambda: Game(dirty_rects=False)
+
+
+def setup_battle_screen_construction():
+    rng.reseed(BENCHMARK_SEED)
+    player = Character("Mage")
+    enemy = Enemy(1)
+    return lambda: BattleScreen(player, enemy)
+
+
+def make_horde_game():
+    """Return an overworld Game whose starting area holds a full horde"""
+    game = make_overworld_game(horde=True)
+    area = game.world_map.get_current_area()
+    while area.entities.count("enemy", area.key) < HORDE_ENEMIES:
+        game.spawn_enemy()
+    return game, area
+
+
+def setup_horde_tick():
+    game, area = make_horde_game()
+    player = game.player
+
+    def tick():
+        area.tick(player.x, player.y)
+        area.enemy_at(player.x, player.y, PLAYER_SIZE, PLAYER_SIZE)
+        area.nearest_enemy(player.x, player.y, max_radius=MUSIC_DANGER_RADIUS)
+    return tick
+
+
+def setup_horde_draw():
+    game, _ = make_horde_game()
+    return lambda: game.draw(engine.screen)
+
+
+def setup_idle_enemy_timers(count=3000):
+    rng.reseed(BENCHMARK_SEED)
+    area = WorldArea(0, 0, "plains")
+    for i in range(count):
+        enemy = Enemy(1)
+        enemy.x, enemy.y = (i * GRID_SIZE) % AREA_WIDTH, (i // 20) * GRID_SIZE % AREA_HEIGHT
+        enemy.movement_cooldown = i % enemy.movement_delay  # Spread out: about 50 steps per tick
+        area.add_enemy(enemy)
+    return area.tick
+
+
+def setup_enemy_pursuit(count=3000):
+    rng.reseed(BENCHMARK_SEED)
+    area = WorldArea(1, 1, "town")
+    world_x, world_y = area.get_world_position()
+    for i in range(count):
+        enemy = Enemy(1)
+        enemy.x = world_x + (i * GRID_SIZE) % AREA_WIDTH
+        enemy.y = world_y + (i // 20) * GRID_SIZE % AREA_HEIGHT
+        enemy.movement_cooldown = i % enemy.movement_delay
+        area.add_enemy(enemy)
+    # The player paces along the bottom row, so the flow field is searched again every tick
+    path = [(world_x + col * GRID_SIZE, world_y + AREA_HEIGHT - GRID_SIZE) for col in range(AREA_WIDTH // GRID_SIZE)]
+    path += path[-2:0:-1]
+    ticks = iter(range(10 ** 9))
+
+    def tick():
+        player_x, player_y = path[next(ticks) % len(path)]
+        area.tick(player_x, player_y)
+    return tick
+
+
+SCENARIOS = [
+    Scenario("town_draw", setup_town_draw, iterations=300,
+             description="Town frame (buildings, guard, HUD)"),
+    Scenario("overworld_draw", setup_overworld_draw, iterations=300,
+             description="Overworld frame with 3 enemies and 2 items"),
+    Scenario("boss_battle_draw", setup_boss_battle_draw, iterations=300,
+             description="Battle frame against a DragonBoss with aura"),
+    Scenario("particle_storm", setup_particle_storm, iterations=200,
+             description="5,000 particles: update + draw"),
+    Scenario("music_track_synthesis", setup_music_track_synthesis, iterations=20, warmup=2,
+             description="Overworld chiptune track samples"),
+    Scenario("music_state_switch", setup_music_state_switch, iterations=200,
+             description="Crossfade between overworld and battle themes"),
+    Scenario("stem_mix_block", setup_stem_mix_block, iterations=500,
+             description="Adaptive music block, two themes crossfading"),
+    Scenario("game_cold_construction", setup_game_cold_construction, iterations=5, warmup=1,
+             description="Game() construction (all music, world, UI)"),
+    Scenario("battle_screen_construction", setup_battle_screen_construction, iterations=300,
+             description="BattleScreen() construction latency"),
+    Scenario("horde_tick", setup_horde_tick, iterations=600,
+             description="5,000 horde enemies: move, collide, nearest"),
+    Scenario("horde_draw", setup_horde_draw, iterations=300,
+             description="Overworld frame in a 5,000-enemy horde area"),
+    Scenario("idle_enemy_timers", setup_idle_enemy_timers, iterations=600,
+             description="3,000 enemies on movement timers: one area tick"),
+    Scenario("enemy_pursuit", setup_enemy_pursuit, iterations=600,
+             description="3,000 enemies chasing the player: flow field + steps"),
+]
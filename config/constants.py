@@ -37,7 +37,6 @@ This game uses a retro 80s color scheme:
 """
 
 import os
-os.environ['SDL_AUDIODRIVER'] = 'directsound'  # or 'winmm' or 'waveout'
 import pygame
 import sys
 import random
@@ -47,12 +46,10 @@ import numpy as np
 import tempfile
 import wave
 import io
+from core import engine
 
-# Initialize Pygame
-pygame.init()
-pygame.font.init()
-pygame.mixer.init()
-pygame.mixer.music.set_volume(1.0)
+# Importing this module doesn't start pygame: the window, fonts and mixer
+# are created on demand by core.engine (call engine.init() to start them all)
 
 # ============================================================================
 # GAME CONSTANTS AND CONFIGURATION
@@ -66,6 +63,38 @@ PLAYER_SIZE = 50                          # How big the player character is
 ENEMY_SIZE = 40                           # How big enemies are
 ITEM_SIZE = 30                            # How big collectible items are
 FPS = 60                                 # Frames per second (game speed)
+DIRTY_RECT_RENDERING = False              # Only push changed screen regions (always on for Android)
+BAKE_SPRITES = True                       # Cache procedurally drawn sprites as images (False = debug drawing)
+MAX_PARTICLES = 4096                      # Hard cap per particle system (oldest particles are dropped first)
+SIM_TICK_RATE = FPS                       # Fixed simulation steps per second (game logic speed)
+RENDER_FPS = FPS                          # Frame rate cap for drawing (0 = uncapped)
+MAX_CATCHUP_STEPS = 5                     # Most simulation steps run in one frame when behind
+MAX_FRAME_SKIP = 3                        # Most frames in a row that may skip drawing when behind
+INTERPOLATE_RENDERING = False             # Smooth movement between simulation steps when drawing
+PROFILER_ENABLED = False                  # Record per-span frame timings from the start (F3 toggles the overlay)
+PROFILE_DUMP_DIR = "profiles"             # Where the profiler saves its CSV/JSON dump on exit
+MUSIC_CACHE_ENABLED = True                # Keep synthesized music on disk between launches
+MUSIC_CACHE_DIR = None                    # Music cache folder (None = the user's cache folder)
+MUSIC_CACHE_MAX_MB = 64                   # Oldest cached tracks are deleted above this size
+MUSIC_WORKERS = 2                         # Processes synthesizing uncached music in the background (0 = at startup)
+MUSIC_VOLUME = 0.5                        # Music volume (0.0 to 1.0)
+MUSIC_CROSSFADE_MS = 800                  # How long one theme fades into the next
+MUSIC_STREAM_CHUNK_SECONDS = 2.0          # Long tracks are handed to the mixer this many seconds at a time
+MUSIC_ADAPTIVE = True                     # Overworld, town, battle and boss themes follow the action (stem mixer)
+MUSIC_STEM_BLOCK_FRAMES = 1024            # Samples the stem mixer makes at a time (~23 ms)
+MUSIC_STEM_BUDGET_MS = 2.0                # CPU time one stem block may take before the mixer simplifies
+MUSIC_DANGER_RADIUS = 300                 # Enemies closer than this (pixels) bring in the battle drums
+SFX_VARIATIONS = 4                        # Pre-rendered versions of every sound effect (repeats don't sound robotic)
+SFX_PITCH_JITTER = 0.5                    # Sound effect versions differ in pitch by up to this many semitones
+SFX_GAIN_JITTER = 0.15                    # ... and are up to this much quieter (0.15 = 15%)
+ENEMY_SPAWN_TICKS = 300                   # Overworld ticks between enemy spawns (original pycore whole value)
+ITEM_SPAWN_TICKS = 600                    # Overworld ticks between item spawns
+HORDE_MODE = False                        # Fill every non-town area with a vectorized horde of enemies (--horde)
+HORDE_ENEMIES = 5000                      # Enemies in each horde area
+HORDE_SPAWN_BATCH = 500                   # Horde enemies spawned per tick until an area is full
+HORDE_SAFE_RADIUS = 300                   # Horde enemies never spawn closer than this (pixels) to the player
+HORDE_BATTLE_GRACE_TICKS = 180            # Overworld ticks after a horde battle before the next one can start
+ENEMY_PURSUIT = True                      # Overworld enemies chase the player (flow field) instead of wandering
 
 # Visual Design - Retro 80s Color Palette
 # =======================================
@@ -131,34 +160,20 @@ DRAGON_BOSS_COLORS = [
 ]
 
 # ============================================================================
-# PYGAME INITIALIZATION AND SETUP
+# FONTS
 # ============================================================================
 
-# Create the main game window
-# ===========================
-# This creates the actual window that the game runs in
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Dragon's Lair RPG")  # Window title
-clock = pygame.time.Clock()  # Controls game speed (FPS)
-
 # Font System Setup
 # =================
-# Try to load custom fonts, fall back to system fonts if not available
-# Fonts are like "fonts" in a word processor - they control how text looks
-try:
-    font_large = pygame.font.Font("freesansbold.ttf", 48)      # Main titles (big text)
-    font_medium = pygame.font.Font("freesansbold.ttf", 32)     # UI headers (medium text)
-    font_small = pygame.font.Font("freesansbold.ttf", 24)      # Regular text (normal size)
-    font_tiny = pygame.font.Font("freesansbold.ttf", 18)       # Small labels (tiny text)
-    font_cinematic = pygame.font.Font("freesansbold.ttf", 28)  # Cutscene text (special)
-except:
-    # Fallback to system fonts if custom fonts not found
-    # This ensures the game works even if the font files are missing
-    font_large = pygame.font.SysFont("Courier", 48, bold=True)
-    font_medium = pygame.font.SysFont("Courier", 32, bold=True)
-    font_small = pygame.font.SysFont("Courier", 24, bold=True)
-    font_tiny = pygame.font.SysFont("Courier", 18, bold=True)
-    font_cinematic = pygame.font.SysFont("Courier", 28, bold=True)
+# Fonts are like "fonts" in a word processor - they control how text looks.
+# Each font is loaded the first time it draws text (freesansbold, or a bold
+# system Courier if that can't be found) - see engine.LazyFont.
+# The window and clock live in core.engine (engine.screen, engine.clock).
+font_large = engine.LazyFont(48, "font_large")          # Main titles (big text)
+font_medium = engine.LazyFont(32, "font_medium")        # UI headers (medium text)
+font_small = engine.LazyFont(24, "font_small")          # Regular text (normal size)
+font_tiny = engine.LazyFont(18, "font_tiny")            # Small labels (tiny text)
+font_cinematic = engine.LazyFont(28, "font_cinematic")  # Cutscene text (special)
 
 # ============================================================================
 # WORLD AND GRID SYSTEM CONFIGURATION
@@ -0,0 +1,238 @@
+"""
+DRAGON'S LAIR RPG - Engine Startup Module
+=========================================
+
+This module owns the game's runtime resources: the window, the clock,
+the fonts and the sound mixer. Nothing is created when the module is
+imported - every resource is started the first time something needs it.
+
+WHAT THIS MODULE DOES:
+======================
+- init_display(): opens the window and creates the clock
+- init_fonts(): starts pygame's font module
+- init_audio(): starts the sound mixer with a driver that suits the platform
+  (and keeps the music channels away from sound effects)
+- init(): all of the above, returns the window surface
+- LazyFont: a stand-in for a pygame Font that loads the real font on first use
+
+FOR NOVICE CODERS:
+==================
+Importing config.constants used to open a window and start the sound
+card. That made every import slow and meant tests and tools that never
+draw anything still needed a screen. Now constants are just numbers and
+colors, and the expensive things happen here, on demand:
+
+    from core import engine
+    screen = engine.init()        # window + fonts + mixer (safe to call twice)
+    font_small.render(...)        # the font file is loaded right here
+
+The init functions do nothing if their resource is already running, so
+any code can call them "just in case".
+
+STARTUP REPORT:
+===============
+Every init stage records how long it took in `timings`.
+`python -m main --startup-report` adds the import time of the game's
+modules and prints the whole table (see print_startup_report()).
+For a full per-module import tree use `python -X importtime -m main`.
+
+RESOURCE: This module provides lazy window, font and mixer initialization.
+"""
+
+import importlib
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+import pygame
+
+# The window surface and FPS clock (None until init_display() runs)
+screen = None
+clock = None
+
+# [label, seconds, depth] for every import and init stage that has been timed;
+# depth counts the timed stages it happened inside of
+timings = []
+_depth = 0
+
+# Stages that have already run ("display", "fonts", "audio")
+_started = set()
+
+# Mixer format: 44.1 kHz, signed 16-bit, stereo - what the music is made in
+MIXER_FORMAT = (44100, -16, 2)
+
+# Channels 0-2 are kept for music (the music player's two decks and the
+# stem mixer), so sound effects never take them
+MUSIC_CHANNELS = 3
+
+
+@contextmanager
+def timed(label):
+    """Record how long the code inside the with-block takes under `label`"""
+    global _depth
+    entry = [label, 0.0, _depth]
+    timings.append(entry)  # Added first, so stages stay in the order they started
+    _depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry[1] = time.perf_counter() - start
+        _depth -= 1
+
+
+def time_import(module_name):
+    """
+    Import a module and record how long it took
+
+    Modules that the module imports are counted too, unless something
+    imported them earlier (then they are already loaded and free).
+    """
+    with timed(f"import {module_name}"):
+        return importlib.import_module(module_name)
+
+
+def audio_driver():
+    """
+    Pick the SDL audio driver for this platform
+
+    Returns:
+        str or None: Driver name, or None to let SDL choose
+    """
+    if sys.platform.startswith("win"):
+        return "directsound"  # Lowest latency on Windows ('winmm' also works)
+    # macOS (coreaudio), Linux (pulseaudio/pipewire/alsa) and Android
+    # all work best with SDL's own choice
+    return None
+
+
+def init_display():
+    """Open the game window and create the clock (only the first time)"""
+    global screen, clock
+    if "display" in _started:
+        return screen
+    from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+    with timed("init display"):
+        pygame.display.init()
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Dragon's Lair RPG")  # Window title
+        clock = pygame.time.Clock()  # Controls game speed (FPS)
+    _started.add("display")
+    return screen
+
+
+def init_fonts():
+    """Start pygame's font module (only the first time)"""
+    if "fonts" in _started:
+        return
+    with timed("init fonts"):
+        pygame.font.init()
+    _started.add("fonts")
+
+
+def init_audio():
+    """
+    Start the sound mixer (only the first time)
+
+    The first MUSIC_CHANNELS channels are reserved as soon as the mixer
+    starts, so no Sound.play() - whichever part of the game plays first -
+    can take a channel the music needs.
+
+    An SDL_AUDIODRIVER environment variable always wins (headless runs set
+    'dummy'). If no sound device can be opened, the game carries on silent
+    with the dummy driver instead of crashing.
+    """
+    if "audio" in _started:
+        return
+    driver = audio_driver()
+    if driver:
+        os.environ.setdefault("SDL_AUDIODRIVER", driver)
+    frequency, size, channels = MIXER_FORMAT
+    with timed("init audio"):
+        try:
+            # allowedchanges=0: SDL converts for the device, so the music's
+            # samples can be handed over as they are
+            pygame.mixer.init(frequency, size, channels, allowedchanges=0)
+        except pygame.error as error:
+            print(f"[WARNING] No sound device ({error}) - running without sound")
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+            pygame.mixer.init(frequency, size, channels, allowedchanges=0)
+        pygame.mixer.set_reserved(MUSIC_CHANNELS)
+    _started.add("audio")
+
+
+def init():
+    """
+    Start everything the game needs to run: window, fonts and mixer
+
+    Returns:
+        pygame.Surface: The window surface
+    """
+    init_display()
+    init_fonts()
+    init_audio()
+    return screen
+
+
+def load_font(size):
+    """
+    Load the game font at a size
+
+    Uses pygame's built-in freesansbold font, and falls back to a bold
+    system Courier if it can't be loaded.
+    """
+    init_fonts()
+    try:
+        return pygame.font.Font("freesansbold.ttf", size)
+    except (OSError, pygame.error):
+        return pygame.font.SysFont("Courier", size, bold=True)
+
+
+class LazyFont:
+    """
+    A stand-in for pygame.font.Font that loads the font the first time it is used
+
+    font_small.render(...) works exactly like it does on a real Font.
+    Every method looked up is remembered on the stand-in, so after the
+    first call there is no extra cost at all.
+
+    Attributes:
+        _size (int): Font size in points
+        _label (str): Name used in the startup report
+        _font (pygame.font.Font): The real font (None until first use)
+    """
+
+    def __init__(self, size, label=None):
+        self._size = size
+        self._label = label or f"font {size}pt"
+        self._font = None
+
+    def _load(self):
+        """Return the real Font, loading it if needed"""
+        if self._font is None:
+            with timed(f"load {self._label}"):
+                self._font = load_font(self._size)
+        return self._font
+
+    def __getattr__(self, name):
+        # Only called for names the stand-in doesn't have (render, size, ...)
+        value = getattr(self._load(), name)
+        setattr(self, name, value)
+        return value
+
+
+def print_startup_report():
+    """
+    Print every recorded import and init stage in the order they ran
+
+    Stages that ran inside another stage are indented under it; the share
+    and the total only count the outermost stages, so nothing is counted twice.
+    """
+    total = sum(seconds for _, seconds, depth in timings if depth == 0)
+    print("⏱️  Startup report")
+    print(f"{'stage':<44}{'ms':>10}{'share':>8}")
+    for label, seconds, depth in timings:
+        share = f"{seconds / total:.0%}" if total and depth == 0 else ""
+        print(f"{'  ' * depth + label:<44}{seconds * 1000:>10.1f}{share:>8}")
+    print(f"{'total':<44}{total * 1000:>10.1f}")
@@ -46,7 +46,7 @@ RESOURCE FLOW EXPLANATION:
    - Procedural generation for terrain and buildings
 
 5. BATTLE SYSTEM:
-   - Uses ui.battle_screen.BattleScreen for combat
+   - Uses ui.battle_screen.BattleScreen for combat (imported when the first battle starts)
    - Uses entities.enemy.Enemy for regular enemies
    - Uses entities.boss_dragons.DragonBoss/BossDragon for bosses
 
@@ -61,11 +61,12 @@ RESOURCE FLOW EXPLANATION:
 
 8. UI SYSTEM:
    - Uses ui.button.Button for interactive elements
-   - Uses ui.opening_cutscene.OpeningCutscene for story
+   - Uses ui.opening_cutscene.OpeningCutscene for story (created when it is first shown)
 
 DEPENDENCIES:
 =============
 - config.constants: All game constants, colors, fonts
+- core.engine: Window, clock and mixer (started on demand)
 - ui.start_screen: Title screen and character selection
 - ui.battle_screen: Combat interface
 - ui.opening_cutscene: Story introduction
@@ -94,9 +95,12 @@ This happens 60 times per second (FPS = 60) to create smooth animation.
 
 import pygame
 import sys
+import time
 import random
 import math
 from config.constants import *
+from core import engine
+from systems.rng import rng
 from world.world_map import WorldMap
 from world.world_area import WorldArea
 from entities.player_characters.character import Character
@@ -105,12 +109,15 @@ from entities.boss_dragons import DragonBoss, BossDragon
 from entities.item import Item
 from entities.dragon import Dragon
 from ui.button import Button
-from ui.battle_screen import BattleScreen
-from ui.opening_cutscene import OpeningCutscene
 from ui.start_screen import StartScreen
 from systems.particle_system import ParticleSystem
 from systems.boss_system import BossSystem
+from systems.dirty_rects import DirtyRectTracker
+from systems.horde import draw_horde
+from systems.timer_wheel import TimerWheel
+from systems.profiler import profiler, profiled
 from audio.music_system import MusicSystem
+from audio.sfx_bank import SfxBank
 from utils.android_utils import is_android
 from core.game_events import handle_events, handle_button_clicks
 from core import game_ui
@@ -155,16 +162,23 @@ class Game:
     - But they coordinate the cooks, servers, and customers
     - They make sure everything happens in the right order
     """
-    def __init__(self):
+    def __init__(self, dirty_rects=None, music_workers=MUSIC_WORKERS, horde=HORDE_MODE):
+        engine.init_display()  # Sprites are converted to the window's pixel format
         self.state = "start_menu"
         self.player = None
-        self.world_map = WorldMap()
-        self.enemies = []
-        self.items = []
+        self.horde = horde  # Non-town areas fill with thousands of enemies (systems/horde.py)
+        self.world_map = WorldMap(horde=horde)
         self.score = 0
         self.game_time = 0
-        self.spawn_timer = 0
-        self.item_timer = 0
+        # Overworld clock: advanced once per overworld tick
+        self.timers = TimerWheel()
+        self.enemy_spawn_timer = self.timers.schedule(ENEMY_SPAWN_TICKS, self.spawn_enemy,
+                                                      period=ENEMY_SPAWN_TICKS)
+        self.item_spawn_timer = self.timers.schedule(ITEM_SPAWN_TICKS, self.spawn_item,
+                                                     period=ITEM_SPAWN_TICKS)
+        # Overworld tick until which horde enemies can't start a battle (set as one starts)
+        self.battle_grace_until = 0
+        self.start_area_timers()
         self.starfield = []
         self.dragon = Dragon(SCREEN_WIDTH//2 - 250, SCREEN_HEIGHT//2 - 120)
         self.fire_timer = 0
@@ -176,29 +190,51 @@ class Game:
         self.movement_cooldown = 0
         self.movement_delay = 10
         self.particle_system = ParticleSystem()
-        self.opening_cutscene = OpeningCutscene()
+        self._opening_cutscene = None  # Created the first time it is shown
         self.start_screen = StartScreen()
         self.boss_system = BossSystem()
         self.show_world_map = False
         self.force_ui_refresh = False
         
+        # Dirty-rect rendering: only push the screen regions that changed
+        if dirty_rects is None:
+            dirty_rects = DIRTY_RECT_RENDERING or is_android()
+        self.dirty_rects = DirtyRectTracker() if dirty_rects else None
+        self._screen_signature = None
+        self._hud_signature = None
+        
+        # Fixed-timestep loop: the simulation always advances in steps of
+        # tick_seconds, drawing happens as often as RENDER_FPS allows
+        self.tick_seconds = 1.0 / SIM_TICK_RATE
+        self.interpolate = INTERPOLATE_RENDERING
+        self.render_alpha = 0.0
+        self.sim_ticks = 0
+        self.dropped_ticks = 0
+        self.skipped_frames = 0
+        self._accumulator = 0.0
+        self._tick_positions = {}
+        self._previous_positions = {}
+        
+        # Input recorder for deterministic replays (set by main.py --record)
+        self.recorder = None
+        
         # Initialize starfield
         for _ in range(150):
             self.starfield.append([
-                random.randint(0, SCREEN_WIDTH),
-                random.randint(0, SCREEN_HEIGHT),
-                random.random() * 2 + 0.5
+                rng.vfx.randint(0, SCREEN_WIDTH),
+                rng.vfx.randint(0, SCREEN_HEIGHT),
+                rng.vfx.random() * 2 + 0.5
             ])
         
         # Add flying dragons
         self.flying_dragons = []
         for _ in range(5):
             self.flying_dragons.append({
-                'x': random.randint(-200, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'speed': random.uniform(0.5, 2.0),
-                'size': random.randint(2, 5),
-                'flap': random.random() * 2 * math.pi
+                'x': rng.vfx.randint(-200, SCREEN_WIDTH),
+                'y': rng.vfx.randint(0, SCREEN_HEIGHT),
+                'speed': rng.vfx.uniform(0.5, 2.0),
+                'size': rng.vfx.randint(2, 5),
+                'flap': rng.vfx.random() * 2 * math.pi
             })
         
         # UI Elements (StartScreen handles its own buttons)
@@ -209,43 +245,16 @@ class Game:
         # ========================================
         # AUDIO SYSTEM - Procedurally Generated Sound Effects
         # ========================================
-        # Generate retro-style sound effects using mathematical waveforms
-        def generate_tone(frequency=440, duration_ms=100, volume=0.5, sample_rate=44100, waveform='sine'):
-            t = np.linspace(0, duration_ms / 1000, int(sample_rate * duration_ms / 1000), False)
-            if waveform == 'sine':
-                wave = np.sin(frequency * 2 * np.pi * t)
-            elif waveform == 'square':
-                wave = np.sign(np.sin(frequency * 2 * np.pi * t))
-            elif waveform == 'sawtooth':
-                wave = 2 * (t * frequency - np.floor(t * frequency + 0.5))
-            elif waveform == 'noise':
-                wave = np.random.uniform(-1, 1, t.shape)
-            else:
-                wave = np.sin(frequency * 2 * np.pi * t)
-            audio = (wave * volume * 32767).astype(np.int16)
-            # Make it stereo by duplicating the mono channel
-            audio_stereo = np.column_stack((audio, audio))
-            return pygame.sndarray.make_sound(audio_stereo)
-        try:
-            pygame.mixer.init()
-            self.SFX_CLICK = generate_tone(frequency=800, duration_ms=60, volume=0.5, waveform='square')
-            self.SFX_ATTACK = generate_tone(frequency=200, duration_ms=120, volume=0.5, waveform='square')
-            self.SFX_MAGIC = generate_tone(frequency=1200, duration_ms=200, volume=0.5, waveform='sine')
-            self.SFX_ITEM = generate_tone(frequency=1000, duration_ms=80, volume=0.5, waveform='sine')
-            self.SFX_LEVELUP = generate_tone(frequency=1500, duration_ms=300, volume=0.5, waveform='sine')
-            self.SFX_GAMEOVER = generate_tone(frequency=100, duration_ms=400, volume=0.5, waveform='sine')
-            self.SFX_VICTORY = generate_tone(frequency=900, duration_ms=500, volume=0.5, waveform='sine')
-            self.SFX_ARROW = generate_tone(frequency=600, duration_ms=40, volume=0.4, waveform='square')
-            self.SFX_ENTER = generate_tone(frequency=1200, duration_ms=80, volume=0.5, waveform='sine')
-        except Exception as e:
-            print("[WARNING] Could not generate sound effects:", e)
-            self.SFX_CLICK = self.SFX_ATTACK = self.SFX_MAGIC = self.SFX_ITEM = self.SFX_LEVELUP = self.SFX_GAMEOVER = self.SFX_VICTORY = None
+        # Every effect is synthesized once (or loaded from the cache) in a few
+        # slightly different versions; game.sfx.play("arrow") picks one
+        self.sfx = SfxBank()
         
         # ========================================
         # MUSIC SYSTEM - Procedural Chiptune Generation
         # ========================================
         # Dynamic music that changes based on game state and area
-        self.music = MusicSystem()
+        # (tracks that aren't cached yet are synthesized in the background)
+        self.music = MusicSystem(music_workers)
         
         # Virtual button setup for Android
         self.android_buttons = {}
@@ -262,64 +271,179 @@ class Game:
             self.android_buttons['enter'] = pygame.Rect(screen_w - button_margin - button_size, screen_h - 2*button_size, button_size, button_size)
             self.android_buttons['space'] = pygame.Rect(screen_w - button_margin - 2*button_size, screen_h - 2*button_size, button_size, button_size)
     
+    @property
+    def spawn_timer(self):
+        """Ticks since the last enemy spawn (setting it moves the next spawn)"""
+        return ENEMY_SPAWN_TICKS - self.enemy_spawn_timer.remaining
+    
+    @spawn_timer.setter
+    def spawn_timer(self, ticks):
+        self.enemy_spawn_timer.reschedule(ENEMY_SPAWN_TICKS - ticks)
+    
+    @property
+    def item_timer(self):
+        """Ticks since the last item spawn (setting it moves the next spawn)"""
+        return ITEM_SPAWN_TICKS - self.item_spawn_timer.remaining
+    
+    @item_timer.setter
+    def item_timer(self, ticks):
+        self.item_spawn_timer.reschedule(ITEM_SPAWN_TICKS - ticks)
+    
+    def start_area_timers(self):
+        """Start the particle timer of every area of the (new) world map"""
+        for area in self.world_map.areas.values():
+            area.particle_timer = area.timers.schedule(area.particle_interval, self.spawn_area_particles,
+                                                       area, period=area.particle_interval)
+    
+    @property
+    def enemies(self):
+        """Enemies of the current area (the world map's entity store is the only copy)"""
+        current_area = self.world_map.get_current_area()
+        return current_area.enemies if current_area else []
+    
+    @property
+    def items(self):
+        """Items of the current area"""
+        current_area = self.world_map.get_current_area()
+        return current_area.items if current_area else []
+    
     def spawn_enemy(self):
         # Spawn enemies in current area only (like original pycore whole)
         current_area = self.world_map.get_current_area()
         # Don't spawn enemies in town areas
-        if current_area and current_area.area_type != "town" and len(current_area.enemies) < 3:
-            # Spawn enemy in current area
-            enemy = Enemy(self.player.level if self.player else 1)
-            
-            # Area-specific enemy types
-            area_enemy_types = {
-                "plains": ["fiery", "shadow", "ice"],
-                "forest": ["shadow", "ice"],
-                "mountain": ["fiery", "ice"],
-                "desert": ["fiery"],
-                "swamp": ["shadow", "ice"],
-                "volcano": ["fiery"],
-                "ice": ["ice"],
-                "castle": ["shadow", "fiery"],
-                "cave": ["shadow", "ice"],
-                "beach": ["fiery", "shadow", "ice"]
-            }
-            
-            # Set enemy type based on area
-            available_types = area_enemy_types.get(current_area.area_type, ["fiery", "shadow", "ice"])
-            enemy.enemy_type = random.choice(available_types)
-            
-            # Regenerate name based on the correct enemy type
-            if enemy.enemy_type == "fiery":
-                names = ["Fire Imp", "Lava Sprite", "Magma Beast", "Inferno Hound", "Blaze Fiend", "Hell Hound", "Flame Demon", "Ember Beast"]
-            elif enemy.enemy_type == "shadow":
-                names = ["Dark Shade", "Night Phantom", "Void Walker", "Gloom Stalker", "Shadow Fiend", "Dark Bat", "Shadow Demon", "Void Beast"]
-            else:  # ice
-                names = ["Frost Sprite", "Ice Golem", "Blizzard Elemental", "Frozen Wraith", "Chill Specter", "Frost Bat", "Ice Demon", "Frozen Beast"]
-            enemy.name = random.choice(names)
-            
-            # Position enemy randomly within the current area
-            area_world_x, area_world_y = current_area.get_world_position()
-            enemy.x = area_world_x + random.randint(100, AREA_WIDTH - 100)
-            enemy.y = area_world_y + random.randint(100, AREA_HEIGHT - 100)
-            current_area.enemies.append(enemy)
-            self.enemies.append(enemy)
+        if not current_area or current_area.area_type == "town":
+            return
+        count = current_area.entities.count("enemy", current_area.key)
+        if current_area.horde:
+            # A horde area fills up a batch at a time
+            for _ in range(min(HORDE_SPAWN_BATCH, HORDE_ENEMIES - count)):
+                self._spawn_area_enemy(current_area)
+        elif count < 3:
+            self._spawn_area_enemy(current_area)
+    
+    def _spawn_area_enemy(self, current_area):
+        """Spawn one enemy of the area's kinds at a random spot in the area"""
+        enemy = Enemy(self.player.level if self.player else 1)
+        
+        # Area-specific enemy types
+        area_enemy_types = {
+            "plains": ["fiery", "shadow", "ice"],
+            "forest": ["shadow", "ice"],
+            "mountain": ["fiery", "ice"],
+            "desert": ["fiery"],
+            "swamp": ["shadow", "ice"],
+            "volcano": ["fiery"],
+            "ice": ["ice"],
+            "castle": ["shadow", "fiery"],
+            "cave": ["shadow", "ice"],
+            "beach": ["fiery", "shadow", "ice"]
+        }
+        
+        # Set enemy type based on area
+        available_types = area_enemy_types.get(current_area.area_type, ["fiery", "shadow", "ice"])
+        enemy.enemy_type = rng.spawning.choice(available_types)
+        
+        # Regenerate name based on the correct enemy type
+        if enemy.enemy_type == "fiery":
+            names = ["Fire Imp", "Lava Sprite", "Magma Beast", "Inferno Hound", "Blaze Fiend", "Hell Hound", "Flame Demon", "Ember Beast"]
+        elif enemy.enemy_type == "shadow":
+            names = ["Dark Shade", "Night Phantom", "Void Walker", "Gloom Stalker", "Shadow Fiend", "Dark Bat", "Shadow Demon", "Void Beast"]
+        else:  # ice
+            names = ["Frost Sprite", "Ice Golem", "Blizzard Elemental", "Frozen Wraith", "Chill Specter", "Frost Bat", "Ice Demon", "Frozen Beast"]
+        enemy.name = rng.spawning.choice(names)
+        
+        # Position enemy randomly within the current area
+        area_world_x, area_world_y = current_area.get_world_position()
+        enemy.x = area_world_x + rng.spawning.randint(100, AREA_WIDTH - 100)
+        enemy.y = area_world_y + rng.spawning.randint(100, AREA_HEIGHT - 100)
+        if current_area.horde and self.player:
+            # Hordes spawn hundreds at a time: keep them off the player, or the
+            # first tick would already be a battle
+            while ((enemy.x - self.player.x) ** 2 + (enemy.y - self.player.y) ** 2
+                   < HORDE_SAFE_RADIUS ** 2):
+                enemy.x = area_world_x + rng.spawning.randint(100, AREA_WIDTH - 100)
+                enemy.y = area_world_y + rng.spawning.randint(100, AREA_HEIGHT - 100)
+        current_area.add_enemy(enemy)
     
     def spawn_item(self):
         current_area = self.world_map.get_current_area()
-        if current_area and len(current_area.items) < 2:
+        if current_area and current_area.entities.count("item", current_area.key) < 2:
             # Spawn item in current area
             item = Item()
             # Position item randomly within the current area
             area_world_x, area_world_y = current_area.get_world_position()
-            item.x = area_world_x + random.randint(100, AREA_WIDTH - 100)
-            item.y = area_world_y + random.randint(100, AREA_HEIGHT - 100)
-            current_area.items.append(item)
-            self.items.append(item)
+            item.x = area_world_x + rng.spawning.randint(100, AREA_WIDTH - 100)
+            item.y = area_world_y + rng.spawning.randint(100, AREA_HEIGHT - 100)
+            current_area.add_item(item)
+    
+    def spawn_area_particles(self, current_area):
+        """Puff of area-specific particles (the area's particle_timer calls this)"""
+        # Spawn area-specific particles
+        area_world_x, area_world_y = current_area.get_world_position()
+        if current_area.area_type == "volcano":
+            # Lava particles
+            for _ in range(3):
+                x = rng.vfx.randint(area_world_x, area_world_x + AREA_WIDTH)
+                y = rng.vfx.randint(area_world_y + 200, area_world_y + AREA_HEIGHT)
+                self.particle_system.add_particle(
+                    x, y, (255, 100, 0),
+                    (rng.vfx.uniform(-0.5, 0.5), rng.vfx.uniform(-1, -0.5)),
+                    2, 40
+                )
+        elif current_area.area_type == "forest":
+            # Forest particles
+            for _ in range(2):
+                x = rng.vfx.randint(area_world_x, area_world_x + AREA_WIDTH)
+                y = rng.vfx.randint(area_world_y, area_world_y + AREA_HEIGHT)
+                self.particle_system.add_particle(
+                    x, y, (0, 255, 0),
+                    (rng.vfx.uniform(-0.3, 0.3), rng.vfx.uniform(-0.5, -0.2)),
+                    1, 30
+                )
+        elif current_area.area_type == "desert":
+            # Sand particles
+            for _ in range(4):
+                x = rng.vfx.randint(area_world_x, area_world_x + AREA_WIDTH)
+                y = rng.vfx.randint(area_world_y, area_world_y + AREA_HEIGHT)
+                self.particle_system.add_particle(
+                    x, y, (255, 255, 200),
+                    (rng.vfx.uniform(-1, 1), rng.vfx.uniform(-0.3, 0.3)),
+                    1, 25
+                )
+        elif current_area.area_type == "town":
+            # Town particles (smoke from chimneys)
+            for _ in range(2):
+                x = rng.vfx.randint(area_world_x + 50, area_world_x + AREA_WIDTH - 50)
+                y = rng.vfx.randint(area_world_y + 50, area_world_y + 150)
+                self.particle_system.add_particle(
+                    x, y, (200, 200, 200),
+                    (rng.vfx.uniform(-0.2, 0.2), rng.vfx.uniform(-1, -0.5)),
+                    2, 35
+                )
     
     def start_transition(self):
         self.transition_state = "in"
         self.transition_alpha = 0
-    
+
+    @property
+    def opening_cutscene(self):
+        """The story cutscene (the ui.opening_cutscene module loads on first use)"""
+        if self._opening_cutscene is None:
+            from ui.opening_cutscene import OpeningCutscene
+            self._opening_cutscene = OpeningCutscene()
+        return self._opening_cutscene
+
+    @opening_cutscene.setter
+    def opening_cutscene(self, cutscene):
+        # Set to None to start the cutscene over the next time it is shown
+        self._opening_cutscene = cutscene
+
+    def new_battle_screen(self, enemy):
+        """Create the battle screen for a fight (ui.battle_screen loads with the first battle)"""
+        from ui.battle_screen import BattleScreen
+        return BattleScreen(self.player, enemy)
+
+    @profiled("update_visual_effects")
     def update_visual_effects(self):
         """Update visual effects like starfield and flying dragons."""
         # Update starfield animation
@@ -327,7 +451,7 @@ class Game:
             star[0] -= star[2]
             if star[0] < 0:
                 star[0] = SCREEN_WIDTH
-                star[1] = random.randint(0, SCREEN_HEIGHT)
+                star[1] = rng.vfx.randint(0, SCREEN_HEIGHT)
         
         # Update flying dragons
         for dragon in self.flying_dragons:
@@ -335,9 +459,10 @@ class Game:
             dragon['flap'] += 0.05
             if dragon['x'] > SCREEN_WIDTH + 50:
                 dragon['x'] = -50
-                dragon['y'] = random.randint(0, SCREEN_HEIGHT)
-                dragon['speed'] = random.uniform(0.5, 2.0)
+                dragon['y'] = rng.vfx.randint(0, SCREEN_HEIGHT)
+                dragon['speed'] = rng.vfx.uniform(0.5, 2.0)
 
+    @profiled("update_systems")
     def update_systems(self):
         """Update core game systems like particles and music."""
         # Update particle effects
@@ -346,8 +471,33 @@ class Game:
         # Update dynamic music system based on game state
         is_boss_battle = self.boss_system.get_boss_battle_music_state(self.battle_screen)
         current_area = self.world_map.get_current_area() if hasattr(self, 'world_map') else None
+        self.music.set_intensity(*self.music_intensity(is_boss_battle))
         self.music.update(self.state, is_boss_battle, current_area)
 
+    def music_intensity(self, is_boss_battle):
+        """
+        Gameplay signals for the adaptive music, each from 0.0 to 1.0
+
+        Returns:
+            tuple: (nearest enemy proximity, player HP fraction, boss evolution tier)
+        """
+        proximity = 0.0
+        if self.state == "battle":
+            proximity = 1.0
+        elif self.state == "overworld" and self.player:
+            current_area = self.world_map.get_current_area()
+            enemy = current_area.nearest_enemy(self.player.x, self.player.y,
+                                               max_radius=MUSIC_DANGER_RADIUS) if current_area else None
+            if enemy is not None:
+                nearest = math.hypot(enemy.x - self.player.x, enemy.y - self.player.y)
+                proximity = max(0.0, 1.0 - nearest / MUSIC_DANGER_RADIUS)
+        health = self.player.health / self.player.max_health if self.player else 1.0
+        boss_tier = 0.0
+        if is_boss_battle and self.battle_screen:
+            # Tiers run 0-9; even a young dragon counts a little
+            boss_tier = (getattr(self.battle_screen.enemy, "evolution_tier", 9) + 1) / 10
+        return proximity, health, boss_tier
+
     def update_transitions(self):
         """Update screen transition effects."""
         # Handle screen transition animations (fade in/out)
@@ -383,6 +533,7 @@ class Game:
         if boss_battle_triggered:
             return
     
+    @profiled("update_game_state")
     def update_game_state(self):
         """
         Main game update loop - called every frame to update all game systems.
@@ -424,8 +575,6 @@ class Game:
         elif self.state == "overworld" and self.player:
             # Main gameplay area with movement and exploration
             self.game_time += 1
-            self.spawn_timer += 1
-            self.item_timer += 1
             self.movement_cooldown = max(0, self.movement_cooldown - 1)
             self.player.update_animation()
             
@@ -437,17 +586,9 @@ class Game:
             
             # Check for area transition
             if self.world_map.check_area_transition(self.player.x, self.player.y):
-                # Area changed, update enemy and item lists
+                # Area changed: self.enemies and self.items now come from the new area
                 current_area = self.world_map.get_current_area()
                 
-                # Update enemy and item lists from the new area (like original pycore whole)
-                if current_area:
-                    self.enemies = current_area.enemies
-                    self.items = current_area.items
-                else:
-                    self.enemies = []
-                    self.items = []
-                
                 # If entering town area, position player at the gate (4 squares lower)
                 if current_area and current_area.area_type == "town":
                     area_world_x, area_world_y = current_area.get_world_position()
@@ -455,68 +596,16 @@ class Game:
                     self.player.x = area_world_x + (AREA_WIDTH // 2)  # Center horizontally
                     self.player.y = area_world_y + 260  # 4 squares lower from top (200 + 60 = 260)
             
-            # Add area-specific particle effects
             current_area = self.world_map.get_current_area()
-            if current_area:
-                current_area.particle_timer += 1
-                if current_area.particle_timer >= current_area.particle_interval:
-                    current_area.particle_timer = 0
-                    
-                    # Spawn area-specific particles
-                    area_world_x, area_world_y = current_area.get_world_position()
-                    if current_area.area_type == "volcano":
-                        # Lava particles
-                        for _ in range(3):
-                            x = random.randint(area_world_x, area_world_x + AREA_WIDTH)
-                            y = random.randint(area_world_y + 200, area_world_y + AREA_HEIGHT)
-                            self.particle_system.add_particle(
-                                x, y, (255, 100, 0),
-                                (random.uniform(-0.5, 0.5), random.uniform(-1, -0.5)),
-                                2, 40
-                            )
-                    elif current_area.area_type == "forest":
-                        # Forest particles
-                        for _ in range(2):
-                            x = random.randint(area_world_x, area_world_x + AREA_WIDTH)
-                            y = random.randint(area_world_y, area_world_y + AREA_HEIGHT)
-                            self.particle_system.add_particle(
-                                x, y, (0, 255, 0),
-                                (random.uniform(-0.3, 0.3), random.uniform(-0.5, -0.2)),
-                                1, 30
-                            )
-                    elif current_area.area_type == "desert":
-                        # Sand particles
-                        for _ in range(4):
-                            x = random.randint(area_world_x, area_world_x + AREA_WIDTH)
-                            y = random.randint(area_world_y, area_world_y + AREA_HEIGHT)
-                            self.particle_system.add_particle(
-                                x, y, (255, 255, 200),
-                                (random.uniform(-1, 1), random.uniform(-0.3, 0.3)),
-                                1, 25
-                            )
-                    elif current_area.area_type == "town":
-                        # Town particles (smoke from chimneys)
-                        for _ in range(2):
-                            x = random.randint(area_world_x + 50, area_world_x + AREA_WIDTH - 50)
-                            y = random.randint(area_world_y + 50, area_world_y + 150)
-                            self.particle_system.add_particle(
-                                x, y, (200, 200, 200),
-                                (random.uniform(-0.2, 0.2), random.uniform(-1, -0.5)),
-                                2, 35
-                            )
-            
-            # Enemy spawning logic
-            if self.spawn_timer >= 300:  # Original pycore whole value
-                self.spawn_enemy()
-                self.spawn_timer = 0
+            
+            # Enemy and item spawning (enemy_spawn_timer and item_spawn_timer)
+            self.timers.advance()
+            if current_area and current_area.horde:
+                self.spawn_enemy()  # Hordes fill up a batch every tick
                 
-            # Item spawning logic  
-            if self.item_timer >= 600:
-                self.spawn_item()
-                self.item_timer = 0
-            for enemy in self.enemies:
-                enemy.update(self.player.x, self.player.y)
-                enemy.update_animation()
+            # Area particles and enemy steps (toward the player) come from the area's own timers
+            if current_area:
+                current_area.tick(self.player.x, self.player.y)
                 
         elif self.state == "battle":
             # Battle screen handling
@@ -549,7 +638,7 @@ class Game:
                             # Check for boss battle after battle result is fully processed
                             should_trigger, boss_enemy = self.boss_system.check_boss_battle_trigger(self.player)
                             if should_trigger and boss_enemy:
-                                self.battle_screen = BattleScreen(self.player, boss_enemy)
+                                self.battle_screen = self.new_battle_screen(boss_enemy)
                                 self.battle_screen.start_transition()
                                 self.state = "battle"
                                 self.boss_system.start_boss_battle(self.player, boss_enemy)
@@ -581,58 +670,60 @@ class Game:
         # GLOBAL CHECKS (regardless of state)
         # ========================================
         # --- Check for enemy/item collisions (only in overworld) ---
-        if self.state == "overworld" and hasattr(self, 'player') and self.player:
-            for enemy in self.enemies[:]:
-                if self.player:  # Ensure player exists
-                    player_rect = pygame.Rect(self.player.x, self.player.y, PLAYER_SIZE, PLAYER_SIZE)
-                    enemy_rect = pygame.Rect(enemy.x, enemy.y, ENEMY_SIZE, ENEMY_SIZE)
-                    if player_rect.colliderect(enemy_rect):
-                        self.battle_screen = BattleScreen(self.player, enemy)
-                        self.battle_screen.start_transition()
-                        self.state = "battle"
-                        # Remove enemy from both lists
-                        self.enemies.remove(enemy)
-                        current_area = self.world_map.get_current_area()
-                        if current_area and enemy in current_area.enemies:
-                            current_area.enemies.remove(enemy)
-                        self.player_moved = False
-                        break
-            for item in self.items[:]:
-                if self.player:  # Ensure player exists
-                    item_rect = pygame.Rect(item.x, item.y, ITEM_SIZE, ITEM_SIZE)
-                    player_rect = pygame.Rect(self.player.x, self.player.y, PLAYER_SIZE, PLAYER_SIZE)
-                    if player_rect.colliderect(item_rect):
-                        if item.type == "health":
-                            self.player.health = min(self.player.max_health, self.player.health + 30)
-                            for _ in range(15):
-                                x = random.randint(self.player.x, self.player.x + PLAYER_SIZE)
-                                y = random.randint(self.player.y, self.player.y + PLAYER_SIZE)
-                                self.particle_system.add_particle(
-                                    x, y, HEALTH_COLOR,
-                                    (random.uniform(-0.5, 0.5), random.uniform(-1, -0.5)),
-                                    3, 30
-                                )
-                        else:
-                            self.player.mana = min(self.player.max_mana, self.player.mana + 40)
-                            for _ in range(15):
-                                x = random.randint(self.player.x, self.player.x + PLAYER_SIZE)
-                                y = random.randint(self.player.y, self.player.y + PLAYER_SIZE)
-                                self.particle_system.add_particle(
-                                    x, y, MANA_COLOR,
-                                    (random.uniform(-0.5, 0.5), random.uniform(-1, -0.5)),
-                                    3, 30
-                                )
-                        self.player.items_collected += 1
-                        # Remove item from both lists
-                        if item in self.items:
-                            self.items.remove(item)
-                        current_area = self.world_map.get_current_area()
-                        if current_area and item in current_area.items:
-                            current_area.items.remove(item)
-                        # Force immediate UI redraw after health/mana change
-                        self.draw(screen)
+        # The area's spatial index only looks at objects in the cells the player touches
+        # (a horde area tests all its enemies in one array comparison)
+        current_area = self.world_map.get_current_area()
+        if self.state == "overworld" and hasattr(self, 'player') and self.player and current_area:
+            player_box = (self.player.x, self.player.y, PLAYER_SIZE, PLAYER_SIZE)
+            enemy = None
+            if not (current_area.horde and self.timers.now < self.battle_grace_until):
+                enemy = current_area.enemy_at(*player_box)
+            if enemy is not None:
+                self.battle_screen = self.new_battle_screen(enemy)
+                self.battle_screen.start_transition()
+                self.state = "battle"
+                current_area.remove_enemy(enemy)
+                self.player_moved = False
+                if current_area.horde:
+                    # The overworld clock stops during the battle, so the grace
+                    # period starts when the player is back
+                    self.battle_grace_until = self.timers.now + HORDE_BATTLE_GRACE_TICKS
+            for item in current_area.index.query_rect(*player_box, kind="item"):
+                if item.type == "health":
+                    self.player.health = min(self.player.max_health, self.player.health + 30)
+                    for _ in range(15):
+                        x = rng.vfx.randint(self.player.x, self.player.x + PLAYER_SIZE)
+                        y = rng.vfx.randint(self.player.y, self.player.y + PLAYER_SIZE)
+                        self.particle_system.add_particle(
+                            x, y, HEALTH_COLOR,
+                            (rng.vfx.uniform(-0.5, 0.5), rng.vfx.uniform(-1, -0.5)),
+                            3, 30
+                        )
+                else:
+                    self.player.mana = min(self.player.max_mana, self.player.mana + 40)
+                    for _ in range(15):
+                        x = rng.vfx.randint(self.player.x, self.player.x + PLAYER_SIZE)
+                        y = rng.vfx.randint(self.player.y, self.player.y + PLAYER_SIZE)
+                        self.particle_system.add_particle(
+                            x, y, MANA_COLOR,
+                            (rng.vfx.uniform(-0.5, 0.5), rng.vfx.uniform(-1, -0.5)),
+                            3, 30
+                        )
+                self.player.items_collected += 1
+                current_area.remove_item(item)
+                # Force immediate UI redraw after health/mana change
+                self.draw(engine.screen)
     
     def draw(self, screen):
+        """Draw the current frame (timed by the profiler as draw.<state>)"""
+        if not profiler.enabled:
+            self.draw_state(screen)
+            return
+        with profiler.span("draw." + self.state):
+            self.draw_state(screen)
+    
+    def draw_state(self, screen):
+        """Draw everything for the current game state"""
         screen.fill(BACKGROUND)
         
         # Draw starfield background
@@ -680,6 +771,10 @@ class Game:
             self.start_screen.draw_start_menu(screen)
             # Draw the animated dragon
             self.dragon.draw(screen)
+            # Show how much music is still being composed in the background
+            ready, total = self.music.progress()
+            if ready < total:
+                game_ui.draw_loading_progress(screen, "Composing music", ready, total)
             
         elif self.state == "opening_cutscene":
             # Story introduction sequence
@@ -696,20 +791,16 @@ class Game:
                 self.world_map.draw_world_map(screen)
             else:
                 # Draw current area
+                # (the area's cached background already includes its grid)
                 current_area = self.world_map.get_current_area()
                 if current_area:
                     current_area.draw(screen, self.world_map)
                 else:
                     screen.fill(BACKGROUND)
-                
-                # Draw grid for current area (only if no cutscene is active)
-                if not current_area or not current_area.cutscene_active:
                     for x in range(0, SCREEN_WIDTH, GRID_SIZE):
-                        pygame.draw.line(screen, current_area.grid_color if current_area else GRID_COLOR, 
-                                       (x, 0), (x, SCREEN_HEIGHT), 2)
+                        pygame.draw.line(screen, GRID_COLOR, (x, 0), (x, SCREEN_HEIGHT), 2)
                     for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
-                        pygame.draw.line(screen, current_area.grid_color if current_area else GRID_COLOR, 
-                                       (0, y), (SCREEN_WIDTH, y), 2)
+                        pygame.draw.line(screen, GRID_COLOR, (0, y), (SCREEN_WIDTH, y), 2)
                 
                 # Draw area boundaries more prominently
                 pygame.draw.rect(screen, (255, 255, 255), (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), 3)
@@ -729,13 +820,20 @@ class Game:
                 
             # Draw enemies (convert world coordinates to screen coordinates)
             current_area = self.world_map.get_current_area()
-            for enemy in self.enemies:
-                screen_x, screen_y = self.world_map.world_to_screen(enemy.x, enemy.y)
-                if 0 <= screen_x < SCREEN_WIDTH and 0 <= screen_y < SCREEN_HEIGHT:
-                    original_x, original_y = enemy.x, enemy.y
-                    enemy.x, enemy.y = screen_x, screen_y
-                    enemy.draw(screen)
-                    enemy.x, enemy.y = original_x, original_y
+            if current_area and current_area.horde:
+                # Only the on-screen part of the horde, as simple sprites
+                draw_horde(screen, current_area.entities.table("enemy"), current_area.enemy_rows(),
+                           self.world_map.camera_x, self.world_map.camera_y)
+            else:
+                for enemy in self.enemies:
+                    screen_x, screen_y = self.world_map.world_to_screen(enemy.x, enemy.y)
+                    if 0 <= screen_x < SCREEN_WIDTH and 0 <= screen_y < SCREEN_HEIGHT:
+                        # Waiting enemies get no per-tick update, and their bob only follows the clock
+                        enemy.update_animation()
+                        original_x, original_y = enemy.x, enemy.y
+                        enemy.x, enemy.y = screen_x, screen_y
+                        enemy.draw(screen)
+                        enemy.x, enemy.y = original_x, original_y
                 
             # Draw items (convert world coordinates to screen coordinates)
             for item in self.items:
@@ -859,42 +957,243 @@ class Game:
             overlay.fill((0, 0, 0))
             screen.blit(overlay, (0, 0))
     
+    def mark_dirty_regions(self):
+        """
+        Tell the dirty-rect tracker which parts of the screen changed this frame.
+        
+        Screens that are animated all over (menus, cutscenes, battles, fades)
+        always get a full flip. The overworld, game over and victory screens
+        only push moving entities, particles, stars, buttons and changed HUD text.
+        """
+        tracker = self.dirty_rects
+        current_area = self.world_map.get_current_area()
+        
+        # Full flip whenever we switch screens, areas or map view
+        screen_signature = (self.state, self.show_world_map,
+                            (current_area.area_x, current_area.area_y) if current_area else None)
+        if screen_signature != self._screen_signature:
+            self._screen_signature = screen_signature
+            self._hud_signature = None
+            tracker.request_full_redraw()
+        
+        if (self.state not in ("overworld", "game_over", "victory") or
+                self.transition_alpha > 0 or
+                self.world_map.transitioning or
+                (current_area and (current_area.cutscene_active or
+                                   (self.state == "overworld" and current_area.horde)))):
+            tracker.request_full_redraw()
+            return
+        
+        if self.state in ("game_over", "victory"):
+            # Starfield and flying dragons are visible behind these screens
+            for x, y, speed in self.starfield:
+                tracker.mark((int(x) - 2, int(y) - 2, 5, 5))
+            for dragon in self.flying_dragons:
+                size = dragon['size']
+                tracker.mark((dragon['x'] - 2, dragon['y'] - 4 * size - 2, 7 * size + 5, 8 * size + 5))
+            for button in (self.start_button, self.back_button):
+                tracker.mark(button.rect, padding=12)
+            return
+        
+        # Overworld: player, enemies, items and particles
+        if self.player:
+            screen_x, screen_y = self.world_map.world_to_screen(self.player.x, self.player.y)
+            tracker.mark((screen_x - PLAYER_SIZE, screen_y - PLAYER_SIZE, PLAYER_SIZE * 3, PLAYER_SIZE * 3))
+            grid_x = (screen_x // GRID_SIZE) * GRID_SIZE
+            grid_y = (screen_y // GRID_SIZE) * GRID_SIZE
+            tracker.mark((grid_x, grid_y, GRID_SIZE, GRID_SIZE), padding=2)
+        
+        for enemy in self.enemies:
+            screen_x, screen_y = self.world_map.world_to_screen(enemy.x, enemy.y)
+            # Wide enough for the name label, health bar and attack effects
+            tracker.mark((screen_x - 60, screen_y - 45, enemy.size + 120, enemy.size + 80))
+        
+        for item in self.items:
+            screen_x, screen_y = self.world_map.world_to_screen(item.x, item.y)
+            tracker.mark((screen_x, screen_y, item.size, item.size), padding=10)
+        
+        particle_rect = self.particle_system.bounding_rect(self.world_map)
+        if particle_rect:
+            tracker.mark(particle_rect)
+        
+        # HUD panels only change when the numbers on them change
+        if self.player:
+            hud_signature = (self.score, self.game_time // FPS, self.player.kills,
+                             self.player.health, self.player.max_health,
+                             self.player.mana, self.player.max_mana,
+                             self.player.level, self.player.exp,
+                             self.player.x // GRID_SIZE, self.player.y // GRID_SIZE,
+                             tuple(area.visited for area in self.world_map.areas.values()))
+            if hud_signature != self._hud_signature:
+                self._hud_signature = hud_signature
+                tracker.mark((0, 0, 460, 170))                                  # Stats panel
+                tracker.mark((SCREEN_WIDTH - 320, 0, 320, 250))                 # Score, area and mini-map
+                tracker.mark((0, SCREEN_HEIGHT - 190, 320, 190))                # Position and controls
+    
+    def present_frame(self):
+        """Show the finished frame (full flip, or only the dirty regions)"""
+        if profiler.overlay_visible:
+            overlay_rect = profiler.draw_overlay(engine.screen)
+            if self.dirty_rects:
+                self.dirty_rects.mark(overlay_rect)
+        if self.dirty_rects:
+            self.mark_dirty_regions()
+            self.dirty_rects.present()
+        else:
+            pygame.display.flip()
+    
+    def _entity_positions(self):
+        """Return {id: (x, y)} for the player and enemies (used for interpolation)"""
+        positions = {}
+        if self.player:
+            positions[id(self.player)] = (self.player.x, self.player.y)
+        for enemy in self._interpolated_enemies():
+            positions[id(enemy)] = (enemy.x, enemy.y)
+        return positions
+    
+    def _interpolated_enemies(self):
+        """Enemies drawn between simulation steps (horde enemies just jump)"""
+        current_area = self.world_map.get_current_area()
+        if current_area and current_area.horde:
+            return []
+        return self.enemies
+    
+    def advance_simulation(self, elapsed):
+        """
+        Run as many fixed simulation steps as the elapsed real time allows
+        
+        Leftover time is carried to the next frame. If the game falls more
+        than MAX_CATCHUP_STEPS behind (a long load, a dragged window), the
+        extra backlog is dropped instead of trying to catch up all at once.
+        
+        Args:
+            elapsed (float): Real seconds since the previous frame
+            
+        Returns:
+            tuple: (steps run, True if the simulation is still behind)
+        """
+        self._accumulator += elapsed
+        steps = 0
+        while self._accumulator >= self.tick_seconds and steps < MAX_CATCHUP_STEPS:
+            if self.interpolate:
+                self._previous_positions = self._tick_positions
+            self.update()
+            if self.interpolate:
+                self._tick_positions = self._entity_positions()
+            self._accumulator -= self.tick_seconds
+            steps += 1
+        
+        behind = self._accumulator >= self.tick_seconds
+        if behind:
+            dropped = int(self._accumulator / self.tick_seconds)
+            self.dropped_ticks += dropped
+            self._accumulator -= dropped * self.tick_seconds
+        
+        self.sim_ticks += steps
+        self.render_alpha = self._accumulator / self.tick_seconds
+        return steps, behind
+    
+    def draw_interpolated(self, screen):
+        """
+        Draw with the player and enemies placed between their last two
+        simulation positions (render_alpha of the way), so movement looks
+        smooth when drawing runs faster than the simulation.
+        """
+        if not self.interpolate:
+            self.draw(screen)
+            return
+        
+        max_jump = GRID_SIZE * 2  # Bigger jumps are teleports/area changes: don't slide
+        moved = []
+        entities = ([self.player] if self.player else []) + self._interpolated_enemies()
+        for entity in entities:
+            previous = self._previous_positions.get(id(entity))
+            if previous is None:
+                continue
+            dx = entity.x - previous[0]
+            dy = entity.y - previous[1]
+            if (dx or dy) and abs(dx) <= max_jump and abs(dy) <= max_jump:
+                moved.append((entity, entity.x, entity.y))
+                entity.x = previous[0] + dx * self.render_alpha
+                entity.y = previous[1] + dy * self.render_alpha
+        try:
+            self.draw(screen)
+        finally:
+            for entity, x, y in moved:
+                entity.x, entity.y = x, y
+    
     def run(self):
-        """Main game loop - now uses the game_events module for clean separation"""
+        """
+        Main game loop - fixed-timestep simulation with decoupled drawing
+        
+        Game logic (update) always runs SIM_TICK_RATE times per real second,
+        no matter how fast or slow drawing is. Slow machines skip drawing a
+        few frames (at most MAX_FRAME_SKIP in a row) to keep the game speed
+        right; fast machines can draw more often than the simulation ticks.
+        """
+        screen = engine.init()
+        clock = engine.clock
         running = True
         self.force_ui_refresh = False
+        frame_skip = 0
+        # Start one tick "in the bank" so the first frame is updated before drawing
+        self._accumulator = self.tick_seconds
+        previous_time = time.perf_counter()
         
         while running:
+            now = time.perf_counter()
+            elapsed = now - previous_time
+            previous_time = now
+            
             # Use the game_events module for event handling
-            running, mouse_pos, mouse_click = handle_events(self, screen)
+            events = pygame.event.get()
+            running, mouse_pos, mouse_click = handle_events(self, screen, events)
             
             # Handle button clicks using the events module
             handle_button_clicks(self, mouse_pos, mouse_click)
             
-            # Update game state
-            self.update()
-            # Force UI refresh if flagged (e.g., after level up)
-            if getattr(self, 'force_ui_refresh', False):
-                self.draw(screen)
-                self.force_ui_refresh = False
-            self.draw(screen)
+            # Update game state in fixed steps
+            steps, behind = self.advance_simulation(elapsed)
+            
+            # Frame skip: when the simulation can't keep up, spend the time on
+            # updates instead of drawing (but never skip too many frames in a row)
+            if behind and frame_skip < MAX_FRAME_SKIP:
+                frame_skip += 1
+                self.skipped_frames += 1
+            else:
+                frame_skip = 0
+                # Force UI refresh if flagged (e.g., after level up)
+                if getattr(self, 'force_ui_refresh', False):
+                    self.draw_interpolated(screen)
+                    self.force_ui_refresh = False
+                    if self.dirty_rects:
+                        self.dirty_rects.request_full_redraw()
+                self.draw_interpolated(screen)
+                self.present_frame()
             
             # Handle victory music completion
-            if self.state == "victory" and not pygame.mixer.music.get_busy():
+            victory_done = self.state == "victory" and not self.music.is_playing()
+            if victory_done:
                 # After victory music plays once, return to menu
                 self.state = "start_menu"
                 self.music.update(self.state)
             
-            pygame.display.flip()
-            clock.tick(FPS)
+            if self.recorder:
+                self.recorder.record_frame(self, events, mouse_pos, mouse_click, steps, victory_done)
+            
+            clock.tick(RENDER_FPS)
+            profiler.end_frame()
         
+        if self.recorder:
+            self.recorder.save()
+        if profiler.frames:
+            profiler.dump()
+        self.music.shutdown()
         pygame.quit()
         sys.exit()
     
     def start_game(self):
         """Reset game state for a new game"""
-        self.enemies = []
-        self.items = []
         self.score = 0
         self.game_time = 0
         self.spawn_timer = 0
@@ -904,7 +1203,8 @@ class Game:
         self.boss_system.reset_boss_state()
         
         # Reset world map
-        self.world_map = WorldMap()
+        self.world_map = WorldMap(horde=self.horde)
+        self.start_area_timers()
         
         # Position player in center area (1,1) at center position
         if self.player:
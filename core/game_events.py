@@ -15,15 +15,17 @@ The module handles:
 import pygame
 from core.game_state import *
 from utils.android_utils import is_android
+from systems.profiler import profiler
 
 
-def handle_events(game, screen):
+def handle_events(game, screen, events=None):
     """
     Main event handling function that processes all pygame events.
     
     Args:
         game: The main Game instance
         screen: The pygame display surface
+        events: Events to handle (default: pygame.event.get(); replays pass recorded ones)
         
     Returns:
         tuple: (running, mouse_pos, mouse_click) where running is a boolean
@@ -32,9 +34,17 @@ def handle_events(game, screen):
     mouse_pos = pygame.mouse.get_pos()
     mouse_click = False
     
-    for event in pygame.event.get():
+    if events is None:
+        events = pygame.event.get()
+    
+    for event in events:
         if event.type == pygame.QUIT:
             running = False
+        
+        # The window was uncovered or resized, so everything must be shown again
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+            if getattr(game, 'dirty_rects', None):
+                game.dirty_rects.request_full_redraw()
             
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_click = True
@@ -83,6 +93,12 @@ def handle_keydown_event(game, event):
     if event.key == pygame.K_ESCAPE:
         handle_escape_key(game)
     
+    # F3 shows/hides the profiler overlay (in every state)
+    if event.key == pygame.K_F3:
+        profiler.toggle_overlay()
+        if getattr(game, 'dirty_rects', None):
+            game.dirty_rects.request_full_redraw()
+    
     # Handle skip for cutscene
     if game.state == "opening_cutscene":
         game.opening_cutscene.skip()
@@ -130,23 +146,19 @@ def handle_movement_input(game, event):
     original_y = game.player.y
     
     if event.key in [pygame.K_UP, pygame.K_w]:
-        if game.SFX_ARROW: 
-            game.SFX_ARROW.play()
+        game.sfx.play("arrow")
         game.player.move(0, -1)
         check_movement_collision(game, original_x, original_y)
     elif event.key in [pygame.K_DOWN, pygame.K_s]:
-        if game.SFX_ARROW: 
-            game.SFX_ARROW.play()
+        game.sfx.play("arrow")
         game.player.move(0, 1)
         check_movement_collision(game, original_x, original_y)
     elif event.key in [pygame.K_LEFT, pygame.K_a]:
-        if game.SFX_ARROW: 
-            game.SFX_ARROW.play()
+        game.sfx.play("arrow")
         game.player.move(-1, 0)
         check_movement_collision(game, original_x, original_y)
     elif event.key in [pygame.K_RIGHT, pygame.K_d]:
-        if game.SFX_ARROW: 
-            game.SFX_ARROW.play()
+        game.sfx.play("arrow")
         game.player.move(1, 0)
         check_movement_collision(game, original_x, original_y)
 
@@ -225,14 +237,13 @@ def handle_start_menu_clicks(game, mouse_pos, mouse_click):
     # Handle clicks using StartScreen module
     result = game.start_screen.handle_start_menu_clicks(mouse_pos, mouse_click)
     if result:
-        if game.SFX_CLICK: 
-            game.SFX_CLICK.play()
+        game.sfx.play("click")
         if result == "quit":
             return False  # Signal to quit
         else:
             game.state = result
             if result == "opening_cutscene":
-                game.opening_cutscene = game.opening_cutscene.__class__()  # Reset cutscene
+                game.opening_cutscene = None  # Reset cutscene (a new one is made when it is shown)
     return True
 
 
@@ -251,8 +262,7 @@ def handle_character_select_clicks(game, mouse_pos, mouse_click):
     # Handle clicks using StartScreen module
     result = game.start_screen.handle_character_select_clicks(mouse_pos, mouse_click)
     if result:
-        if game.SFX_CLICK: 
-            game.SFX_CLICK.play()
+        game.sfx.play("click")
         if isinstance(result, tuple):
             game.state, character_type = result
             if character_type:
@@ -277,13 +287,11 @@ def handle_game_over_clicks(game, mouse_pos, mouse_click):
     game.back_button.update(mouse_pos)
     
     if game.start_button.is_clicked(mouse_pos, mouse_click):
-        if game.SFX_CLICK: 
-            game.SFX_CLICK.play()
+        game.sfx.play("click")
         game.state = "character_select"
         
     if game.back_button.is_clicked(mouse_pos, mouse_click):
-        if game.SFX_CLICK: 
-            game.SFX_CLICK.play()
+        game.sfx.play("click")
         game.state = "start_menu"
 
 
@@ -300,13 +308,11 @@ def handle_victory_clicks(game, mouse_pos, mouse_click):
     game.back_button.update(mouse_pos)
     
     if game.start_button.is_clicked(mouse_pos, mouse_click):
-        if game.SFX_CLICK: 
-            game.SFX_CLICK.play()
+        game.sfx.play("click")
         game.state = "character_select"
         
     if game.back_button.is_clicked(mouse_pos, mouse_click):
-        if game.SFX_CLICK: 
-            game.SFX_CLICK.play()
+        game.sfx.play("click")
         game.state = "start_menu" 
 
 
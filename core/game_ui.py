@@ -14,20 +14,10 @@ The module provides:
 
 import pygame
 import math
-from ui.button import Button
 from config.constants import *
 from utils.android_utils import is_android
 
 
-# Main menu and character select buttons
-start_button = Button(SCREEN_WIDTH//2 - 120, 500, 240, 60, "START QUEST", UI_BORDER)
-quit_button = Button(SCREEN_WIDTH//2 - 120, 580, 240, 60, "QUIT", UI_BORDER)
-back_button = Button(20, 20, 100, 40, "BACK")
-warrior_button = Button(SCREEN_WIDTH//2 - 300, 300, 200, 150, "WARRIOR", (0, 255, 0))
-mage_button = Button(SCREEN_WIDTH//2 - 50, 300, 200, 150, "MAGE", (0, 200, 255))
-rogue_button = Button(SCREEN_WIDTH//2 + 200, 300, 200, 150, "ROGUE", (255, 100, 0))
-
-
 def draw_start_menu(game, screen):
     """
     Draw the start menu with title, dragon, and buttons.
@@ -419,6 +409,26 @@ def draw_transition_overlay(game, screen):
         screen.blit(overlay, (0, 0))
 
 
+def draw_loading_progress(screen, label, done, total):
+    """
+    Draw a small progress bar in the bottom-right corner.
+    
+    Args:
+        screen: The pygame display surface
+        label: What is loading (e.g. "Composing music")
+        done: Parts finished so far
+        total: Parts in total
+    """
+    bar = pygame.Rect(SCREEN_WIDTH - 180, SCREEN_HEIGHT - 26, 160, 8)
+    text = font_tiny.render(f"{label} {done}/{total}", True, TEXT_COLOR)
+    screen.blit(text, (bar.right - text.get_width(), bar.y - text.get_height() - 4))
+    pygame.draw.rect(screen, UI_BG, bar)
+    filled = bar.copy()
+    filled.width = bar.width * done // max(1, total)
+    pygame.draw.rect(screen, UI_BORDER, filled)
+    pygame.draw.rect(screen, TEXT_COLOR, bar, 1)
+
+
 def draw_android_controls(game, screen):
     """
     Draw Android virtual controls if on Android platform.
@@ -12,12 +12,12 @@ The module provides:
 - Area-specific logic and calculations
 """
 
-import random
 import math
 from entities.enemy import Enemy, DragonBoss, BossDragon
 from entities.item import Item
 from world.world_area import AREA_WIDTH, AREA_HEIGHT
 from config.constants import *
+from systems.rng import rng
 
 
 # Removed old spawn_enemy function - now using the improved version in core/game.py
@@ -36,10 +36,9 @@ def spawn_item(game):
         item = Item()
         # Position item randomly within the current area
         area_world_x, area_world_y = current_area.get_world_position()
-        item.x = area_world_x + random.randint(100, AREA_WIDTH - 100)
-        item.y = area_world_y + random.randint(100, AREA_HEIGHT - 100)
-        current_area.items.append(item)
-        game.items.append(item)
+        item.x = area_world_x + rng.spawning.randint(100, AREA_WIDTH - 100)
+        item.y = area_world_y + rng.spawning.randint(100, AREA_HEIGHT - 100)
+        current_area.add_item(item)
 
 
 def check_battle_collision(game):
@@ -60,11 +59,9 @@ def check_battle_collision(game):
                 game.battle_screen = game.battle_screen.__class__(game.player, enemy)
                 game.battle_screen.start_transition()
                 game.state = "battle"
-                # Remove enemy from both lists
-                game.enemies.remove(enemy)
                 current_area = game.world_map.get_current_area()
-                if current_area and enemy in current_area.enemies:
-                    current_area.enemies.remove(enemy)
+                if current_area:
+                    current_area.remove_enemy(enemy)
                 game.player_moved = False
                 return True
     return False
@@ -85,30 +82,27 @@ def check_item_collision(game):
                 if item.type == "health":
                     game.player.health = min(game.player.max_health, game.player.health + 30)
                     for _ in range(15):
-                        x = random.randint(game.player.x, game.player.x + PLAYER_SIZE)
-                        y = random.randint(game.player.y, game.player.y + PLAYER_SIZE)
+                        x = rng.vfx.randint(game.player.x, game.player.x + PLAYER_SIZE)
+                        y = rng.vfx.randint(game.player.y, game.player.y + PLAYER_SIZE)
                         game.particle_system.add_particle(
                             x, y, HEALTH_COLOR,
-                            (random.uniform(-0.5, 0.5), random.uniform(-1, -0.5)),
+                            (rng.vfx.uniform(-0.5, 0.5), rng.vfx.uniform(-1, -0.5)),
                             3, 30
                         )
                 else:
                     game.player.mana = min(game.player.max_mana, game.player.mana + 40)
                     for _ in range(15):
-                        x = random.randint(game.player.x, game.player.x + PLAYER_SIZE)
-                        y = random.randint(game.player.y, game.player.y + PLAYER_SIZE)
+                        x = rng.vfx.randint(game.player.x, game.player.x + PLAYER_SIZE)
+                        y = rng.vfx.randint(game.player.y, game.player.y + PLAYER_SIZE)
                         game.particle_system.add_particle(
                             x, y, MANA_COLOR,
-                            (random.uniform(-0.5, 0.5), random.uniform(-1, -0.5)),
+                            (rng.vfx.uniform(-0.5, 0.5), rng.vfx.uniform(-1, -0.5)),
                             3, 30
                         )
                 game.player.items_collected += 1
-                # Remove item from both lists
-                if item in game.items:
-                    game.items.remove(item)
                 current_area = game.world_map.get_current_area()
-                if current_area and item in current_area.items:
-                    current_area.items.remove(item)
+                if current_area:
+                    current_area.remove_item(item)
 
 
 def handle_battle_result(game):
@@ -202,91 +196,91 @@ def generate_area_particles(game, current_area):
             if current_area.area_type == "volcano":
                 # Lava particles
                 for _ in range(5):
-                    x = area_world_x + random.randint(0, AREA_WIDTH)
-                    y = area_world_y + random.randint(0, AREA_HEIGHT)
+                    x = area_world_x + rng.vfx.randint(0, AREA_WIDTH)
+                    y = area_world_y + rng.vfx.randint(0, AREA_HEIGHT)
                     game.particle_system.add_particle(
                         x, y, (255, 100, 0),
-                        (random.uniform(-0.5, 0.5), random.uniform(-2, -0.5)),
+                        (rng.vfx.uniform(-0.5, 0.5), rng.vfx.uniform(-2, -0.5)),
                         6, 40
                     )
             elif current_area.area_type == "ice":
                 # Snow particles
                 for _ in range(4):
-                    x = area_world_x + random.randint(0, AREA_WIDTH)
-                    y = area_world_y + random.randint(0, AREA_HEIGHT)
+                    x = area_world_x + rng.vfx.randint(0, AREA_WIDTH)
+                    y = area_world_y + rng.vfx.randint(0, AREA_HEIGHT)
                     game.particle_system.add_particle(
                         x, y, (200, 220, 255),
-                        (random.uniform(-0.3, 0.3), random.uniform(0.5, 1.5)),
+                        (rng.vfx.uniform(-0.3, 0.3), rng.vfx.uniform(0.5, 1.5)),
                         4, 50
                     )
             elif current_area.area_type == "swamp":
                 # Mist particles
                 for _ in range(3):
-                    x = area_world_x + random.randint(0, AREA_WIDTH)
-                    y = area_world_y + random.randint(0, AREA_HEIGHT)
+                    x = area_world_x + rng.vfx.randint(0, AREA_WIDTH)
+                    y = area_world_y + rng.vfx.randint(0, AREA_HEIGHT)
                     game.particle_system.add_particle(
                         x, y, (150, 180, 150),
-                        (random.uniform(-0.2, 0.2), random.uniform(-0.2, 0.2)),
+                        (rng.vfx.uniform(-0.2, 0.2), rng.vfx.uniform(-0.2, 0.2)),
                         5, 60
                     )
             elif current_area.area_type == "forest":
                 # Leaf particles
                 for _ in range(4):
-                    x = area_world_x + random.randint(0, AREA_WIDTH)
-                    y = area_world_y + random.randint(0, AREA_HEIGHT)
+                    x = area_world_x + rng.vfx.randint(0, AREA_WIDTH)
+                    y = area_world_y + rng.vfx.randint(0, AREA_HEIGHT)
                     game.particle_system.add_particle(
                         x, y, (100, 150, 50),
-                        (random.uniform(-0.3, 0.3), random.uniform(-0.5, -0.1)),
+                        (rng.vfx.uniform(-0.3, 0.3), rng.vfx.uniform(-0.5, -0.1)),
                         5, 45
                     )
             elif current_area.area_type == "desert":
                 # Sand particles
                 for _ in range(6):
-                    x = area_world_x + random.randint(0, AREA_WIDTH)
-                    y = area_world_y + random.randint(0, AREA_HEIGHT)
+                    x = area_world_x + rng.vfx.randint(0, AREA_WIDTH)
+                    y = area_world_y + rng.vfx.randint(0, AREA_HEIGHT)
                     game.particle_system.add_particle(
                         x, y, (200, 180, 120),
-                        (random.uniform(-1, 1), random.uniform(-0.5, 0.5)),
+                        (rng.vfx.uniform(-1, 1), rng.vfx.uniform(-0.5, 0.5)),
                         4, 35
                     )
             elif current_area.area_type == "mountain":
                 # Wind particles
                 for _ in range(3):
-                    x = area_world_x + random.randint(0, AREA_WIDTH)
-                    y = area_world_y + random.randint(0, AREA_HEIGHT)
+                    x = area_world_x + rng.vfx.randint(0, AREA_WIDTH)
+                    y = area_world_y + rng.vfx.randint(0, AREA_HEIGHT)
                     game.particle_system.add_particle(
                         x, y, (180, 180, 200),
-                        (random.uniform(-0.8, 0.8), random.uniform(-0.3, 0.3)),
+                        (rng.vfx.uniform(-0.8, 0.8), rng.vfx.uniform(-0.3, 0.3)),
                         4, 40
                     )
             elif current_area.area_type == "beach":
                 # Sea foam particles
                 for _ in range(4):
-                    x = area_world_x + random.randint(0, AREA_WIDTH)
-                    y = area_world_y + random.randint(0, AREA_HEIGHT)
+                    x = area_world_x + rng.vfx.randint(0, AREA_WIDTH)
+                    y = area_world_y + rng.vfx.randint(0, AREA_HEIGHT)
                     game.particle_system.add_particle(
                         x, y, (220, 240, 255),
-                        (random.uniform(-0.4, 0.4), random.uniform(-0.2, 0.2)),
+                        (rng.vfx.uniform(-0.4, 0.4), rng.vfx.uniform(-0.2, 0.2)),
                         5, 55
                     )
             elif current_area.area_type == "castle":
                 # Magic sparkles
                 for _ in range(3):
-                    x = area_world_x + random.randint(0, AREA_WIDTH)
-                    y = area_world_y + random.randint(0, AREA_HEIGHT)
+                    x = area_world_x + rng.vfx.randint(0, AREA_WIDTH)
+                    y = area_world_y + rng.vfx.randint(0, AREA_HEIGHT)
                     game.particle_system.add_particle(
                         x, y, (255, 215, 0),
-                        (random.uniform(-0.2, 0.2), random.uniform(-0.2, 0.2)),
+                        (rng.vfx.uniform(-0.2, 0.2), rng.vfx.uniform(-0.2, 0.2)),
                         4, 50
                     )
             elif current_area.area_type == "cave":
                 # Dust particles
                 for _ in range(2):
-                    x = area_world_x + random.randint(0, AREA_WIDTH)
-                    y = area_world_y + random.randint(0, AREA_HEIGHT)
+                    x = area_world_x + rng.vfx.randint(0, AREA_WIDTH)
+                    y = area_world_y + rng.vfx.randint(0, AREA_HEIGHT)
                     game.particle_system.add_particle(
                         x, y, (100, 100, 120),
-                        (random.uniform(-0.1, 0.1), random.uniform(-0.1, 0.1)),
+                        (rng.vfx.uniform(-0.1, 0.1), rng.vfx.uniform(-0.1, 0.1)),
                         3, 70
                     )
             elif current_area.area_type == "town":
@@ -301,8 +295,6 @@ def reset_game_state(game):
     Args:
         game: The main Game instance
     """
-    game.enemies = []
-    game.items = []
     game.score = 0
     game.game_time = 0
     game.spawn_timer = 0
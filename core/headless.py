@@ -0,0 +1,311 @@
+"""
+DRAGON'S LAIR RPG - Headless Soak Runner Module
+===============================================
+
+This module runs the game without a window for long soak tests.
+It is started with:
+
+    python -m main --headless --ticks 216000 --render-every 60
+
+The runner:
+- Expects SDL's dummy video/audio drivers (main.py sets them before pygame starts)
+- Calls Game.update() as fast as possible (no clock.tick(FPS) wait)
+- Skips Game.draw() entirely, or draws only every Nth tick
+- Lets a bot "press keys" and "click buttons" through the normal event code
+- Prints ticks per second, memory growth and state-transition counts at the end
+
+FOR NOVICE CODERS:
+==================
+A bot is any object with an act(game) method that returns
+(keys, mouse_pos, mouse_click):
+- keys: list of pygame key codes to press this tick (can be empty)
+- mouse_pos: where the pretend mouse pointer is
+- mouse_click: True to click at that position
+
+Pass your own bot with --bot my_module:MyBot.
+"""
+
+import gc
+import importlib
+import os
+import random
+import sys
+import time
+import traceback
+from collections import Counter
+
+import pygame
+from config.constants import *
+from core import engine
+from core.game_events import handle_events, handle_button_clicks
+from systems.rng import rng
+
+
+# Battle menu options (same order as BattleScreen.handle_action)
+BATTLE_ATTACK, BATTLE_MAGIC, BATTLE_ITEM, BATTLE_RUN = range(4)
+
+
+class IdleBot:
+    """Bot that never presses anything (measures the cost of an idle game)"""
+
+    def act(self, game):
+        """Return no input"""
+        return [], (0, 0), False
+
+
+class RandomBot:
+    """
+    Random Bot - Walks around at random, fights and uses items
+
+    It clicks through the menus, skips the cutscene, random-walks in the
+    overworld (so enemies catch it and battles start) and picks battle
+    actions at random, mostly attacking.
+
+    Attributes:
+        rng (random.Random): The bot's own random numbers (seeded, repeatable)
+        think_interval (int): Ticks between decisions (lets animations play)
+        battle_weights (list): Chance of attack, magic, item, run
+    """
+
+    def __init__(self, seed=None, think_interval=8):
+        self.rng = random.Random(seed)
+        self.think_interval = think_interval
+        self.battle_weights = [60, 20, 15, 5]
+        self.direction = pygame.K_RIGHT
+        self.ticks = 0
+
+    def act(self, game):
+        """Decide this tick's key presses and mouse click"""
+        self.ticks += 1
+        if self.ticks % self.think_interval:
+            return [], (0, 0), False
+
+        if game.state == "start_menu":
+            return [], game.start_screen.start_button.rect.center, True
+        if game.state == "opening_cutscene":
+            return [pygame.K_SPACE], (0, 0), False
+        if game.state == "character_select":
+            button = self.rng.choice([game.start_screen.warrior_button,
+                                      game.start_screen.mage_button,
+                                      game.start_screen.rogue_button])
+            return [], button.rect.center, True
+        if game.state == "overworld":
+            return self.walk(game), (0, 0), False
+        if game.state == "battle":
+            return self.fight(game), (0, 0), False
+        if game.state in ("game_over", "victory"):
+            return [], game.start_button.rect.center, True
+        return [], (0, 0), False
+
+    def walk(self, game):
+        """Random-walk, mostly keeping the same direction"""
+        current_area = game.world_map.get_current_area()
+        if current_area and current_area.cutscene_active:
+            return [pygame.K_SPACE]
+        if self.rng.random() < 0.25:
+            self.direction = self.rng.choice([pygame.K_UP, pygame.K_DOWN,
+                                              pygame.K_LEFT, pygame.K_RIGHT])
+        return [self.direction]
+
+    def fight(self, game):
+        """Pick a battle action and move the menu selection to it"""
+        battle = game.battle_screen
+        if battle is None:
+            return []
+        if battle.waiting_for_continue or (battle.battle_ended and battle.show_summary):
+            return [pygame.K_RETURN]
+        if battle.state != "player_turn" or battle.battle_ended or battle.action_cooldown:
+            return []
+        option = self.rng.choices(range(4), weights=self.battle_weights)[0]
+        steps = (option - battle.selected_option) % 4
+        return [pygame.K_RIGHT] * steps + [pygame.K_RETURN]
+
+
+# Bots that can be picked by name with --bot
+BOTS = {
+    "random": RandomBot,
+    "idle": IdleBot,
+}
+
+
+def load_bot(spec, seed=None):
+    """
+    Create a bot from a name in BOTS or a "module:ClassName" path
+
+    Bots from BOTS get the seed; custom bot classes are created without arguments.
+    """
+    if spec in BOTS:
+        return BOTS[spec](seed=seed) if spec == "random" else BOTS[spec]()
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        raise ValueError(f"Unknown bot '{spec}' (use one of {sorted(BOTS)} or module:Class)")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+def memory_usage_mb():
+    """Current resident memory of this process in MB (peak memory if unknown)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS reports bytes
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        return 0.0
+
+
+class HeadlessRunner:
+    """
+    Headless Runner - Drives a Game with a bot, uncapped, without a window
+
+    Attributes:
+        game (Game): The game being soaked
+        bot: Object with act(game) -> (keys, mouse_pos, mouse_click)
+        render_every (int): Draw every Nth tick (0 = never draw)
+        ticks (int): Simulation ticks run so far
+        transitions (Counter): (from_state, to_state) -> how many times it happened
+        memory_samples (list): (tick, resident MB, live Python objects)
+        error (str): Traceback if the game crashed, otherwise None
+        recorder (InputRecorder): Records the bot's input for replays (optional)
+    """
+
+    def __init__(self, game, bot, render_every=0, sample_every=3600, recorder=None):
+        self.game = game
+        self.bot = bot
+        self.recorder = recorder
+        self.render_every = render_every
+        self.sample_every = sample_every
+        self.ticks = 0
+        self.frames_drawn = 0
+        self.transitions = Counter()
+        self.state_ticks = Counter()
+        self.memory_samples = []
+        self.error = None
+        self.elapsed = 0.0
+
+    def sample_memory(self):
+        """Record resident memory and live object count at the current tick"""
+        self.memory_samples.append((self.ticks, memory_usage_mb(), len(gc.get_objects())))
+
+    def press_keys(self, keys):
+        """Queue KEYDOWN/KEYUP events so the normal event code handles them"""
+        for key in keys:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+            pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0))
+
+    def step(self):
+        """Run one tick: bot input, events, button clicks, update and maybe draw"""
+        game = self.game
+        keys, mouse_pos, mouse_click = self.bot.act(game)
+        self.press_keys(keys)
+
+        previous_state = game.state
+        events = pygame.event.get()
+        running, _, _ = handle_events(game, engine.screen, events)
+        handle_button_clicks(game, mouse_pos, mouse_click)
+        game.update()
+
+        # Same as Game.run: victory returns to the menu once its music ends
+        victory_done = game.state == "victory" and not game.music.is_playing()
+        if victory_done:
+            game.state = "start_menu"
+            game.music.update(game.state)
+        if self.recorder:
+            self.recorder.record_frame(game, events, mouse_pos, mouse_click, 1, victory_done)
+
+        if game.state != previous_state:
+            self.transitions[(previous_state, game.state)] += 1
+        self.state_ticks[game.state] += 1
+        self.ticks += 1
+
+        if self.render_every and self.ticks % self.render_every == 0:
+            game.draw(engine.screen)
+            game.present_frame()
+            self.frames_drawn += 1
+        return running
+
+    def run(self, ticks):
+        """
+        Run up to `ticks` ticks as fast as possible
+
+        Returns:
+            bool: True if the run finished without the game crashing
+        """
+        gc.collect()
+        self.sample_memory()
+        start = time.perf_counter()
+        try:
+            while self.ticks < ticks:
+                if not self.step():
+                    break
+                if self.sample_every and self.ticks % self.sample_every == 0:
+                    self.sample_memory()
+        except Exception:
+            self.error = traceback.format_exc()
+        self.elapsed = time.perf_counter() - start
+        gc.collect()
+        self.sample_memory()
+        return self.error is None
+
+    def report(self):
+        """Return the soak results as printable text"""
+        ticks_per_second = self.ticks / self.elapsed if self.elapsed else 0.0
+        first, last = self.memory_samples[0], self.memory_samples[-1]
+        peak_mb = max(sample[1] for sample in self.memory_samples)
+        lines = [
+            "📊 HEADLESS SOAK REPORT",
+            f"   Ticks: {self.ticks} in {self.elapsed:.1f}s ({ticks_per_second:.0f} ticks/s, "
+            f"{ticks_per_second / SIM_TICK_RATE:.1f}x real time)",
+            f"   Frames drawn: {self.frames_drawn}",
+            f"   Memory: {first[1]:.1f} MB -> {last[1]:.1f} MB "
+            f"({last[1] - first[1]:+.1f} MB, peak {peak_mb:.1f} MB)",
+            f"   Python objects: {first[2]} -> {last[2]} ({last[2] - first[2]:+d})",
+            "   Time in each state (ticks):",
+        ]
+        for state, count in self.state_ticks.most_common():
+            lines.append(f"      {state:<18} {count}")
+        lines.append("   State transitions:")
+        for (old, new), count in sorted(self.transitions.items()):
+            lines.append(f"      {old:>18} -> {new:<18} {count}")
+        if self.error:
+            lines.append(f"❌ Crashed at tick {self.ticks}:")
+            lines.append(self.error)
+        return "\n".join(lines)
+
+
+def run_headless(ticks=SIM_TICK_RATE * 60 * 10, render_every=0, bot="random", seed=None, record=None,
+                 horde=HORDE_MODE):
+    """
+    Create a Game, soak it with a bot and print the report
+
+    Args:
+        ticks (int): How many simulation ticks to run (default: 10 game minutes)
+        render_every (int): Draw every Nth tick (0 = never)
+        bot (str): Bot name from BOTS or "module:Class"
+        seed (int): Seed for the game's and the bot's random numbers (random if None)
+        record (str): Save the bot's input to this replay file (optional)
+        horde (bool): Fill the non-town areas with enemy hordes
+
+    Returns:
+        int: Process exit code (0 = ok, 1 = the game crashed)
+    """
+    from core.game import Game
+    from core.replay import InputRecorder
+
+    seed = rng.reseed(seed)
+    game = Game(dirty_rects=False, music_workers=0, horde=horde)  # Every track ready before tick 0
+    recorder = InputRecorder(record, seed, horde) if record else None
+    runner = HeadlessRunner(game, load_bot(bot, seed), render_every=render_every, recorder=recorder)
+    print(f"🤖 Soaking {ticks} ticks with the '{bot}' bot, seed {seed} "
+          f"({'no drawing' if not render_every else f'drawing every {render_every} ticks'})...")
+    ok = runner.run(ticks)
+    print(runner.report())
+    if recorder:
+        recorder.save()
+    game.music.shutdown()  # Joins the stem mixer thread before pygame goes away
+    return 0 if ok else 1
@@ -0,0 +1,266 @@
+"""
+DRAGON'S LAIR RPG - Input Recording and Replay Module
+=====================================================
+
+This module records the input of a play session to a small file and plays
+it back exactly, without a window, as fast as the computer can go.
+
+    python -m main --seed 42 --record session.replay     (play and record)
+    python -m main --headless --seed 42 --record bot.replay  (let the bot play)
+    python -m main --replay session.replay               (replay headless)
+
+HOW IT STAYS EXACT:
+===================
+- Every random number used by the game comes from systems.rng, and the
+  recording stores the seed, so the replay gets the same random numbers
+- For every frame the recording stores how many fixed simulation steps ran,
+  which keys and mouse buttons were pressed, and where clicks happened
+- Every CHECKSUM_INTERVAL frames a checksum of the game state is stored;
+  the replay compares its own checksums and reports the first frame that
+  differs (a "desync"), which points straight at non-deterministic code
+
+Drawing uses its own random stream and isn't part of the checksum, so a
+replay can skip drawing entirely and still match. That makes one recorded
+session a repeatable benchmark workload.
+
+FOR NOVICE CODERS:
+==================
+Think of it like a player piano roll: instead of recording the sound, we
+record which keys were pressed and when. Playing the roll back on the same
+piano gives the same song - every time.
+
+The file is gzip-compressed JSON. Frames where nothing was pressed only
+cost one number (their step count), so an hour of play is a few KB.
+"""
+
+import gzip
+import json
+import zlib
+
+import pygame
+from config.constants import *
+from core import engine
+from core.game_events import handle_events, handle_button_clicks
+from core.headless import HeadlessRunner
+from systems.rng import rng
+
+# Bump when the file layout changes
+REPLAY_FORMAT_VERSION = 1
+
+# Frames between stored state checksums
+CHECKSUM_INTERVAL = 60
+
+
+def state_checksum(game):
+    """
+    Return a CRC32 of everything the gameplay depends on
+
+    Positions, stats, timers, the battle state and the gameplay random
+    streams are included. Animation bobbing and the render random stream
+    are not, since they depend on drawing and the wall clock.
+    """
+    parts = [game.state, game.score, game.game_time, game.spawn_timer, game.item_timer,
+             game.movement_cooldown, game.transition_state, game.particle_system.count]
+    player = game.player
+    if player:
+        parts.append((player.type, player.x, player.y, player.health, player.mana,
+                      player.level, player.exp, player.kills))
+    parts.extend((enemy.name, enemy.x, enemy.y, enemy.health) for enemy in game.enemies)
+    parts.extend((item.type, item.x, item.y) for item in game.items)
+    battle = game.battle_screen
+    if battle:
+        parts.append((battle.state, battle.result, battle.battle_ended,
+                      battle.player.health, battle.enemy.health))
+    parts.append([rng.spawning.getstate(), rng.ai.getstate(),
+                  rng.combat.getstate(), rng.vfx.getstate()])
+    return zlib.crc32(repr(parts).encode("utf-8"))
+
+
+def encode_event(event):
+    """Turn a pygame event into a small list (None for events the game ignores)"""
+    if event.type == pygame.KEYDOWN:
+        return ["k", event.key]
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        return ["m", event.pos[0], event.pos[1], event.button]
+    if event.type == pygame.QUIT:
+        return ["q"]
+    return None
+
+
+def decode_event(data):
+    """Turn a list made by encode_event back into a pygame event"""
+    if data[0] == "k":
+        return pygame.event.Event(pygame.KEYDOWN, key=data[1], mod=0, unicode="", scancode=0)
+    if data[0] == "m":
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(data[1], data[2]), button=data[3])
+    return pygame.event.Event(pygame.QUIT)
+
+
+class InputRecorder:
+    """
+    Input Recorder - Captures the input of every frame
+
+    Attributes:
+        path (str): File the recording is saved to
+        seed (int): The rng seed the session started with
+        horde (bool): Whether the session ran in horde mode
+        steps (list): Simulation steps run in each frame
+        inputs (dict): Frame number -> [events, click position or None, victory_done]
+        checksums (dict): Frame number -> state checksum
+    """
+
+    def __init__(self, path, seed, horde=False):
+        self.path = path
+        self.seed = seed
+        self.horde = horde
+        self.steps = []
+        self.inputs = {}
+        self.checksums = {}
+
+    def record_frame(self, game, events, mouse_pos, mouse_click, steps, victory_done=False):
+        """Store one frame's input (call after the frame's updates have run)"""
+        frame = len(self.steps)
+        self.steps.append(steps)
+        encoded = [data for data in (encode_event(event) for event in events) if data]
+        if encoded or mouse_click or victory_done:
+            click = list(mouse_pos) if mouse_click else None
+            self.inputs[frame] = [encoded, click, victory_done]
+        if frame % CHECKSUM_INTERVAL == 0:
+            self.checksums[frame] = state_checksum(game)
+
+    def save(self):
+        """Write the recording as gzip-compressed JSON"""
+        data = {
+            "version": REPLAY_FORMAT_VERSION,
+            "seed": self.seed,
+            "horde": self.horde,
+            "tick_rate": SIM_TICK_RATE,
+            "steps": self.steps,
+            "inputs": {str(frame): value for frame, value in self.inputs.items()},
+            "checksums": {str(frame): value for frame, value in self.checksums.items()},
+        }
+        with gzip.open(self.path, "wt", encoding="utf-8") as replay_file:
+            json.dump(data, replay_file, separators=(",", ":"))
+        print(f"💾 Recorded {len(self.steps)} frames ({sum(self.steps)} ticks) to {self.path}")
+
+
+class Replay:
+    """
+    Replay - A loaded recording
+
+    Attributes:
+        seed (int): The rng seed to start from
+        horde (bool): Whether to replay in horde mode
+        steps (list): Simulation steps of each frame
+        inputs (dict): Frame number -> [events, click position or None, victory_done]
+        checksums (dict): Frame number -> expected state checksum
+    """
+
+    def __init__(self, data):
+        if data.get("version") != REPLAY_FORMAT_VERSION:
+            raise ValueError(f"Unsupported replay version {data.get('version')}")
+        if data["tick_rate"] != SIM_TICK_RATE:
+            print(f"⚠️ Replay was recorded at {data['tick_rate']} ticks/s, "
+                  f"the game now runs at {SIM_TICK_RATE} - it will probably desync")
+        self.seed = data["seed"]
+        self.horde = data.get("horde", False)
+        self.steps = data["steps"]
+        self.inputs = {int(frame): value for frame, value in data["inputs"].items()}
+        self.checksums = {int(frame): value for frame, value in data["checksums"].items()}
+
+    @classmethod
+    def load(cls, path):
+        """Read a recording saved by InputRecorder"""
+        with gzip.open(path, "rt", encoding="utf-8") as replay_file:
+            return cls(json.load(replay_file))
+
+    def frame_input(self, frame):
+        """Return (events, mouse_pos, mouse_click, victory_done) for a frame"""
+        events, click, victory_done = self.inputs.get(frame, ([], None, False))
+        mouse_pos = tuple(click) if click else (0, 0)
+        return [decode_event(data) for data in events], mouse_pos, click is not None, victory_done
+
+
+class ReplayRunner(HeadlessRunner):
+    """
+    Replay Runner - Plays a recording back headless, as fast as possible
+
+    Works like HeadlessRunner (same report), but input comes from the
+    recording and each step() replays one recorded frame.
+
+    Attributes:
+        replay (Replay): The recording being played
+        frame (int): Next frame to play
+        desync_frame (int): First frame whose checksum didn't match (None = in sync)
+        checked (int): How many checksums were compared
+    """
+
+    def __init__(self, game, replay, render_every=0, sample_every=3600):
+        super().__init__(game, bot=None, render_every=render_every, sample_every=sample_every)
+        self.replay = replay
+        self.frame = 0
+        self.desync_frame = None
+        self.checked = 0
+
+    def step(self):
+        """Replay one frame; returns False when the recording has ended"""
+        if self.frame >= len(self.replay.steps):
+            return False
+        game = self.game
+        events, mouse_pos, mouse_click, victory_done = self.replay.frame_input(self.frame)
+
+        previous_state = game.state
+        handle_events(game, engine.screen, events)
+        handle_button_clicks(game, mouse_pos, mouse_click)
+        for _ in range(self.replay.steps[self.frame]):
+            game.update()
+            self.ticks += 1
+            self.state_ticks[game.state] += 1
+        if victory_done:
+            game.state = "start_menu"
+            game.music.update(game.state)
+        if game.state != previous_state:
+            self.transitions[(previous_state, game.state)] += 1
+
+        expected = self.replay.checksums.get(self.frame)
+        if expected is not None:
+            self.checked += 1
+            if self.desync_frame is None and state_checksum(game) != expected:
+                self.desync_frame = self.frame
+
+        if self.render_every and self.frame % self.render_every == 0:
+            game.draw(engine.screen)
+            game.present_frame()
+            self.frames_drawn += 1
+        self.frame += 1
+        return True
+
+    def report(self):
+        """HeadlessRunner's report plus the determinism check"""
+        lines = [super().report()]
+        if self.desync_frame is None:
+            lines.append(f"✅ In sync: {self.checked} checksums matched over {self.frame} frames")
+        else:
+            lines.append(f"❌ DESYNC first seen at frame {self.desync_frame} "
+                         f"(checksums are stored every {CHECKSUM_INTERVAL} frames)")
+        return "\n".join(lines)
+
+
+def run_replay(path, render_every=0):
+    """
+    Load a recording, replay it headless and print the report
+
+    Returns:
+        int: Process exit code (0 = replayed in sync, 1 = crash or desync)
+    """
+    from core.game import Game
+
+    replay = Replay.load(path)
+    rng.reseed(replay.seed)
+    game = Game(dirty_rects=False, music_workers=0, horde=replay.horde)  # Every track ready before tick 0
+    runner = ReplayRunner(game, replay, render_every=render_every)
+    print(f"▶️ Replaying {len(replay.steps)} frames ({sum(replay.steps)} ticks) from {path}...")
+    ok = runner.run(float("inf"))
+    print(runner.report())
+    game.music.shutdown()  # Joins the stem mixer thread before pygame goes away
+    return 0 if ok and runner.desync_frame is None else 1
@@ -14,10 +14,11 @@ The module provides:
 """
 
 import pygame
-import random
 import math
 from entities.enemy import Enemy
 from config.constants import *
+from systems.rng import rng
+from systems.glow_cache import glow_cache
 
 
 class DragonBoss(Enemy):
@@ -98,8 +99,8 @@ class DragonBoss(Enemy):
         if self.attack_animation > 0:
             offset_x = 10 * math.sin(self.attack_animation * 0.2)
         if self.hit_animation > 0:
-            offset_x = random.randint(-4, 4)
-            offset_y = random.randint(-4, 4)
+            offset_x = rng.render.randint(-4, 4)
+            offset_y = rng.render.randint(-4, 4)
             
         x = self.x + offset_x
         y = self.y + offset_y
@@ -109,16 +110,15 @@ class DragonBoss(Enemy):
             aura_intensity = self.evolution_effects.get('aura_intensity', 0.3)
             if aura_intensity > 0:
                 aura_alpha = int(50 * aura_intensity)
-                aura_surf = pygame.Surface((200, 200), pygame.SRCALPHA)
-                pygame.draw.circle(aura_surf, (*self.dragon_color, aura_alpha), (100, 100), 80)
-                surface.blit(aura_surf, (x - 20, y - 20))
+                # Radius 80 circle centered 100px into a 200px box at (x - 20, y - 20)
+                aura_surf = glow_cache.circle(80, (*self.dragon_color, aura_alpha))
+                surface.blit(aura_surf, (x, y))
         
         # Evolution flash effect
         if self.evolution_flash_timer > 0:
             flash_alpha = int(100 * (self.evolution_flash_timer / 30))
-            flash_surf = pygame.Surface((200, 200), pygame.SRCALPHA)
-            pygame.draw.circle(flash_surf, (255, 255, 255, flash_alpha), (100, 100), 90)
-            surface.blit(flash_surf, (x - 20, y - 20))
+            flash_surf = glow_cache.circle(90, (255, 255, 255, flash_alpha))
+            surface.blit(flash_surf, (x - 10, y - 10))
         
         # --- Draw a detailed dragon-like boss, facing left ---
         
@@ -210,13 +210,13 @@ class DragonBoss(Enemy):
             
             for i in range(particle_count):
                 t = i / particle_count
-                fx = int(mouth_x * (1-t) + player_x * t + random.randint(-10, 10))
-                fy = int(mouth_y * (1-t) + player_y * t + random.randint(-10, 10))
+                fx = int(mouth_x * (1-t) + player_x * t + rng.render.randint(-10, 10))
+                fy = int(mouth_y * (1-t) + player_y * t + rng.render.randint(-10, 10))
                 size = int(10 * (1-t) + 40 * t * fire_size_mult)
-                color = (255, 140 + random.randint(0, 100), 0, max(0, 200 - i * 6))
+                # Green is rounded to steps of 10 so the glow cache stays small
+                color = (255, 140 + rng.render.randint(0, 100) // 10 * 10, 0, max(0, 200 - i * 6))
                 
-                fire_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-                pygame.draw.circle(fire_surf, color, (size, size), size)
+                fire_surf = glow_cache.circle(size, color)
                 surface.blit(fire_surf, (fx - size, fy - size))
         
         # Health bar with boss styling
@@ -327,24 +327,23 @@ class BossDragon(Enemy):
         if self.attack_animation > 0:
             offset_x = 10 * math.sin(self.attack_animation * 0.2)
         if self.hit_animation > 0:
-            offset_x = random.randint(-4, 4)
-            offset_y = random.randint(-4, 4)
+            offset_x = rng.render.randint(-4, 4)
+            offset_y = rng.render.randint(-4, 4)
             
         x = self.x + offset_x
         y = self.y + offset_y
         
         # Draw enhanced aura effect for final boss
         aura_alpha = int(50 + 30 * math.sin(self.aura_timer * 0.1))
-        aura_surf = pygame.Surface((200, 200), pygame.SRCALPHA)
-        pygame.draw.circle(aura_surf, (*self.aura_color, aura_alpha), (100, 100), 80)
-        surface.blit(aura_surf, (x - 20, y - 20))
+        # Radius 80 circle centered 100px into a 200px box at (x - 20, y - 20)
+        aura_surf = glow_cache.circle(80, (*self.aura_color, aura_alpha))
+        surface.blit(aura_surf, (x, y))
         
         # Evolution flash effect
         if self.evolution_flash_timer > 0:
             flash_alpha = int(150 * (self.evolution_flash_timer / 30))
-            flash_surf = pygame.Surface((200, 200), pygame.SRCALPHA)
-            pygame.draw.circle(flash_surf, (255, 215, 0, flash_alpha), (100, 100), 90)
-            surface.blit(flash_surf, (x - 20, y - 20))
+            flash_surf = glow_cache.circle(90, (255, 215, 0, flash_alpha))
+            surface.blit(flash_surf, (x - 10, y - 10))
         
         # --- Draw the ultimate dragon boss, facing left ---
         
@@ -427,13 +426,13 @@ class BossDragon(Enemy):
             
             for i in range(60):  # Maximum particle count
                 t = i / 60
-                fx = int(mouth_x * (1-t) + player_x * t + random.randint(-10, 10))
-                fy = int(mouth_y * (1-t) + player_y * t + random.randint(-10, 10))
+                fx = int(mouth_x * (1-t) + player_x * t + rng.render.randint(-10, 10))
+                fy = int(mouth_y * (1-t) + player_y * t + rng.render.randint(-10, 10))
                 size = int(10 * (1-t) + 40 * t * 2.5)  # Maximum fire breath size
-                color = (255, 140 + random.randint(0, 100), 0, max(0, 200 - i * 6))
+                # Green is rounded to steps of 10 so the glow cache stays small
+                color = (255, 140 + rng.render.randint(0, 100) // 10 * 10, 0, max(0, 200 - i * 6))
                 
-                fire_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-                pygame.draw.circle(fire_surf, color, (size, size), size)
+                fire_surf = glow_cache.circle(size, color)
                 surface.blit(fire_surf, (fx - size, fy - size))
         
         # Enhanced health bar for final boss
@@ -11,6 +11,7 @@ RESOURCE: This module provides the DarkKnight class for use in battle encounters
 import pygame
 import random
 from config.constants import *
+from systems.sprite_baker import SpriteBaker
 
 class DarkKnight:
     """
@@ -73,9 +74,18 @@ class DarkKnight:
         if not self.visible:
             return
             
-        # Base position with animation offset
-        knight_x = self.x
-        knight_y = self.y + self.animation_offset
+        # Base position with animation offset (the bob only moves the baked sprite)
+        self.sprite_baker.draw(self, surface, self.x, self.y + self.animation_offset)
+    
+    def _draw_body(self, surface, knight_x, knight_y):
+        """
+        Draw the dark knight's armor, helmet, sword and shield procedurally at (knight_x, knight_y)
+        
+        Args:
+            surface (pygame.Surface): The surface to draw on
+            knight_x (int): X position to draw at
+            knight_y (int): Y position to draw at
+        """
         knight_w = self.width
         knight_h = self.height
         
@@ -201,6 +211,9 @@ class DarkKnight:
         pygame.draw.circle(surface, (80, 20, 20), (shield_x, shield_y), 4)
         pygame.draw.circle(surface, (120, 40, 40), (shield_x, shield_y), 2)
     
+    # The dark knight always looks the same, so one baked image is enough
+    sprite_baker = SpriteBaker(_draw_body, size=(140, 160), origin=(50, 50))
+    
     def draw_dialogue(self, surface):
         """
         Draw the dark knight's dialogue box
@@ -9,6 +9,8 @@ import pygame
 import random
 import math
 from config.constants import *
+from systems.glow_cache import glow_cache
+from systems.sprite_baker import SpriteBaker
 
 class Dragon:
     """
@@ -26,74 +28,82 @@ class Dragon:
         
     def draw(self, surface):
         """Draw the detailed dragon with animations"""
+        # Body and wings come from the baked sprite cache (one image per wing position)
+        self.sprite_baker.draw(self, surface, self.x, self.y)
+        
+        # Fire breathing effect
+        if self.fire_active:
+            for i in range(15):
+                fire_size = 5 + i * 1.5
+                alpha = max(0, 200 - i * 10)
+                fire_color = (255, 215, 0, alpha)
+                
+                fire_surf = glow_cache.circle(fire_size, fire_color)
+                surface.blit(
+                    fire_surf, 
+                    (
+                        self.x + 180 + 35 + i*15 + self.fire_frame*2, 
+                        self.y + 40
+                    )
+                )
+        
+        self.animation_frame += self.flap_speed
+        
+    def _draw_body(self, surface, x, y):
+        """Draw the dragon's body, wings and tail procedurally at (x, y)"""
         # Main dragon body
-        pygame.draw.ellipse(surface, DRAGON_COLOR, (self.x, self.y + 30, 180, 70))
-        pygame.draw.circle(surface, DRAGON_COLOR, (self.x + 180, self.y + 50), 35)
+        pygame.draw.ellipse(surface, DRAGON_COLOR, (x, y + 30, 180, 70))
+        pygame.draw.circle(surface, DRAGON_COLOR, (x + 180, y + 50), 35)
         
         # Dragon eye
-        pygame.draw.circle(surface, (255, 255, 255), (self.x + 195, self.y + 45), 10)
-        pygame.draw.circle(surface, (0, 0, 0), (self.x + 195, self.y + 45), 5)
+        pygame.draw.circle(surface, (255, 255, 255), (x + 195, y + 45), 10)
+        pygame.draw.circle(surface, (0, 0, 0), (x + 195, y + 45), 5)
         
         # Dragon horns
         pygame.draw.polygon(surface, (200, 100, 50), [
-            (self.x + 180, self.y + 25),
-            (self.x + 190, self.y + 10),
-            (self.x + 195, self.y + 20)
+            (x + 180, y + 25),
+            (x + 190, y + 10),
+            (x + 195, y + 20)
         ])
         pygame.draw.polygon(surface, (200, 100, 50), [
-            (self.x + 205, self.y + 25),
-            (self.x + 215, self.y + 10),
-            (self.x + 210, self.y + 20)
+            (x + 205, y + 25),
+            (x + 215, y + 10),
+            (x + 210, y + 20)
         ])
         
         # Animated wings
         wing_y_offset = math.sin(self.animation_frame) * 12
         pygame.draw.polygon(surface, (200, 50, 50), [
-            (self.x + 40, self.y + 50),
-            (self.x, self.y + 15 + wing_y_offset),
-            (self.x + 50, self.y + 30)
+            (x + 40, y + 50),
+            (x, y + 15 + wing_y_offset),
+            (x + 50, y + 30)
         ])
         pygame.draw.polygon(surface, (200, 50, 50), [
-            (self.x + 40, self.y + 50),
-            (self.x, self.y + 85 - wing_y_offset),
-            (self.x + 50, self.y + 70)
+            (x + 40, y + 50),
+            (x, y + 85 - wing_y_offset),
+            (x + 50, y + 70)
         ])
         
         # Dragon tail
         pygame.draw.polygon(surface, DRAGON_COLOR, [
-            (self.x, self.y + 50),
-            (self.x - 50, self.y + 20),
-            (self.x - 50, self.y + 80)
+            (x, y + 50),
+            (x - 50, y + 20),
+            (x - 50, y + 80)
         ])
         
         # Tail spikes
         for i in range(3):
             offset = i * 15
             pygame.draw.polygon(surface, (200, 50, 50), [
-                (self.x - 50 + offset, self.y + 50 - offset//2),
-                (self.x - 55 + offset, self.y + 40 - offset//2),
-                (self.x - 45 + offset, self.y + 40 - offset//2)
+                (x - 50 + offset, y + 50 - offset//2),
+                (x - 55 + offset, y + 40 - offset//2),
+                (x - 45 + offset, y + 40 - offset//2)
             ])
-        
-        # Fire breathing effect
-        if self.fire_active:
-            for i in range(15):
-                fire_size = 5 + i * 1.5
-                alpha = max(0, 200 - i * 10)
-                fire_color = (255, 215, 0, alpha)
-                
-                fire_surf = pygame.Surface((fire_size*2, fire_size*2), pygame.SRCALPHA)
-                pygame.draw.circle(fire_surf, fire_color, (fire_size, fire_size), fire_size)
-                surface.blit(
-                    fire_surf, 
-                    (
-                        self.x + 180 + 35 + i*15 + self.fire_frame*2, 
-                        self.y + 40
-                    )
-                )
-        
-        self.animation_frame += self.flap_speed
-        
+    
+    # The wings flap through one full sin() cycle, baked as 64 positions
+    sprite_baker = SpriteBaker(_draw_body, size=(340, 160), origin=(70, 30),
+                               dimensions={"animation_frame": (2 * math.pi / 64, 2 * math.pi)})
+    
     def breathe_fire(self):
         """Activate fire breathing animation"""
         self.fire_active = True
@@ -13,9 +13,10 @@ The module provides:
 """
 
 import pygame
-import random
 import math
 from config.constants import *
+from systems.rng import rng
+from systems.entity_store import EntityColumn
 
 
 class Enemy:
@@ -24,6 +25,25 @@ class Enemy:
     Handles movement, combat, animations, and visual effects.
     """
     
+    # SpatialHash of the area the enemy is in (set by WorldArea.add_enemy)
+    spatial_index = None
+    
+    # The area's TimerWheel timer that makes the enemy step (set by WorldArea.add_enemy)
+    movement_timer = None
+    
+    # While the enemy is in an EntityStore these live in its table row
+    # (see systems/entity_store.py); otherwise they are normal attributes
+    entity_table = None
+    entity_handle = None
+    x = EntityColumn()
+    y = EntityColumn()
+    health = EntityColumn()
+    max_health = EntityColumn()
+    strength = EntityColumn()
+    speed = EntityColumn()
+    movement_cooldown = EntityColumn()
+    movement_delay = EntityColumn()
+    
     def __init__(self, player_level):
         """Initialize enemy with stats based on player level"""
         self.size = ENEMY_SIZE
@@ -32,7 +52,7 @@ class Enemy:
         self.y = 0
         
         # Set enemy type first, then generate name based on type
-        self.enemy_type = random.choice(["fiery", "shadow", "ice"])
+        self.enemy_type = rng.spawning.choice(["fiery", "shadow", "ice"])
         
         # Generate enemy name based on type (from original pycore whole)
         if self.enemy_type == "fiery":
@@ -41,13 +61,13 @@ class Enemy:
             names = ["Dark Shade", "Night Phantom", "Void Walker", "Gloom Stalker", "Shadow Fiend", "Dark Bat", "Shadow Demon", "Void Beast"]
         else:  # ice
             names = ["Frost Sprite", "Ice Golem", "Blizzard Elemental", "Frozen Wraith", "Chill Specter", "Frost Bat", "Ice Demon", "Frozen Beast"]
-        self.name = random.choice(names)
+        self.name = rng.spawning.choice(names)
         
         # Stats scale with player level (from original pycore whole)
-        self.health = random.randint(20, 30) + player_level * 5
+        self.health = rng.spawning.randint(20, 30) + player_level * 5
         self.max_health = self.health
-        self.strength = random.randint(5, 10) + player_level * 2
-        self.speed = random.randint(3, 6) + player_level // 2  # Original speed (slower)
+        self.strength = rng.spawning.randint(5, 10) + player_level * 2
+        self.speed = rng.spawning.randint(3, 6) + player_level // 2  # Original speed (slower)
         
         # Visual properties
         self.color = ENEMY_COLOR
@@ -86,8 +106,8 @@ class Enemy:
             offset_x = 5 * math.sin(self.attack_animation * 0.2)
             
         if self.hit_animation > 0:
-            offset_x = random.randint(-2, 2)
-            offset_y = random.randint(-2, 2)
+            offset_x = rng.render.randint(-2, 2)
+            offset_y = rng.render.randint(-2, 2)
         
         x = self.x + offset_x
         y = self.y + offset_y
@@ -117,11 +137,11 @@ class Enemy:
             if self.attack_animation > 0:
                 smoke_count = 12 * (1 - self.attack_animation / 10)
             for i in range(int(smoke_count)):
-                offset_x = random.randint(-5, 5)
-                offset_y = random.randint(-5, 5)
+                offset_x = rng.render.randint(-5, 5)
+                offset_y = rng.render.randint(-5, 5)
                 pygame.draw.circle(surface, (70, 70, 120), 
                                  (x + self.size//2 + offset_x, y + self.size//2 + offset_y), 
-                                 random.randint(3, 8))
+                                 rng.render.randint(3, 8))
             pygame.draw.circle(surface, (0, 255, 255), (x + 20, y + 20), 5)
             pygame.draw.circle(surface, (0, 255, 255), (x + self.size - 20, y + 20), 5)
             claw_length = 10
@@ -173,16 +193,29 @@ class Enemy:
         self.movement_cooldown -= 1
         if self.movement_cooldown <= 0:
             self.movement_cooldown = self.movement_delay
-            
-            dx, dy = random.choice([(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)])
-            new_x = self.x + dx * GRID_SIZE
-            new_y = self.y + dy * GRID_SIZE
-            
-            # Check world boundaries
-            if 0 <= new_x < WORLD_WIDTH:
-                self.x = new_x
-            if 0 <= new_y < WORLD_HEIGHT:
-                self.y = new_y
+            self.step()
+    
+    def step(self, direction=None):
+        """
+        Take one grid step (an area's movement_timer calls this every movement_delay ticks)
+        
+        Args:
+            direction: (dx, dy) in grid squares, e.g. from the area's flow field
+                       toward the player (None = a random step)
+        """
+        if direction is None:
+            direction = rng.ai.choice([(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)])
+        dx, dy = direction
+        new_x = self.x + dx * GRID_SIZE
+        new_y = self.y + dy * GRID_SIZE
+        
+        # Check world boundaries
+        if 0 <= new_x < WORLD_WIDTH:
+            self.x = new_x
+        if 0 <= new_y < WORLD_HEIGHT:
+            self.y = new_y
+        if self.spatial_index is not None:
+            self.spatial_index.move(self, self.x, self.y)
 
 
 # Boss dragon classes have been moved to entities/boss_dragons.py for better organization 
\ No newline at end of file
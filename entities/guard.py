@@ -12,6 +12,8 @@ RESOURCE: This module provides the Guard class for use in town cutscenes and NPC
 import pygame
 import math
 from config.constants import *
+from systems.sprite_baker import SpriteBaker
+from systems.timer_wheel import TimerWheel
 
 class Guard:
     """
@@ -27,20 +29,22 @@ class Guard:
         height (int): Height of the guard
         color (tuple): Base color of the guard
         animation_offset (int): Vertical animation offset
-        animation_timer (int): Animation timer for movement
+        timers (TimerWheel): Wheel the guard's bob is scheduled on
+        bob_timer (Timer): Flips animation_offset every 10 ticks
         dialogue (list): Dialogue lines for cutscenes
         current_dialogue (int): Current dialogue index
         dialogue_timer (int): Timer for dialogue progression
         visible (bool): Whether the guard is visible
     """
     
-    def __init__(self, x=300, y=270):
+    def __init__(self, x=300, y=270, timers=None):
         """
         Initialize the Guard
         
         Args:
             x (int): X position (default: 300)
             y (int): Y position (default: 270)
+            timers (TimerWheel): Shared wheel to animate on (default: its own, turned by update())
         """
         self.x = x
         self.y = y
@@ -48,7 +52,9 @@ class Guard:
         self.height = 60
         self.color = (100, 150, 200)  # Blue uniform
         self.animation_offset = 0
-        self.animation_timer = 0
+        self.own_timers = timers is None
+        self.timers = TimerWheel() if timers is None else timers
+        self.bob_timer = self.timers.schedule(10, self.bob, period=10)
         self.dialogue = [
             "Halt! Welcome to our fair town, traveler.",
             "I am Captain Marcus, keeper of the peace.",
@@ -61,11 +67,13 @@ class Guard:
         self.visible = True
     
     def update(self):
-        """Update the guard's animation"""
-        self.animation_timer += 1
-        if self.animation_timer >= 10:
-            self.animation_timer = 0
-            self.animation_offset = 2 if self.animation_offset == 0 else 0
+        """Update the guard's animation (only needed when it has its own timer wheel)"""
+        if self.own_timers:
+            self.timers.advance()
+    
+    def bob(self):
+        """Move the guard up or down (bob_timer calls this every 10 ticks)"""
+        self.animation_offset = 2 if self.animation_offset == 0 else 0
     
     def draw(self, surface):
         """
@@ -77,9 +85,18 @@ class Guard:
         if not self.visible:
             return
             
-        # Base position with animation offset
-        guard_x = self.x
-        guard_y = self.y + self.animation_offset
+        # Base position with animation offset (the bob only moves the baked sprite)
+        self.sprite_baker.draw(self, surface, self.x, self.y + self.animation_offset)
+    
+    def _draw_body(self, surface, guard_x, guard_y):
+        """
+        Draw the guard's armor, helmet, sword and shield procedurally at (guard_x, guard_y)
+        
+        Args:
+            surface (pygame.Surface): The surface to draw on
+            guard_x (int): X position to draw at
+            guard_y (int): Y position to draw at
+        """
         guard_w = self.width
         guard_h = self.height
         
@@ -406,6 +423,9 @@ class Guard:
         pygame.draw.polygon(surface, guard_highlight, 
                           [(sword_x + 4, sword_y + 4), (sword_x + 1, sword_y + 5), (sword_x + 3, sword_y + 3)])
     
+    # The guard always looks the same, so one baked image is enough
+    sprite_baker = SpriteBaker(_draw_body, size=(140, 160), origin=(50, 50))
+    
     def draw_dialogue(self, surface):
         """
         Draw the guard's dialogue box
@@ -6,17 +6,25 @@ This module contains the Item class for collectible items.
 """
 
 import pygame
-import random
 import math
 from config.constants import *
+from systems.rng import rng
+from systems.entity_store import EntityColumn
 
 class Item:
     """Collectible item class"""
+    
+    # Position lives in the EntityStore table row while the item is stored
+    entity_table = None
+    entity_handle = None
+    x = EntityColumn()
+    y = EntityColumn()
+    
     def __init__(self):
         self.size = ITEM_SIZE
         self.x = 0
         self.y = 0
-        self.type = random.choice(["health", "mana"])
+        self.type = rng.spawning.choice(["health", "mana"])
         self.color = ITEM_COLOR if self.type == "health" else MANA_COLOR
         self.pulse = 0
         self.float_offset = 0
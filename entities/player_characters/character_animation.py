@@ -1,8 +1,9 @@
 # Character animation and drawing methods for player characters
 import pygame
 import math
-import random
 from config.constants import *
+from systems.rng import rng
+from systems.sprite_baker import SpriteBaker
 
 # These methods implement the CharacterBase interface and are called by battle/UI modules.
 
@@ -44,12 +45,17 @@ def draw(self, surface):
             offset_x = -10 * math.sin(self.attack_animation * 0.2)  # Increased from 5 to 10
             
     if self.hit_animation > 0:
-        offset_x = random.randint(-2, 2)
-        offset_y = random.randint(-2, 2)
+        offset_x = rng.render.randint(-2, 2)
+        offset_y = rng.render.randint(-2, 2)
     
     x = self.x + offset_x
     y = self.y + offset_y
     
+    # --- Baked sprite for this class and attack frame (see draw_body) ---
+    CHARACTER_BAKER.draw(self, surface, x, y, variant=self.type)
+
+def draw_body(self, surface, x, y):
+    """Draw the character procedurally at (x, y) (used by the sprite baker)."""
     # --- Drawing logic for each class ---
     if self.type == "Warrior":
         draw_warrior(self, surface, x, y)
@@ -58,6 +64,10 @@ def draw(self, surface):
     else:  # Rogue
         draw_rogue(self, surface, x, y)
 
+# Only the attack swing changes how a character looks; bob and hit shake just move the image
+CHARACTER_BAKER = SpriteBaker(draw_body, size=(200, 200), origin=(75, 75),
+                              dimensions={"attack_animation": 1})
+
 def draw_warrior(self, surface, x, y):
     """Draw Warrior character with noble paladin appearance"""
     # Draw shadow first
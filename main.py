@@ -28,13 +28,13 @@ All the complex logic is in other modules:
 ==============================
 1. MODULE IMPORTS:
    - core.game.Game: Main game controller (the "brain" of the game)
-   - config.constants.*: All game constants, colors, fonts, screen setup
+   - config.constants.*: All game constants and colors (importing it starts nothing)
 
 2. PYGAME INITIALIZATION:
-   - Pygame is initialized in config.constants
-   - Screen is created with SCREEN_WIDTH x SCREEN_HEIGHT
-   - Fonts are loaded (fallback to system fonts if needed)
-   - Audio system is initialized
+   - engine.init() (core/engine.py) starts pygame, one part at a time:
+   - The window is created with SCREEN_WIDTH x SCREEN_HEIGHT
+   - The font module is started (fonts fall back to system fonts if needed)
+   - The sound mixer is started
 
 3. GAME STARTUP:
    - Game() constructor initializes all systems
@@ -107,6 +107,29 @@ Each class has its own look and special attack animation, explained for beginner
 - Boss battles and progression system
 - ESC/pause functionality with proper state transitions
 
+HEADLESS SOAK TESTS:
+====================
+python -m main --headless [--ticks N] [--render-every N] [--bot random] [--seed N]
+runs the game without a window, as fast as possible, with a bot playing.
+See core/headless.py for details.
+
+RECORD AND REPLAY:
+==================
+python -m main --seed 42 --record session.replay   records your input
+python -m main --replay session.replay             replays it exactly, headless
+See core/replay.py for details.
+
+HORDE MODE:
+===========
+python -m main --horde   fills every area outside the town with thousands of
+enemies, simulated and drawn as whole arrays. See systems/horde.py for details.
+
+STARTUP REPORT:
+===============
+python -m main --startup-report   shows how long each module takes to import
+and each part of the engine (window, fonts, mixer, Game) takes to start.
+See core/engine.py for details.
+
 CONTROLS:
 =========
 - Arrow Keys/WASD: Movement in overworld
@@ -115,8 +138,65 @@ CONTROLS:
 - M: Toggle world map view
 """
 
-from core.game import Game
-from config.constants import *
+import argparse
+import os
+import sys
+
+# Headless runs need SDL's dummy drivers BEFORE core.engine starts
+# the window and the mixer
+if "--headless" in sys.argv or "--replay" in sys.argv:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from core import engine
+with engine.timed("import config.constants"):
+    from config.constants import *
+with engine.timed("import systems"):
+    from systems.rng import rng
+
+# Modules timed by --startup-report, in the order the game needs them
+STARTUP_MODULES = [
+    "world.world_map", "audio.music_system",
+    "ui.start_screen", "core.game", "ui.battle_screen", "ui.opening_cutscene",
+]
+
+def parse_args(argv=None):
+    """Read the command line options (soak tests, recording and replays)"""
+    parser = argparse.ArgumentParser(description="Dragon's Lair RPG")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without a window, uncapped, with a bot playing")
+    parser.add_argument("--ticks", type=int, default=SIM_TICK_RATE * 60 * 10,
+                        help="simulation ticks to run headless (default: 10 game minutes)")
+    parser.add_argument("--render-every", type=int, default=0,
+                        help="draw every Nth tick when headless (0 = never draw)")
+    parser.add_argument("--bot", default="random",
+                        help="bot name (random, idle) or module:Class")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="random seed for a repeatable run")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record the input of this session to a replay file")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="replay a recorded session headless at full speed")
+    parser.add_argument("--horde", action="store_true", default=HORDE_MODE,
+                        help=f"fill every area outside the town with {HORDE_ENEMIES} enemies")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="time module imports and engine start-up, then exit")
+    return parser.parse_args(argv)
+
+def startup_report():
+    """Import the game's modules and start the engine, timing each step"""
+    for module_name in STARTUP_MODULES:
+        engine.time_import(module_name)
+    engine.init()
+    for font in (font_large, font_medium, font_small, font_tiny, font_cinematic):
+        font.get_linesize()  # The first use loads the font
+    from core.game import Game
+    with engine.timed("Game()"):
+        game = Game()
+    with engine.timed("first frame"):
+        game.draw(engine.screen)
+    engine.print_startup_report()
+    return 0
 
 def main():
     """
@@ -136,12 +216,28 @@ def main():
     2. The engine starts → Game() object is created
     3. The car drives → game.run() starts the game loop 
     """
+    args = parse_args()
+    if args.startup_report:
+        sys.exit(startup_report())
+    if args.replay:
+        from core.replay import run_replay
+        sys.exit(run_replay(args.replay, args.render_every))
+    if args.headless:
+        from core.headless import run_headless
+        sys.exit(run_headless(args.ticks, args.render_every, args.bot, args.seed, args.record, args.horde))
+    
+    seed = rng.reseed(args.seed)
+    
     print("🚀 Starting Dragon's Lair RPG...")
     print("📁 Loading game modules...")
     print("🎮 Initializing game engine...")
     
     # Create the main game object (this starts everything)
-    game = Game()
+    from core.game import Game
+    game = Game(horde=args.horde)
+    if args.record:
+        from core.replay import InputRecorder
+        game.recorder = InputRecorder(args.record, seed, args.horde)
     
     print("✅ Game engine ready!")
     print("🎯 Starting game loop...")
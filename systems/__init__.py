@@ -5,14 +5,60 @@ Systems Module
 This module contains all game systems that handle specific game mechanics.
 
 The module provides:
-- BossSystem: Boss battle management and tracking
+- BossSystem: Boss battle management and tracking (imported on first use, see below)
 - DragonEvolutionSystem: Dragon evolution mechanics and progression
+- DirtyRectTracker: Partial screen updates for dirty-rect rendering
+- SpriteBaker: Cached images for procedurally drawn entities
+- GlowCache / glow_cache: Shared translucent glow and halo sprites
+- RandomStreams / rng: Seeded per-subsystem random number streams
+- SpatialHash: Uniform grid for collision and proximity queries
+- EntityStore / EntityTable: Array-backed enemy and item storage with per-area indexes
+- step_horde / draw_horde: Vectorized simulation and drawing of enemy hordes
+- TimerWheel / Timer: Hierarchical timer wheel for scheduled game and entity callbacks
+- NavGrid / FlowField: Navigation grids and flow fields for enemies chasing the player
 """
 
-from .boss_system import BossSystem
 from .dragon_evolution import DragonEvolutionSystem
+from .dirty_rects import DirtyRectTracker
+from .sprite_baker import SpriteBaker
+from .glow_cache import GlowCache, glow_cache
+from .rng import RandomStreams, rng
+from .spatial_hash import SpatialHash
+from .entity_store import EntityStore, EntityTable
+from .horde import step_horde, draw_horde
+from .timer_wheel import TimerWheel, Timer
+from .navigation import NavGrid, FlowField
 
 __all__ = [
     'BossSystem',
-    'DragonEvolutionSystem'
-] 
\ No newline at end of file
+    'DragonEvolutionSystem',
+    'DirtyRectTracker',
+    'SpriteBaker',
+    'GlowCache',
+    'glow_cache',
+    'RandomStreams',
+    'rng',
+    'SpatialHash',
+    'EntityStore',
+    'EntityTable',
+    'step_horde',
+    'draw_horde',
+    'TimerWheel',
+    'Timer',
+    'NavGrid',
+    'FlowField'
+] 
+
+
+def __getattr__(name):
+    """
+    Import BossSystem the first time it is asked for
+
+    boss_system needs entities.boss_dragons, and the entities import
+    systems.rng - importing it up front would make an import cycle that
+    breaks any program whose first import is an entity.
+    """
+    if name == "BossSystem":
+        from .boss_system import BossSystem
+        return BossSystem
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
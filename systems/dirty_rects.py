@@ -0,0 +1,117 @@
+"""
+Dirty Rectangle System Module
+=============================
+
+This module contains the DirtyRectTracker class that decides which parts of
+the window need to be pushed to the display each frame.
+
+WHAT THIS MODULE DOES:
+======================
+Normally the game calls pygame.display.flip(), which copies the WHOLE
+1000x700 screen to the window every frame - even when almost nothing moved.
+On slow devices (low-end PCs, Android) that copy is the expensive part.
+
+The tracker collects "dirty" rectangles - the small areas that changed this
+frame - and only pushes those with pygame.display.update(rects).
+
+FOR NOVICE CODERS:
+==================
+Think of it like touching up a painting:
+- Repainting the whole canvas every time is slow
+- Instead you only repaint the spots where something changed
+- But you must ALSO repaint where things USED to be, or you'd leave
+  "ghost" copies behind. That's why last frame's rectangles are
+  always pushed again together with this frame's rectangles.
+
+When lots of things change at once (a new screen, a fade, a cutscene) the
+tracker just falls back to a normal full flip.
+
+RESOURCE: This module provides partial screen updates for the game loop.
+"""
+
+import pygame
+from config.constants import *
+
+# If more than this many rectangles are dirty, merge them into one
+MAX_DIRTY_RECTS = 512
+
+# If the dirty area covers more than this fraction of the screen, flip instead
+FULL_FLIP_COVERAGE = 0.6
+
+
+class DirtyRectTracker:
+    """
+    Dirty Rect Tracker - Collects changed screen regions and presents them
+
+    Usage each frame:
+    1. Call mark(rect) for everything that moved or changed
+    2. Call request_full_redraw() when the whole screen changed
+    3. Call present() once after drawing
+
+    Attributes:
+        screen_rect (pygame.Rect): Area of the display window
+        rects (list): Dirty rectangles collected this frame
+        full_redraw (bool): Whether the next present() must flip everything
+        full_flips (int): How many full flips have been done (for profiling)
+        partial_updates (int): How many partial updates have been done
+    """
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        """Initialize the tracker (the first frame is always a full flip)"""
+        self.screen_rect = pygame.Rect(0, 0, width, height)
+        self.rects = []
+        self._previous_rects = []
+        self.full_redraw = True
+        self.full_flips = 0
+        self.partial_updates = 0
+
+    def mark(self, rect, padding=0):
+        """Mark a rectangle (or (x, y, w, h) tuple) as changed this frame"""
+        rect = pygame.Rect(rect)
+        if padding:
+            rect.inflate_ip(padding * 2, padding * 2)
+        rect = rect.clip(self.screen_rect)
+        if rect.width > 0 and rect.height > 0:
+            self.rects.append(rect)
+
+    def mark_many(self, rects, padding=0):
+        """Mark a group of rectangles as one merged region (good for particles)"""
+        rects = [pygame.Rect(rect) for rect in rects]
+        if rects:
+            self.mark(rects[0].unionall(rects[1:]), padding)
+
+    def request_full_redraw(self):
+        """Make the next present() flip the whole screen"""
+        self.full_redraw = True
+
+    def present(self):
+        """
+        Push this frame's changes to the display
+
+        Returns:
+            bool: True if a full flip was done, False for a partial update
+        """
+        rects = self.rects + self._previous_rects
+
+        if len(rects) > MAX_DIRTY_RECTS:
+            rects = [rects[0].unionall(rects[1:])]
+
+        dirty_area = sum(rect.width * rect.height for rect in rects)
+        screen_area = self.screen_rect.width * self.screen_rect.height
+        if dirty_area > screen_area * FULL_FLIP_COVERAGE:
+            self.full_redraw = True
+
+        full_flip = self.full_redraw
+        if full_flip:
+            pygame.display.flip()
+            self.full_flips += 1
+        else:
+            if rects:
+                pygame.display.update(rects)
+            self.partial_updates += 1
+
+        # Things drawn this frame must be erased next frame
+        self._previous_rects = self.rects
+        self.rects = []
+        self.full_redraw = False
+        return full_flip
@@ -0,0 +1,262 @@
+"""
+Entity Store Module
+===================
+
+This module contains the EntityStore that holds every enemy and item in
+the world: their positions, stats and timers live in NumPy arrays, one
+table per kind of entity, instead of in each object's own dictionary.
+
+WHAT THIS MODULE DOES:
+======================
+- Every kind of entity ("enemy", "item") has an EntityTable with one
+  array ("column") per field: x, y, health, movement_cooldown, ...
+  Row i of every column belongs to the same entity, and rows 0..count-1
+  are always packed together with no gaps.
+- Adding an entity gives it a handle: a small whole number that stays the
+  same for as long as the entity is stored, wherever its row moves to.
+- Removing an entity moves the LAST row into the hole ("swap-remove"), so
+  a despawn never shifts the rows behind it - it costs the same with 3
+  entities or with 3,000.
+- Every table also remembers which area each entity belongs to, in one
+  ordered set of handles per area, so "the enemies in this area" is a
+  lookup rather than a search.
+- The Enemy and Item objects stay around as thin views: EntityColumn
+  attributes read and write their row in the table, so all existing
+  drawing and battle code keeps using enemy.x, enemy.health, ... as before.
+  An object that is not in a store (a boss, or an enemy taken into
+  battle) keeps those values in its own dictionary instead.
+
+FOR NOVICE CODERS:
+==================
+Think of it like a spreadsheet:
+- Each kind of entity is one sheet, each field is a column
+- The handle is like a customer number - it never changes, even when the
+  rows get re-sorted
+- Deleting a row just moves the bottom row up into the gap
+
+    store = EntityStore()
+    store.add("enemy", enemy, area=(1, 1))   # enemy.x now lives in the table
+    store.members("enemy", (1, 1))           # [enemy] (in the order added)
+    store.remove(enemy)                      # O(1); enemy.x is its own again
+
+Whole columns can be used at once for NumPy maths, e.g.
+store.table("enemy").column("x").
+
+RESOURCE: This module provides array-backed entity storage with per-area indexes.
+"""
+
+import numpy as np
+from config.constants import *
+
+# Fields stored in the table of each entity kind, with their array types
+ENTITY_FIELDS = {
+    "enemy": (("x", np.float64), ("y", np.float64), ("health", np.int32), ("max_health", np.int32),
+              ("strength", np.int32), ("speed", np.int32), ("movement_cooldown", np.int32),
+              ("movement_delay", np.int32)),
+    "item": (("x", np.float64), ("y", np.float64)),
+}
+
+# Rows allocated for a new table (doubled whenever it fills up)
+INITIAL_CAPACITY = 16
+
+
+class EntityColumn:
+    """
+    Attribute that lives in the entity's table row while it is stored
+
+    Put one on a class for every field of its ENTITY_FIELDS kind. While
+    the object is in a table, reading or writing the attribute goes to
+    its row; otherwise it is an ordinary attribute in the object's own
+    dictionary.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        table = obj.entity_table
+        if table is None:
+            try:
+                return obj.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        return table.columns[self.name][table.rows[obj.entity_handle]].item()
+
+    def __set__(self, obj, value):
+        table = obj.entity_table
+        if table is None:
+            obj.__dict__[self.name] = value
+        else:
+            table.columns[self.name][table.rows[obj.entity_handle]] = value
+
+
+class EntityTable:
+    """
+    Packed arrays for every entity of one kind
+
+    Attributes:
+        kind (str): Entity kind ("enemy", "item")
+        fields (tuple): Names of the columns
+        columns (dict): Field name -> NumPy array (only rows 0..count-1 are in use)
+        count (int): Entities stored
+        rows (list): Handle -> row (-1 for a free handle)
+        handles (list): Row -> handle
+        views (list): Handle -> the object for that entity (None when free)
+        area_of (list): Handle -> area the entity belongs to
+        areas (dict): Area -> {handle: None}, an ordered set of the area's handles
+        free (list): Handles that can be given out again
+        version (int): Bumped on every add and remove (invalidates cached row arrays)
+    """
+
+    def __init__(self, kind, fields=None, capacity=INITIAL_CAPACITY):
+        self.kind = kind
+        fields = fields if fields is not None else ENTITY_FIELDS[kind]
+        self.fields = tuple(name for name, _ in fields)
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in fields}
+        self.count = 0
+        self.rows = []
+        self.handles = []
+        self.views = []
+        self.area_of = []
+        self.areas = {}
+        self.free = []
+        self.version = 0
+        self._area_rows = {}
+
+    def __len__(self):
+        return self.count
+
+    def column(self, name):
+        """The live part of a column (a view: writing to it changes the entities)"""
+        return self.columns[name][:self.count]
+
+    def _grow(self):
+        for name, column in self.columns.items():
+            bigger = np.zeros(len(column) * 2, dtype=column.dtype)
+            bigger[:len(column)] = column
+            self.columns[name] = bigger
+
+    def add(self, obj, area=None):
+        """
+        Move an object's fields into a new row
+
+        Returns:
+            int: The entity's handle
+        """
+        if self.count == len(self.columns[self.fields[0]]):
+            self._grow()
+        row = self.count
+        values = {name: obj.__dict__.pop(name, 0) for name in self.fields}
+        for name, value in values.items():
+            self.columns[name][row] = value
+        if self.free:
+            handle = self.free.pop()
+            self.rows[handle] = row
+            self.views[handle] = obj
+            self.area_of[handle] = area
+        else:
+            handle = len(self.rows)
+            self.rows.append(row)
+            self.views.append(obj)
+            self.area_of.append(area)
+        self.handles.append(handle)
+        self.count += 1
+        self.areas.setdefault(area, {})[handle] = None
+        self.version += 1
+        obj.entity_table = self
+        obj.entity_handle = handle
+        return handle
+
+    def remove(self, handle):
+        """
+        Swap-remove an entity; its fields go back into the object's own dictionary
+
+        Returns:
+            The object that was removed
+        """
+        obj = self.views[handle]
+        row = self.rows[handle]
+        for name in self.fields:
+            obj.__dict__[name] = self.columns[name][row].item()
+        last = self.count - 1
+        if row != last:
+            # The last row fills the hole, so the rows stay packed
+            for column in self.columns.values():
+                column[row] = column[last]
+            moved = self.handles[last]
+            self.handles[row] = moved
+            self.rows[moved] = row
+        self.handles.pop()
+        self.count -= 1
+
+        members = self.areas[self.area_of[handle]]
+        del members[handle]
+        if not members:
+            del self.areas[self.area_of[handle]]
+        self.rows[handle] = -1
+        self.views[handle] = None
+        self.area_of[handle] = None
+        self.free.append(handle)
+        self.version += 1
+        obj.entity_table = None
+        obj.entity_handle = None
+        return obj
+
+    def members(self, area):
+        """Objects in an area, in the order they were added"""
+        views = self.views
+        return [views[handle] for handle in self.areas.get(area, ())]
+
+    def area_rows(self, area):
+        """
+        Rows of an area's entities as a NumPy index array, in the order they were added
+
+        The array is cached until the next add or remove, so indexing the
+        columns with it every frame costs no Python loop.
+        """
+        cached = self._area_rows.get(area)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        rows = self.rows
+        area_rows = np.fromiter((rows[handle] for handle in self.areas.get(area, ())), dtype=np.intp)
+        self._area_rows[area] = (self.version, area_rows)
+        return area_rows
+
+    def area_count(self, area):
+        """How many entities an area has"""
+        return len(self.areas.get(area, ()))
+
+
+class EntityStore:
+    """
+    One EntityTable per entity kind
+
+    Attributes:
+        tables (dict): Kind -> EntityTable
+    """
+
+    def __init__(self, kinds=ENTITY_FIELDS):
+        self.tables = {kind: EntityTable(kind, fields) for kind, fields in kinds.items()}
+
+    def table(self, kind):
+        return self.tables[kind]
+
+    def add(self, kind, obj, area=None):
+        """Store an object as an entity of `kind` in `area`; returns its handle"""
+        return self.tables[kind].add(obj, area)
+
+    def remove(self, obj):
+        """Take an object out of its table (does nothing if it is not stored)"""
+        if obj.entity_table is None or obj.entity_table not in self.tables.values():
+            return False
+        obj.entity_table.remove(obj.entity_handle)
+        return True
+
+    def members(self, kind, area):
+        """Objects of `kind` in `area`, in the order they were added"""
+        return self.tables[kind].members(area)
+
+    def count(self, kind, area):
+        return self.tables[kind].area_count(area)
@@ -0,0 +1,126 @@
+"""
+Glow Cache System Module
+========================
+
+This module contains the GlowCache class, a shared store of ready-made
+translucent shapes (glows, halos, smoke puffs, fire puffs, button glows).
+
+WHAT THIS MODULE DOES:
+======================
+pygame can only draw see-through (alpha) shapes onto a surface that has an
+alpha channel. The old effect code created a brand new SRCALPHA Surface every
+frame for every puff of smoke or ring of glow, drew one circle on it, blitted
+it and threw it away. Creating surfaces is slow and makes the garbage
+collector work hard.
+
+The GlowCache builds each shape ONCE and hands back the same surface every
+time the same (shape, size, color) is asked for.
+
+FOR NOVICE CODERS:
+==================
+Think of it like a box of stencils:
+- The first time you need a "red circle, size 10" you cut the stencil
+- Every time after that you grab the same stencil from the box
+- Sizes and transparency are rounded a little so the box doesn't fill up
+  with stencils that look exactly the same
+
+The allocations counter tells you how many new surfaces were made. Once
+the game has been running for a bit, it should stop going up at all.
+
+RESOURCE: This module provides the shared glow sprite cache used by effects.
+"""
+
+import pygame
+from config.constants import *
+
+# Transparency is rounded to multiples of this (keeps the cache small)
+GLOW_ALPHA_STEP = 4
+
+# Radius is rounded to multiples of this (half pixels keep 1.5-step sizes exact)
+GLOW_RADIUS_STEP = 0.5
+
+# The cache is emptied if it ever grows past this many shapes
+GLOW_CACHE_LIMIT = 1024
+
+
+class GlowCache:
+    """
+    Glow Cache - Shared translucent shapes keyed by (shape, size, rgba)
+
+    Attributes:
+        surfaces (dict): Cached surfaces by key
+        allocations (int): How many surfaces the cache has ever created
+        hits (int): How many requests were served from the cache
+    """
+
+    def __init__(self, limit=GLOW_CACHE_LIMIT):
+        """Initialize an empty cache"""
+        self.limit = limit
+        self.surfaces = {}
+        self.allocations = 0
+        self.hits = 0
+
+    def _quantize_color(self, color):
+        """Return an (r, g, b, a) tuple with the alpha rounded to GLOW_ALPHA_STEP"""
+        r, g, b = (int(channel) for channel in color[:3])
+        alpha = int(color[3]) if len(color) > 3 else 255
+        alpha = max(0, min(255, int(round(alpha / GLOW_ALPHA_STEP)) * GLOW_ALPHA_STEP))
+        return (r, g, b, alpha)
+
+    def _store(self, key, surface):
+        """Remember a newly built surface (clearing the cache if it got too big)"""
+        if len(self.surfaces) >= self.limit:
+            self.surfaces.clear()
+        self.surfaces[key] = surface
+        self.allocations += 1
+        return surface
+
+    def circle(self, radius, color):
+        """
+        Return a (2r x 2r) surface with a filled translucent circle centered in it
+
+        Blit it at (center_x - radius, center_y - radius).
+
+        Args:
+            radius (float): Circle radius (rounded to GLOW_RADIUS_STEP)
+            color (tuple): RGB or RGBA color
+        """
+        radius = round(radius / GLOW_RADIUS_STEP) * GLOW_RADIUS_STEP
+        color = self._quantize_color(color)
+        key = ("circle", radius, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        return self._store(key, surface)
+
+    def rect(self, width, height, color, border_radius=0):
+        """
+        Return a surface filled with a translucent (optionally rounded) rectangle
+
+        Args:
+            width, height (int): Size of the rectangle
+            color (tuple): RGB or RGBA color
+            border_radius (int): Corner rounding, like pygame.draw.rect
+        """
+        color = self._quantize_color(color)
+        key = ("rect", int(width), int(height), color, border_radius)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        surface = pygame.Surface((int(width), int(height)), pygame.SRCALPHA)
+        pygame.draw.rect(surface, color, surface.get_rect(), border_radius=border_radius)
+        return self._store(key, surface)
+
+    def clear(self):
+        """Forget every cached shape"""
+        self.surfaces.clear()
+
+
+# One cache shared by every effect in the game
+glow_cache = GlowCache()
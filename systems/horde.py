@@ -0,0 +1,189 @@
+"""
+Horde System Module
+===================
+
+This module simulates and draws the enemies of a "horde" area - thousands
+of them at once - with NumPy operations on the entity store's columns
+instead of one Python call per enemy.
+
+WHAT THIS MODULE DOES:
+======================
+A normal area has a handful of enemies and updates each one with
+Enemy.update(). A horde area (python -m main --horde) has HORDE_ENEMIES,
+and the same rules run on whole arrays:
+
+- step_horde(): every movement cooldown counts down in one subtraction;
+  the enemies whose cooldown ran out each take a grid step - toward the
+  player, looked up in the area's flow field (systems/navigation.py) all
+  at once, or a random one (stay, right, left, down or up - the same
+  choices as Enemy.step) where the field has no way to the player - and
+  a step that would leave the world is dropped, axis by axis.
+- first_overlap(): one array comparison finds the enemies touching the
+  player's box; the earliest spawned one starts the battle.
+- nearest_enemy(): the closest enemy for the adaptive music, in one pass.
+- draw_horde(): only enemies inside the camera view are drawn, as one
+  pre-drawn sprite per enemy type handed to pygame in a single blits()
+  call (no names or health bars - with thousands on screen they would
+  just be noise).
+
+The random steps come from a NumPy generator seeded from rng.ai, so a
+horde plays out the same way every time for the same seed.
+
+FOR NOVICE CODERS:
+==================
+Instead of telling 5,000 soldiers one by one to take a step, a sergeant
+shouts "everyone whose turn it is, step!" once. NumPy is the sergeant:
+`x[due] += steps` moves every chosen enemy in a single instruction.
+
+RESOURCE: This module provides the vectorized horde enemy simulation.
+"""
+
+import numpy as np
+import pygame
+from config.constants import *
+from systems.rng import rng
+from systems.sprite_baker import BAKE_COLORKEY
+
+# The grid steps an enemy can take, in Enemy.update's order: stay, right, left, down, up
+HORDE_MOVES = np.array([(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)], dtype=np.float64) * GRID_SIZE
+
+# Body and eye colors of the horde sprite of each enemy type (as in Enemy.draw)
+HORDE_COLORS = {
+    "fiery": ((200, 50, 0), (255, 255, 0)),
+    "shadow": ((40, 40, 80), (0, 255, 255)),
+    "ice": ((150, 220, 255), (0, 100, 200)),
+}
+
+# Pre-drawn horde sprites: enemy type -> Surface
+_sprites = {}
+
+# (rows array, sprite of each row) for the horde drawn last
+_sprites_for_rows = (None, None)
+
+
+def step_horde(table, rows, generator=None, flow=None):
+    """
+    Advance the movement of a horde by one tick
+
+    Args:
+        table: The enemy EntityTable
+        rows: Row of every enemy in the horde (EntityTable.area_rows)
+        generator: NumPy random generator (default: one seeded from rng.ai)
+        flow: FlowField toward the player (None = every step is random)
+
+    Returns:
+        int: How many enemies took a step this tick
+    """
+    cooldown = table.columns["movement_cooldown"]
+    cooldown[rows] -= 1
+    due = rows[cooldown[rows] <= 0]
+    if not len(due):
+        return 0
+    cooldown[due] = table.columns["movement_delay"][due]
+    if generator is None:
+        generator = np.random.default_rng(rng.ai.getrandbits(64))
+    steps = HORDE_MOVES[generator.integers(0, len(HORDE_MOVES), len(due))]
+    if flow is not None:
+        half = ENEMY_SIZE / 2
+        dx, dy, valid = flow.directions(table.columns["x"][due] + half, table.columns["y"][due] + half)
+        steps[valid, 0] = dx[valid] * GRID_SIZE
+        steps[valid, 1] = dy[valid] * GRID_SIZE
+    for name, axis, limit in (("x", 0, WORLD_WIDTH), ("y", 1, WORLD_HEIGHT)):
+        column = table.columns[name]
+        moved = column[due] + steps[:, axis]
+        column[due] = np.where((moved >= 0) & (moved < limit), moved, column[due])
+    return len(due)
+
+
+def first_overlap(table, rows, x, y, width, height, size=ENEMY_SIZE):
+    """
+    The first enemy (in spawn order) whose box overlaps a rectangle
+
+    Overlap means the same as pygame.Rect.colliderect.
+
+    Returns:
+        The enemy object, or None
+    """
+    ex = table.columns["x"][rows]
+    ey = table.columns["y"][rows]
+    hits = np.flatnonzero((ex < x + width) & (x < ex + size) & (ey < y + height) & (y < ey + size))
+    if not len(hits):
+        return None
+    return table.views[table.handles[rows[hits[0]]]]
+
+
+def nearest_enemy(table, rows, x, y, max_radius=None):
+    """
+    The enemy whose position is closest to a point (ties: the earliest spawned)
+
+    Returns:
+        The enemy object, or None (also when it is further than max_radius)
+    """
+    if not len(rows):
+        return None
+    distances = (table.columns["x"][rows] - x) ** 2 + (table.columns["y"][rows] - y) ** 2
+    best = int(np.argmin(distances))
+    if max_radius is not None and distances[best] > max_radius * max_radius:
+        return None
+    return table.views[table.handles[rows[best]]]
+
+
+def visible_rows(table, rows, left, top, width, height, size=ENEMY_SIZE):
+    """Rows of the enemies whose boxes are at least partly inside a view rectangle"""
+    ex = table.columns["x"][rows]
+    ey = table.columns["y"][rows]
+    return rows[(ex + size > left) & (ex < left + width) & (ey + size > top) & (ey < top + height)]
+
+
+def horde_sprite(enemy_type):
+    """
+    The small pre-drawn sprite of an enemy type (body and eyes)
+
+    The sprite only has solid pixels, so it uses an RLE colorkey like the
+    sprite baker's images: that blits several times faster than per-pixel
+    alpha, which matters with thousands of enemies on screen.
+    """
+    sprite = _sprites.get(enemy_type)
+    if sprite is None:
+        body, eyes = HORDE_COLORS.get(enemy_type, HORDE_COLORS["ice"])
+        sprite = pygame.Surface((ENEMY_SIZE, ENEMY_SIZE))
+        sprite.fill(BAKE_COLORKEY)
+        pygame.draw.ellipse(sprite, body, (0, 0, ENEMY_SIZE, ENEMY_SIZE))
+        pygame.draw.circle(sprite, eyes, (15, 15), 4)
+        pygame.draw.circle(sprite, eyes, (ENEMY_SIZE - 15, 15), 4)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        sprite.set_colorkey(BAKE_COLORKEY, pygame.RLEACCEL)
+        _sprites[enemy_type] = sprite
+    return sprite
+
+
+def draw_horde(surface, table, rows, camera_x, camera_y):
+    """
+    Draw the horde enemies that are inside the camera view
+
+    Returns:
+        int: How many enemies were drawn
+    """
+    ex = table.columns["x"][rows] - camera_x
+    ey = table.columns["y"][rows] - camera_y
+    shown = np.flatnonzero((ex + ENEMY_SIZE > 0) & (ex < surface.get_width()) &
+                           (ey + ENEMY_SIZE > 0) & (ey < surface.get_height()))
+    if not len(shown):
+        return 0
+    sprites = _row_sprites(table, rows)[shown].tolist()
+    positions = zip(ex[shown].astype(np.int32).tolist(), ey[shown].astype(np.int32).tolist())
+    surface.blits(list(zip(sprites, positions)), doreturn=False)
+    return len(shown)
+
+
+def _row_sprites(table, rows):
+    """Sprite of every row in `rows` (cached until the rows array changes)"""
+    global _sprites_for_rows
+    cached_rows, sprites = _sprites_for_rows
+    if cached_rows is not rows:
+        views, handles = table.views, table.handles
+        sprites = np.empty(len(rows), dtype=object)
+        sprites[:] = [horde_sprite(views[handles[row]].enemy_type) for row in rows.tolist()]
+        _sprites_for_rows = (rows, sprites)
+    return sprites
@@ -0,0 +1,186 @@
+"""
+Navigation Module
+=================
+
+This module contains the NavGrid and FlowField classes that let any number
+of enemies chase the player around buildings and walls.
+
+WHAT THIS MODULE DOES:
+======================
+- NavGrid: an area cut into GRID_SIZE squares (the grid everything moves
+  on), with every square that a solid building, wall or tower touches
+  marked as blocked. It is built once per area and only rebuilt when the
+  area's layout changes.
+- FlowField: for every square of a NavGrid, which way to step to get
+  closer to one target square (the player's), and how many steps away it
+  is. It is worked out with a breadth-first search that grows outward
+  from the target one ring of squares at a time - each ring is a handful
+  of NumPy operations on the whole grid, not a loop over squares.
+
+The flow field only has to be worked out again when the player moves to
+another square. After that, every enemy finds its next step by looking up
+its own square: the same cost for 3 enemies or 3,000.
+
+FOR NOVICE CODERS:
+==================
+Imagine pouring water on the player's square. It spreads one square per
+second around the walls. Write down on every square the second the water
+got there. To reach the player from anywhere, just keep stepping to the
+neighbor with the smaller number - the water already found the way.
+
+    grid = NavGrid.from_rects(area_x, area_y, solid_rects)
+    flow = FlowField(grid, grid.cell_of(player_x, player_y))
+    flow.direction(enemy_x, enemy_y)   # (1, 0) = step right, None = no path
+
+RESOURCE: This module provides navigation grids and flow fields for enemy pursuit.
+"""
+
+import numpy as np
+from config.constants import *
+
+# The steps a flow field can point along (grid squares): right, left, down, up.
+# Ties between equally good steps go to the first one in this list.
+NAV_MOVES = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)], dtype=np.int64)
+
+# Distance of squares the search never reached
+UNREACHED = np.iinfo(np.int32).max
+
+
+class NavGrid:
+    """
+    Walkable squares of one area
+
+    Attributes:
+        origin_x, origin_y (int): World position of the grid's top-left corner
+        cols, rows (int): Size of the grid in squares
+        cell_size (int): Width and height of a square in pixels
+        blocked (numpy.ndarray): bool array [row, col], True where nothing may walk
+    """
+
+    def __init__(self, origin_x, origin_y, cols, rows, cell_size=GRID_SIZE):
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.cols = cols
+        self.rows = rows
+        self.cell_size = cell_size
+        self.blocked = np.zeros((rows, cols), dtype=bool)
+
+    @classmethod
+    def from_rects(cls, origin_x, origin_y, rects, width=AREA_WIDTH, height=AREA_HEIGHT,
+                   cell_size=GRID_SIZE):
+        """
+        Grid of an area with every square touched by a solid rectangle blocked
+
+        Args:
+            origin_x, origin_y: World position of the area
+            rects: (x, y, width, height) rectangles in area coordinates
+
+        Returns:
+            NavGrid: The new grid
+        """
+        grid = cls(origin_x, origin_y, -(-width // cell_size), -(-height // cell_size), cell_size)
+        for x, y, w, h in rects:
+            # Squares that overlap the rectangle (touching an edge does not count)
+            first_col, last_col = max(0, int(x // cell_size)), int(-(-(x + w) // cell_size))
+            first_row, last_row = max(0, int(y // cell_size)), int(-(-(y + h) // cell_size))
+            grid.blocked[first_row:last_row, first_col:last_col] = True
+        return grid
+
+    def cell_of(self, x, y):
+        """(col, row) of the square holding a world point, or None outside the grid"""
+        col = int((x - self.origin_x) // self.cell_size)
+        row = int((y - self.origin_y) // self.cell_size)
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return col, row
+        return None
+
+
+class FlowField:
+    """
+    Which way to step from every square of a NavGrid to reach a target square
+
+    Attributes:
+        grid (NavGrid): The grid the field covers
+        target (tuple): (col, row) the field leads to
+        distance (numpy.ndarray): int32 [row, col], steps to the target (UNREACHED if walled off)
+        step_x, step_y (numpy.ndarray): int64 [row, col], the step to take (0, 0 on the target)
+    """
+
+    def __init__(self, grid, target):
+        self.grid = grid
+        self.target = target
+        self.distance = self._search(grid.blocked, target)
+        self.step_x, self.step_y = self._steps(self.distance)
+
+    @staticmethod
+    def _search(blocked, target):
+        """Breadth-first search outward from the target, one ring of squares per pass"""
+        col, row = target
+        distance = np.full(blocked.shape, UNREACHED, dtype=np.int32)
+        distance[row, col] = 0  # Even if the target itself is blocked (the player hugs a wall)
+        unvisited = ~blocked  # Walkable squares not reached yet
+        unvisited[row, col] = False
+        frontier = np.zeros(blocked.shape, dtype=bool)
+        frontier[row, col] = True
+        grown = np.empty_like(frontier)
+        steps = 0
+        while frontier.any():
+            steps += 1
+            # Squares next to the frontier...
+            grown[:] = False
+            grown[1:, :] |= frontier[:-1, :]
+            grown[:-1, :] |= frontier[1:, :]
+            grown[:, 1:] |= frontier[:, :-1]
+            grown[:, :-1] |= frontier[:, 1:]
+            # ...that can be walked on and weren't reached before
+            frontier = grown & unvisited
+            unvisited &= ~frontier
+            distance[frontier] = steps
+        return distance
+
+    @staticmethod
+    def _steps(distance):
+        """For every square, the step to the neighbor closest to the target"""
+        padded = np.pad(distance, 1, constant_values=UNREACHED)
+        neighbors = np.stack([padded[1:-1, 2:],    # Right
+                              padded[1:-1, :-2],   # Left
+                              padded[2:, 1:-1],    # Down
+                              padded[:-2, 1:-1]])  # Up
+        best = np.argmin(neighbors, axis=0)
+        closer = (np.take_along_axis(neighbors, best[None], axis=0)[0] < distance) & (distance != UNREACHED)
+        step_x = np.where(closer, NAV_MOVES[best, 0], 0)
+        step_y = np.where(closer, NAV_MOVES[best, 1], 0)
+        return step_x, step_y
+
+    def direction(self, x, y):
+        """
+        The step (dx, dy) in squares from the square holding a world point
+
+        Returns:
+            tuple: (dx, dy), (0, 0) on the target, or None if the point is
+            outside the grid or has no path to the target
+        """
+        cell = self.grid.cell_of(x, y)
+        if cell is None:
+            return None
+        col, row = cell
+        if self.distance[row, col] == UNREACHED:
+            return None
+        return int(self.step_x[row, col]), int(self.step_y[row, col])
+
+    def directions(self, xs, ys):
+        """
+        direction() for whole arrays of world points at once
+
+        Returns:
+            tuple: (dx array, dy array, valid array) - valid is False where
+            direction() would return None
+        """
+        grid = self.grid
+        cols = ((np.asarray(xs) - grid.origin_x) // grid.cell_size).astype(np.int64)
+        rows = ((np.asarray(ys) - grid.origin_y) // grid.cell_size).astype(np.int64)
+        inside = (cols >= 0) & (cols < grid.cols) & (rows >= 0) & (rows < grid.rows)
+        cols = np.where(inside, cols, 0)
+        rows = np.where(inside, rows, 0)
+        valid = inside & (self.distance[rows, cols] != UNREACHED)
+        return self.step_x[rows, cols], self.step_y[rows, cols], valid
@@ -0,0 +1,143 @@
+"""
+DRAGON'S LAIR RPG - Particle Renderer Module
+============================================
+
+This module contains the ParticleRenderer class that draws every live
+particle of a ParticleSystem in one batched blit call.
+
+WHAT THIS MODULE DOES:
+======================
+Drawing particles one pygame.draw.circle() call at a time is slow when
+there are thousands of them. The renderer instead keeps small pre-drawn
+circle images ("stamps"), one per (color, radius, brightness), and hands
+the whole list of (stamp, position) pairs to Surface.blits() at once.
+
+Particles can also be drawn with ADDITIVE blending: their color is added
+to whatever is already on screen, so overlapping fire and magic particles
+glow brighter instead of covering each other. Additive stamps fade out as
+the particle ages (the alpha of the particle becomes its brightness).
+
+FOR NOVICE CODERS:
+==================
+Think of it like a rubber stamp set:
+- Drawing each circle by hand = slow
+- Grabbing the right stamp and pressing it = fast
+- Pressing ALL the stamps in one go = even faster
+"""
+
+import numpy as np
+import pygame
+from config.constants import *
+
+# Additive stamps fade in this many brightness steps
+ADDITIVE_ALPHA_BUCKETS = 16
+
+# Transparent color for normal stamps (a different one is used for magenta particles)
+STAMP_COLORKEY = (255, 0, 255)
+STAMP_COLORKEY_ALT = (0, 0, 0)
+
+
+class ParticleRenderer:
+    """
+    Particle Renderer - Batches particle drawing with cached circle stamps
+
+    Attributes:
+        stamps (dict): (rgb, radius, alpha bucket or None) -> Surface
+        stamps_built (int): How many stamps have been created (for profiling)
+    """
+
+    def __init__(self):
+        """Initialize an empty stamp cache"""
+        self.stamps = {}
+        self.stamps_built = 0
+
+    def _build_stamp(self, rgb, radius, bucket):
+        """Draw one circle stamp (solid with a colorkey, or faded for additive blending)"""
+        stamp = pygame.Surface((radius * 2, radius * 2))
+        if bucket is None:
+            colorkey = STAMP_COLORKEY if rgb != STAMP_COLORKEY else STAMP_COLORKEY_ALT
+            stamp.fill(colorkey)
+            pygame.draw.circle(stamp, rgb, (radius, radius), radius)
+            stamp.set_colorkey(colorkey, pygame.RLEACCEL)
+        else:
+            # Black adds nothing, so no colorkey is needed for additive stamps
+            brightness = (bucket + 1) / ADDITIVE_ALPHA_BUCKETS
+            faded = tuple(int(channel * brightness) for channel in rgb)
+            stamp.fill((0, 0, 0))
+            pygame.draw.circle(stamp, faded, (radius, radius), radius)
+        if pygame.display.get_surface() is not None:
+            stamp = stamp.convert()
+            if bucket is None:
+                stamp.set_colorkey(colorkey, pygame.RLEACCEL)
+        self.stamps_built += 1
+        return stamp
+
+    def get_stamp(self, rgb, radius, bucket=None):
+        """Return the cached stamp for a color and radius (bucket is set for additive stamps)"""
+        key = (rgb, radius, bucket)
+        stamp = self.stamps.get(key)
+        if stamp is None:
+            stamp = self._build_stamp(rgb, radius, bucket)
+            self.stamps[key] = stamp
+        return stamp
+
+    def draw(self, surface, positions, radii, alphas, colors, additive):
+        """
+        Draw a batch of particles in one blits() call
+
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            positions: (n, 2) integer screen positions (particle centers)
+            radii: (n,) integer radii (particles with radius 0 are skipped)
+            alphas: (n,) 0-255 fade values
+            colors: (n, 3) RGB colors
+            additive: (n,) booleans, True for additive blending
+        """
+        visible = radii > 0
+        if not visible.any():
+            return
+        positions = positions[visible]
+        radii = radii[visible].astype(np.int64)
+        colors = colors[visible].astype(np.int64)
+        additive = additive[visible]
+
+        # Additive particles pick a brightness bucket; solid ones use bucket -1
+        buckets = np.where(additive,
+                           np.minimum(ADDITIVE_ALPHA_BUCKETS - 1,
+                                      alphas[visible] * ADDITIVE_ALPHA_BUCKETS // 256),
+                           -1)
+
+        # Pack (color, radius, bucket) into one number per particle so the
+        # stamps can be looked up once per distinct key instead of per particle
+        rgb = (colors[:, 0] << 16) | (colors[:, 1] << 8) | colors[:, 2]
+        keys = (rgb << 24) | (radii << 8) | (buckets + 1)
+        unique_keys, stamp_index = np.unique(keys, return_inverse=True)
+        stamps = []
+        for key in unique_keys.tolist():
+            color = ((key >> 40) & 255, (key >> 32) & 255, (key >> 24) & 255)
+            radius = (key >> 8) & 65535
+            bucket = (key & 255) - 1
+            stamps.append(self.get_stamp(color, radius, bucket if bucket >= 0 else None))
+
+        sources = [stamps[i] for i in stamp_index.tolist()]
+        dests = (positions - radii[:, None]).tolist()
+
+        if additive.any():
+            flags = np.where(additive, pygame.BLEND_RGB_ADD, 0).tolist()
+            surface.blits(zip(sources, dests, [None] * len(dests), flags), doreturn=False)
+            return
+
+        # pygame-ce has an even faster fblits() for plain (stamp, position) batches
+        fblits = getattr(surface, "fblits", None)
+        if fblits:
+            fblits(zip(sources, dests))
+        else:
+            surface.blits(zip(sources, dests), doreturn=False)
+
+    def clear(self):
+        """Forget every cached stamp"""
+        self.stamps.clear()
+
+
+# One stamp cache shared by every particle system
+particle_renderer = ParticleRenderer()
@@ -3,93 +3,205 @@ DRAGON'S LAIR RPG - Particle System Module
 ==========================================
 
 This module contains the ParticleSystem class for visual effects.
+
+HOW PARTICLES ARE STORED:
+=========================
+Instead of one Python object per particle, every particle property lives in
+a NumPy array column ("structure of arrays"):
+
+    positions[i]  = (x, y)        velocities[i] = (vx, vy)
+    ages[i]       = frames alive  lifetimes[i]  = frames it may live
+    sizes[i]      = start radius  colors[i]     = (r, g, b)
+    additive[i]   = True for glowing (additive blended) particles
+
+Only the first `count` rows are live, oldest first. Updating moves every
+particle with a single array addition instead of a Python loop, which
+matters when a magic beam spawns well over a thousand particles at once.
+
+The system has a fixed capacity. If an effect tries to add more particles
+than fit, the OLDEST particles are dropped first, so one big effect can't
+blow the frame budget.
+
+Drawing is done by systems.particle_renderer, which blits cached circle
+"stamps" for all particles in one batch.
 """
 
 import pygame
-import random
 import math
+import numpy as np
 from config.constants import *
-
-class Particle:
-    """
-    Individual particle for visual effects like explosions, magic, and environmental effects.
-    """
-    def __init__(self, x, y, color, velocity, size, lifetime):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.velocity = velocity
-        self.size = size
-        self.lifetime = lifetime
-        self.age = 0
-        
-    def update(self):
-        """Update particle position and age"""
-        self.x += self.velocity[0]
-        self.y += self.velocity[1]
-        self.age += 1
-        return self.age >= self.lifetime
-        
-    def draw(self, surface):
-        """Draw particle with alpha blending and size fading"""
-        alpha = 255 * (1 - self.age/self.lifetime)
-        color = (*self.color[:3], int(alpha))
-        radius = int(self.size * (1 - self.age/self.lifetime))
-        if radius > 0:
-            # Use regular pygame circle drawing instead of gfxdraw
-            pygame.draw.circle(surface, color, (int(self.x), int(self.y)), radius)
+from systems.rng import rng
+from systems.particle_renderer import particle_renderer
+from systems.profiler import profiled
 
 class ParticleSystem:
     """
     Manages all particles in the game, including explosions, magic effects, and environmental particles.
     Provides methods for creating various types of particle effects.
+
+    Attributes:
+        capacity (int): Maximum number of live particles
+        count (int): Number of live particles (rows 0..count-1 of each column)
+        evicted (int): How many particles were dropped to stay under capacity
     """
-    def __init__(self):
-        self.particles = []
-        
-    def add_particle(self, x, y, color, velocity, size, lifetime):
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.count = 0
+        self.evicted = 0
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self.ages = np.zeros(capacity, dtype=np.int32)
+        self.lifetimes = np.ones(capacity, dtype=np.int32)
+        self.sizes = np.zeros(capacity, dtype=np.float64)
+        self.colors = np.zeros((capacity, 3), dtype=np.uint8)
+        self.additive = np.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        """Number of live particles"""
+        return self.count
+
+    def _columns(self):
+        """All per-particle arrays, in one list for bulk moves"""
+        return [self.positions, self.velocities, self.ages, self.lifetimes, self.sizes,
+                self.colors, self.additive]
+
+    def _make_room(self, amount):
+        """Drop the oldest particles so that `amount` new ones fit"""
+        overflow = self.count + amount - self.capacity
+        if overflow <= 0:
+            return
+        overflow = min(overflow, self.count)
+        keep = self.count - overflow
+        for column in self._columns():
+            column[:keep] = column[overflow:self.count]
+        self.count = keep
+        self.evicted += overflow
+
+    def emit(self, xs, ys, vxs, vys, sizes, lifetimes, color, additive=False):
+        """
+        Add a batch of particles that share one color
+
+        Args:
+            xs, ys: Start positions (sequences or arrays of equal length)
+            vxs, vys: Velocities per frame
+            sizes: Start radius of each particle
+            lifetimes: Frames each particle lives
+            color (tuple): RGB (or RGBA, alpha is ignored) color for the batch
+            additive (bool): Blend the batch additively (glowing fire and magic)
+        """
+        amount = len(xs)
+        if amount == 0:
+            return
+        if amount > self.capacity:
+            # Only the newest particles of a huge batch can survive anyway
+            skip = amount - self.capacity
+            self.evicted += skip
+            xs, ys, vxs, vys = xs[skip:], ys[skip:], vxs[skip:], vys[skip:]
+            sizes, lifetimes = sizes[skip:], lifetimes[skip:]
+            amount = self.capacity
+
+        self._make_room(amount)
+        start, end = self.count, self.count + amount
+        self.positions[start:end, 0] = xs
+        self.positions[start:end, 1] = ys
+        self.velocities[start:end, 0] = vxs
+        self.velocities[start:end, 1] = vys
+        self.ages[start:end] = 0
+        self.lifetimes[start:end] = np.maximum(np.asarray(lifetimes, dtype=np.int32), 1)
+        self.sizes[start:end] = sizes
+        self.colors[start:end] = color[:3]
+        self.additive[start:end] = additive
+        self.count = end
+
+    def add_particle(self, x, y, color, velocity, size, lifetime, additive=False):
         """Add a single particle to the system"""
-        self.particles.append(Particle(x, y, color, velocity, size, lifetime))
-        
-    def add_explosion(self, x, y, color, count=20, size_range=(2, 5), speed_range=(1, 3), lifetime_range=(20, 40)):
+        self.emit([x], [y], [velocity[0]], [velocity[1]], [size], [lifetime], color, additive)
+
+    def add_explosion(self, x, y, color, count=20, size_range=(2, 5), speed_range=(1, 3), lifetime_range=(20, 40),
+                      additive=False):
         """Create an explosion effect with multiple particles"""
+        vxs, vys, sizes, lifetimes = [], [], [], []
         for _ in range(count):
-            angle = random.uniform(0, math.pi*2)
-            speed = random.uniform(*speed_range)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            size = random.uniform(*size_range)
-            lifetime = random.randint(*lifetime_range)
-            self.add_particle(x, y, color, velocity, size, lifetime)
-            
-    def add_beam(self, x1, y1, x2, y2, color, width=3, particle_count=10, speed=2):
+            angle = rng.vfx.uniform(0, math.pi*2)
+            speed = rng.vfx.uniform(*speed_range)
+            vxs.append(math.cos(angle) * speed)
+            vys.append(math.sin(angle) * speed)
+            sizes.append(rng.vfx.uniform(*size_range))
+            lifetimes.append(rng.vfx.randint(*lifetime_range))
+        self.emit([x] * count, [y] * count, vxs, vys, sizes, lifetimes, color, additive)
+
+    def add_beam(self, x1, y1, x2, y2, color, width=3, particle_count=10, speed=2, additive=False):
         """Create a beam effect between two points"""
         dx = x2 - x1
         dy = y2 - y1
         distance = math.sqrt(dx*dx + dy*dy)
         steps = max(1, int(distance / 5))
-        
+
+        xs, ys, vxs, vys = [], [], [], []
         for i in range(steps):
             px = x1 + (dx * i/steps)
             py = y1 + (dy * i/steps)
             for _ in range(particle_count):
-                angle = random.uniform(0, math.pi*2)
-                velocity = (math.cos(angle) * 0.2, math.sin(angle) * 0.2)
-                self.add_particle(px, py, color, velocity, width, 15)
-    
+                angle = rng.vfx.uniform(0, math.pi*2)
+                xs.append(px)
+                ys.append(py)
+                vxs.append(math.cos(angle) * 0.2)
+                vys.append(math.sin(angle) * 0.2)
+        amount = len(xs)
+        self.emit(xs, ys, vxs, vys, [width] * amount, [15] * amount, color, additive)
+
+    @profiled("particles.update")
     def update(self):
-        """Update all particles and remove expired ones"""
-        self.particles = [p for p in self.particles if not p.update()]
-        
+        """Move all particles, age them and remove expired ones"""
+        n = self.count
+        if n == 0:
+            return
+        self.positions[:n] += self.velocities[:n]
+        self.ages[:n] += 1
+        alive = self.ages[:n] < self.lifetimes[:n]
+        if alive.all():
+            return
+        # Compact the survivors to the front, keeping oldest-first order
+        survivors = int(np.count_nonzero(alive))
+        for column in self._columns():
+            column[:survivors] = column[:n][alive]
+        self.count = survivors
+
+    def clear(self):
+        """Remove every particle"""
+        self.count = 0
+
+    def _screen_state(self, world_map=None):
+        """Return screen positions, radii and alphas of the live particles"""
+        n = self.count
+        positions = self.positions[:n]
+        if world_map:
+            # One camera offset for the whole batch instead of per particle
+            positions = positions - (world_map.camera_x, world_map.camera_y)
+        fade = 1 - self.ages[:n] / self.lifetimes[:n]
+        radii = (self.sizes[:n] * fade).astype(np.int32)
+        alphas = (255 * fade).astype(np.int32)
+        return positions.astype(np.int32), radii, alphas
+
+    def bounding_rect(self, world_map=None):
+        """Screen rectangle covering every visible particle (None if there are none)"""
+        positions, radii, _ = self._screen_state(world_map)
+        visible = radii > 0
+        if not visible.any():
+            return None
+        positions = positions[visible]
+        radii = radii[visible]
+        left = int((positions[:, 0] - radii).min()) - 1
+        top = int((positions[:, 1] - radii).min()) - 1
+        right = int((positions[:, 0] + radii).max()) + 2
+        bottom = int((positions[:, 1] + radii).max()) + 2
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    @profiled("particles.draw")
     def draw(self, surface, world_map=None):
-        """Draw all particles with optional world coordinate conversion"""
-        for particle in self.particles:
-            if world_map:
-                # Convert world coordinates to screen coordinates
-                screen_x, screen_y = world_map.world_to_screen(particle.x, particle.y)
-                # Temporarily set particle position for drawing
-                original_x, original_y = particle.x, particle.y
-                particle.x, particle.y = screen_x, screen_y
-                particle.draw(surface)
-                particle.x, particle.y = original_x, original_y
-            else:
-                particle.draw(surface) 
\ No newline at end of file
+        """Draw all particles (one batched blit) with optional world coordinate conversion"""
+        if self.count == 0:
+            return
+        positions, radii, alphas = self._screen_state(world_map)
+        particle_renderer.draw(surface, positions, radii, alphas,
+                               self.colors[:self.count], self.additive[:self.count])
@@ -0,0 +1,330 @@
+"""
+Frame Profiler System Module
+============================
+
+This module contains the FrameProfiler class that measures where each
+frame's time goes, and shows it in an on-screen overlay (press F3).
+
+WHAT THIS MODULE DOES:
+======================
+Important functions are wrapped in named "spans" (update_systems,
+draw.overworld, world_area.draw, particles.update, music.update, ...).
+While profiling is on, the time spent inside every span is added up for
+the current frame. At the end of each frame the totals are written into
+a ring buffer: a fixed-size NumPy table that keeps the last few thousand
+frames and overwrites the oldest row, so it never grows and never needs
+a lock (only the game loop writes to it).
+
+From that table the profiler works out, per span, the average and p99
+(the time 99% of frames stay under), plus for whole frames:
+- the 1% low: the frame rate of the slowest 1% of frames
+- jank: frames that took more than twice as long as a typical frame
+
+When the game exits, the table is saved as CSV (one row per frame) and
+the statistics as JSON in the PROFILE_DUMP_DIR folder.
+
+FOR NOVICE CODERS:
+==================
+Timing a function is as easy as putting a decorator on it:
+
+    @profiled("music.update")
+    def update(self, ...):
+
+or timing a block of code:
+
+    with profiler.span("draw.hud"):
+        ...
+
+When profiling is off, a decorated function only pays for one extra
+function call and an `if` - so the spans can stay in the code for good.
+
+Spans are inclusive: a span that calls other spans includes their time
+(draw.overworld contains world_area.draw).
+
+RESOURCE: This module provides the per-span frame profiler and its F3 overlay.
+"""
+
+import functools
+import json
+import os
+import time
+from time import perf_counter
+
+import numpy as np
+import pygame
+from config.constants import *
+
+# Frames kept in the ring buffer (one minute at 60 FPS)
+PROFILER_HISTORY = 3600
+
+# Most spans the ring buffer has room for
+PROFILER_MAX_SPANS = 32
+
+# Frames shown in the overlay's frame-time graph
+OVERLAY_GRAPH_FRAMES = 180
+
+# The overlay text is re-rendered this often (in frames)
+OVERLAY_REFRESH_FRAMES = 15
+
+
+class _Span:
+    """Context manager that adds the time spent inside it to one span"""
+
+    __slots__ = ("profiler", "column", "start")
+
+    def __init__(self, profiler, column):
+        self.profiler = profiler
+        self.column = column
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.current[self.column] += perf_counter() - self.start
+        return False
+
+
+class _NullSpan:
+    """Context manager that does nothing (used while profiling is off)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class FrameProfiler:
+    """
+    Frame Profiler - Per-span frame timings in a fixed-size ring buffer
+
+    Attributes:
+        enabled (bool): True while timings are being recorded
+        overlay_visible (bool): True while the F3 overlay is shown
+        names (list): Span names, in column order
+        current (list): Seconds spent in each span during the current frame
+        span_times (np.ndarray): (history, spans) milliseconds per frame and span
+        frame_times (np.ndarray): (history,) total milliseconds per frame
+        frames (int): How many frames have been recorded in total
+    """
+
+    def __init__(self, history=PROFILER_HISTORY, max_spans=PROFILER_MAX_SPANS, enabled=False):
+        self.enabled = enabled
+        self.overlay_visible = False
+        self.history = history
+        self.names = []
+        self.columns = {}
+        self.current = [0.0] * max_spans
+        self.span_times = np.zeros((history, max_spans), dtype=np.float64)
+        self.frame_times = np.zeros(history, dtype=np.float64)
+        self.frames = 0
+        self._last_frame_end = None
+        self._overlay_lines = []
+        self._overlay_surface = None
+
+    def register(self, name):
+        """Return the ring buffer column for a span name (adding it if new)"""
+        column = self.columns.get(name)
+        if column is None:
+            if len(self.names) >= len(self.current):
+                raise ValueError(f"Too many profiler spans (max {len(self.current)}): {name}")
+            column = len(self.names)
+            self.names.append(name)
+            self.columns[name] = column
+        return column
+
+    def span(self, name):
+        """Return a context manager that times a block of code"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, self.register(name))
+
+    def add(self, column, seconds):
+        """Add time to a span in the current frame"""
+        self.current[column] += seconds
+
+    def set_enabled(self, enabled):
+        """Start or stop recording (the frame being timed is restarted)"""
+        self.enabled = enabled
+        self._last_frame_end = None
+        self.current[:] = [0.0] * len(self.current)
+
+    def toggle_overlay(self):
+        """Show or hide the overlay (showing it also starts recording)"""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible and not self.enabled:
+            self.set_enabled(True)
+        self._overlay_surface = None
+
+    def end_frame(self):
+        """Store the finished frame's span totals in the ring buffer"""
+        if not self.enabled:
+            return
+        now = perf_counter()
+        if self._last_frame_end is not None:
+            row = self.frames % self.history
+            self.frame_times[row] = (now - self._last_frame_end) * 1000
+            self.span_times[row] = self.current
+            self.span_times[row] *= 1000
+            self.frames += 1
+        self._last_frame_end = now
+        self.current[:] = [0.0] * len(self.current)
+
+    def _window(self):
+        """Return (frame_times, span_times) of the frames in the buffer, oldest first"""
+        count = min(self.frames, self.history)
+        if self.frames <= self.history:
+            return self.frame_times[:count], self.span_times[:count]
+        start = self.frames % self.history
+        order = np.r_[start:self.history, 0:start]
+        return self.frame_times[order], self.span_times[order]
+
+    def stats(self):
+        """
+        Summarize the frames in the ring buffer
+
+        Returns:
+            dict: Frame statistics (avg, p99, fps, 1% low, jank) and per-span avg/p99/max
+        """
+        frame_times, span_times = self._window()
+        if len(frame_times) == 0:
+            return {"frames": 0, "spans": {}}
+        average = float(frame_times.mean())
+        median = float(np.median(frame_times))
+        worst = np.sort(frame_times)[-max(1, len(frame_times) // 100):]
+        jank = int(np.count_nonzero(frame_times > max(2 * median, 1000 / FPS)))
+        spans = {}
+        for column, name in enumerate(self.names):
+            times = span_times[:, column]
+            spans[name] = {
+                "avg_ms": float(times.mean()),
+                "p99_ms": float(np.percentile(times, 99)),
+                "max_ms": float(times.max()),
+            }
+        return {
+            "frames": len(frame_times),
+            "frame_avg_ms": average,
+            "frame_p99_ms": float(np.percentile(frame_times, 99)),
+            "frame_max_ms": float(frame_times.max()),
+            "fps_avg": 1000 / average if average else 0.0,
+            "fps_1_percent_low": 1000 / float(worst.mean()) if worst.mean() else 0.0,
+            "jank_frames": jank,
+            "jank_percent": 100 * jank / len(frame_times),
+            "spans": spans,
+        }
+
+    def dump(self, directory=PROFILE_DUMP_DIR):
+        """
+        Write the buffered frames to CSV and the statistics to JSON
+
+        Returns:
+            tuple: (csv path, json path), or None if nothing was recorded
+        """
+        frame_times, span_times = self._window()
+        if len(frame_times) == 0:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, time.strftime("profile_%Y%m%d_%H%M%S"))
+        columns = len(self.names)
+        table = np.column_stack([frame_times, span_times[:, :columns]])
+        header = ",".join(["frame_ms"] + self.names)
+        np.savetxt(base + ".csv", table, fmt="%.4f", delimiter=",", header=header, comments="")
+        with open(base + ".json", "w") as json_file:
+            json.dump(self.stats(), json_file, indent=2)
+        print(f"📈 Profile saved to {base}.csv and {base}.json")
+        return base + ".csv", base + ".json"
+
+    def _render_overlay(self):
+        """Re-render the overlay text from the current statistics"""
+        stats = self.stats()
+        rows = [["PROFILER (F3)"]]
+        if stats["frames"]:
+            rows.append([f"{stats['fps_avg']:.0f} fps  1% low {stats['fps_1_percent_low']:.0f}  "
+                         f"jank {stats['jank_percent']:.1f}%"])
+            rows.append([f"frame {stats['frame_avg_ms']:.2f} ms  p99 {stats['frame_p99_ms']:.2f} ms"])
+            rows.append(["span", "avg ms", "p99 ms"])
+            ranked = sorted(stats["spans"].items(), key=lambda item: -item[1]["avg_ms"])
+            for name, span in ranked:
+                rows.append([name, f"{span['avg_ms']:.2f}", f"{span['p99_ms']:.2f}"])
+        self._overlay_lines = [[font_tiny.render(cell, True, (255, 255, 255)) for cell in row]
+                               for row in rows]
+
+    def draw_overlay(self, surface):
+        """
+        Draw the overlay in the top-left corner
+
+        Returns:
+            pygame.Rect: The area drawn over (for dirty-rect rendering)
+        """
+        if self.frames % OVERLAY_REFRESH_FRAMES == 0 or not self._overlay_lines:
+            self._render_overlay()
+        line_height = font_tiny.get_linesize()
+        graph_height = 60
+        # Span names in the first column, numbers right-aligned in the next two
+        name_width = max(row[0].get_width() for row in self._overlay_lines if len(row) > 1) \
+            if len(self._overlay_lines) > 1 else 0
+        number_width = 70
+        table_width = name_width + 2 * number_width
+        width = max([row[0].get_width() for row in self._overlay_lines]
+                    + [table_width, OVERLAY_GRAPH_FRAMES]) + 16
+        height = line_height * len(self._overlay_lines) + graph_height + 20
+
+        if self._overlay_surface is None or self._overlay_surface.get_size() != (width, height):
+            self._overlay_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel = self._overlay_surface
+        panel.fill((0, 0, 0, 180))
+        for i, row in enumerate(self._overlay_lines):
+            y = 6 + i * line_height
+            panel.blit(row[0], (8, y))
+            for column, cell in enumerate(row[1:], 1):
+                panel.blit(cell, (8 + name_width + column * number_width - cell.get_width(), y))
+
+        # Frame-time graph: one bar per frame, the cyan line is the 60 FPS budget
+        graph_top = height - graph_height - 6
+        budget_ms = 1000 / FPS
+        scale = graph_height / (budget_ms * 3)
+        frame_times, _ = self._window()
+        recent = frame_times[-OVERLAY_GRAPH_FRAMES:]
+        for i, ms in enumerate(recent.tolist()):
+            bar = min(graph_height, int(ms * scale))
+            color = (0, 255, 0) if ms <= budget_ms * 1.05 else (255, 200, 0) if ms <= budget_ms * 2 else (255, 0, 0)
+            pygame.draw.line(panel, color, (8 + i, graph_top + graph_height), (8 + i, graph_top + graph_height - bar))
+        budget_y = graph_top + graph_height - int(budget_ms * scale)
+        pygame.draw.line(panel, (0, 255, 255), (8, budget_y), (8 + OVERLAY_GRAPH_FRAMES, budget_y))
+
+        return surface.blit(panel, (10, 10))
+
+
+# The profiler shared by the whole game
+profiler = FrameProfiler(enabled=PROFILER_ENABLED)
+
+
+def profiled(name):
+    """
+    Decorator that times every call of a function as the span `name`
+
+    Example:
+        @profiled("particles.update")
+        def update(self):
+    """
+    def decorate(func):
+        column = profiler.register(name)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.current[column] += perf_counter() - start
+        return wrapper
+    return decorate
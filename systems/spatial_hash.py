@@ -0,0 +1,261 @@
+"""
+Spatial Hash Module
+===================
+
+This module contains the SpatialHash class, a uniform grid that answers
+"what is near here?" without testing every object in the area.
+
+WHAT THIS MODULE DOES:
+======================
+The world is cut into square cells GRID_SIZE pixels wide - the same grid
+the player and enemies move on. Every object is filed under each cell its
+rectangle touches. A question about a small region only has to look in
+the few cells that region covers, so its cost depends on how crowded that
+spot is, not on how many objects the whole area holds.
+
+- insert() / remove() add and drop objects (spawns, pickups, battles)
+- move() refiles an object when it moves; most steps stay inside the same
+  cells and cost almost nothing
+- query_rect() finds objects overlapping a rectangle (collisions)
+- query_radius() finds objects within a distance of a point
+- nearest() finds the closest object, searching outward ring by ring
+
+Every object has a "kind" ("enemy", "item", "building", ...) so one grid
+can hold everything in an area and each question picks what it wants.
+
+FOR NOVICE CODERS:
+==================
+Think of it like the pigeonholes of a mail room:
+- Every letter goes in the pigeonhole for its street
+- To find the letters for one street you open one pigeonhole,
+  instead of reading every letter in the building
+
+Results always come back in the order the objects were inserted, so the
+same game plays out the same way every time (replays stay in sync).
+
+RESOURCE: This module provides the spatial index for collisions and proximity queries.
+"""
+
+import math
+from config.constants import *
+
+
+class SpatialEntry:
+    """
+    One object filed in a SpatialHash
+
+    Attributes:
+        obj: The object itself
+        kind (str): What sort of object it is (used to filter queries)
+        x, y (float): Top-left corner of its rectangle (its position)
+        width, height (float): Size of its rectangle
+        cells (tuple): (first column, first row, last column, last row) it is filed under
+        order (int): Insertion number (keeps query results deterministic)
+    """
+
+    __slots__ = ("obj", "kind", "x", "y", "width", "height", "cells", "order")
+
+    def __init__(self, obj, kind, x, y, width, height, order):
+        self.obj = obj
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.cells = None
+        self.order = order
+
+
+class SpatialHash:
+    """
+    Uniform grid of cells, each listing the objects whose rectangles touch it
+
+    Objects are tracked by identity, so anything can be filed: entities,
+    or plain dicts like the town's buildings.
+
+    Attributes:
+        cell_size (int): Width and height of a cell in pixels
+        cells (dict): (column, row) -> {id(obj): SpatialEntry} (only non-empty cells)
+        entries (dict): id(obj) -> SpatialEntry of every filed object
+        counter (int): Insertion number given to the next object
+    """
+
+    def __init__(self, cell_size=GRID_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entries = {}
+        self.counter = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, obj):
+        return id(obj) in self.entries
+
+    def cell_range(self, x, y, width, height):
+        """(first column, first row, last column, last row) covered by a rectangle"""
+        size = self.cell_size
+        # A rectangle ending exactly on a cell border does not touch the next cell
+        return (math.floor(x / size), math.floor(y / size),
+                math.floor((x + max(width, 1) - 1e-9) / size),
+                math.floor((y + max(height, 1) - 1e-9) / size))
+
+    def _file(self, entry, cells):
+        key = id(entry.obj)
+        first_col, first_row, last_col, last_row = cells
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                self.cells.setdefault((col, row), {})[key] = entry
+        entry.cells = cells
+
+    def _unfile(self, entry):
+        key = id(entry.obj)
+        first_col, first_row, last_col, last_row = entry.cells
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                bucket = self.cells[(col, row)]
+                del bucket[key]
+                if not bucket:
+                    del self.cells[(col, row)]
+
+    def insert(self, obj, x, y, width, height, kind=None):
+        """File an object with its rectangle (inserting it again just moves it)"""
+        entry = self.entries.get(id(obj))
+        if entry is not None:
+            entry.kind = kind
+            entry.width, entry.height = width, height
+            self._unfile(entry)
+            entry.x, entry.y = x, y
+            self._file(entry, self.cell_range(x, y, width, height))
+            return
+        entry = SpatialEntry(obj, kind, x, y, width, height, self.counter)
+        self.counter += 1
+        self.entries[id(obj)] = entry
+        self._file(entry, self.cell_range(x, y, width, height))
+
+    def move(self, obj, x, y):
+        """Move a filed object to a new position (its size stays the same)"""
+        entry = self.entries[id(obj)]
+        entry.x, entry.y = x, y
+        cells = self.cell_range(x, y, entry.width, entry.height)
+        if cells != entry.cells:
+            self._unfile(entry)
+            self._file(entry, cells)
+
+    def remove(self, obj):
+        """Drop an object; returns False if it was not filed"""
+        entry = self.entries.pop(id(obj), None)
+        if entry is None:
+            return False
+        self._unfile(entry)
+        return True
+
+    def clear(self):
+        """Drop every object"""
+        self.cells.clear()
+        self.entries.clear()
+
+    def _candidates(self, first_col, first_row, last_col, last_row, kind):
+        """Entries filed in a block of cells (each once), optionally of one kind"""
+        found = {}
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                bucket = self.cells.get((col, row))
+                if bucket:
+                    found.update(bucket)
+        if kind is None:
+            return found.values()
+        return [entry for entry in found.values() if entry.kind == kind]
+
+    def query_rect(self, x, y, width, height, kind=None):
+        """
+        Objects whose rectangles overlap a rectangle
+
+        Overlap means the same as pygame.Rect.colliderect: rectangles that
+        only share an edge do not overlap.
+
+        Returns:
+            list: The objects, in insertion order
+        """
+        hits = [entry for entry in self._candidates(*self.cell_range(x, y, width, height), kind)
+                if entry.x < x + width and x < entry.x + entry.width
+                and entry.y < y + height and y < entry.y + entry.height]
+        hits.sort(key=lambda entry: entry.order)
+        return [entry.obj for entry in hits]
+
+    def query_radius(self, x, y, radius, kind=None):
+        """
+        Objects whose position (top-left corner) is within `radius` of a point
+
+        Returns:
+            list: The objects, in insertion order
+        """
+        size = self.cell_size
+        block = (math.floor((x - radius) / size), math.floor((y - radius) / size),
+                 math.floor((x + radius) / size), math.floor((y + radius) / size))
+        limit = radius * radius
+        hits = [entry for entry in self._candidates(*block, kind)
+                if (entry.x - x) ** 2 + (entry.y - y) ** 2 <= limit]
+        hits.sort(key=lambda entry: entry.order)
+        return [entry.obj for entry in hits]
+
+    def nearest(self, x, y, kind=None, max_radius=None):
+        """
+        The object whose position (top-left corner) is closest to a point
+
+        Searches the point's cell, then the ring of cells around it, and so
+        on, stopping as soon as no unsearched cell can hold anything closer.
+        Ties go to the object inserted first.
+
+        Returns:
+            The object, or None if there is none (within max_radius)
+        """
+        size = self.cell_size
+        col, row = math.floor(x / size), math.floor(y / size)
+        best = None
+        seen = set()
+        ring = 0
+        while True:
+            if (2 * ring + 1) ** 2 >= len(self.cells):
+                # The rings now cover more cells than are in use: check the rest directly
+                candidates = [entry for key, entry in self.entries.items() if key not in seen]
+                best = self._closest(candidates, x, y, kind, best)
+                break
+            for cell in self._ring(col, row, ring):
+                bucket = self.cells.get(cell)
+                if not bucket:
+                    continue
+                candidates = [entry for key, entry in bucket.items() if key not in seen]
+                seen.update(bucket)
+                best = self._closest(candidates, x, y, kind, best)
+            # Anything in a further ring is more than ring * size away
+            if best is not None and best[0] <= (ring * size) ** 2:
+                break
+            if max_radius is not None and ring * size >= max_radius:
+                break
+            ring += 1
+        if best is None or (max_radius is not None and best[0] > max_radius * max_radius):
+            return None
+        return best[2]
+
+    @staticmethod
+    def _ring(col, row, ring):
+        """Cells exactly `ring` steps (in columns or rows) away from a cell"""
+        if ring == 0:
+            return [(col, row)]
+        cells = [(c, row - ring) for c in range(col - ring, col + ring + 1)]
+        cells += [(c, row + ring) for c in range(col - ring, col + ring + 1)]
+        cells += [(col - ring, r) for r in range(row - ring + 1, row + ring)]
+        cells += [(col + ring, r) for r in range(row - ring + 1, row + ring)]
+        return cells
+
+    @staticmethod
+    def _closest(entries, x, y, kind, best):
+        """Update best = (squared distance, order, obj) with the entries"""
+        for entry in entries:
+            if kind is not None and entry.kind != kind:
+                continue
+            candidate = ((entry.x - x) ** 2 + (entry.y - y) ** 2, entry.order)
+            if best is None or candidate < best[:2]:
+                best = candidate + (entry.obj,)
+        return best
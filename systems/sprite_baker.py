@@ -0,0 +1,196 @@
+"""
+Sprite Baker System Module
+==========================
+
+This module contains the SpriteBaker class that turns procedurally drawn
+entities into cached images.
+
+WHAT THIS MODULE DOES:
+======================
+Characters, the town guard, the dark knight and the title dragon are drawn
+with hundreds of pygame.draw calls (polygons, circles, lines) EVERY frame,
+even though they only change in a few small ways (a bob, an attack swing,
+a wing flap).
+
+The SpriteBaker runs an entity's normal drawing code ONCE for each animation
+state into a transparent surface ("baking" it), keeps that image in a cache,
+and from then on just blits the image. One blit is much cheaper than
+hundreds of draw calls.
+
+FOR NOVICE CODERS:
+==================
+Think of it like a rubber stamp:
+- The first time, you carefully carve the stamp (slow)
+- After that, you just press the stamp onto the paper (fast)
+- You carve one stamp per pose (wings up, wings down, sword swinging...)
+
+HOW AN ENTITY OPTS IN:
+======================
+The entity splits its drawing into a function that draws the sprite at a
+given (x, y), and declares which attributes change how it looks:
+
+    sprite_baker = SpriteBaker(_draw_body, size=(120, 140), origin=(40, 50),
+                               dimensions={"attack_animation": 1})
+
+    def draw(self, surface):
+        self.sprite_baker.draw(self, surface, self.x, self.y)
+
+Each dimension is an attribute name mapped to a quantization step, or to a
+(step, period) tuple for values that repeat (like a wing-flap angle).
+Movement offsets (bobbing, hit shake) don't need a dimension - the baked
+image is simply blitted at the shifted position.
+
+Set BAKE_SPRITES = False in config.constants (or SpriteBaker.enabled = False)
+to draw everything procedurally again, which is handy for debugging.
+
+RESOURCE: This module provides baked sprite caches for procedurally drawn entities.
+"""
+
+import numpy as np
+import pygame
+from config.constants import *
+
+# Color used for the transparent parts of fully opaque baked sprites
+BAKE_COLORKEY = (255, 0, 255)
+
+
+class SpriteBaker:
+    """
+    Sprite Baker - Caches an entity's procedural drawing as images
+
+    Attributes:
+        enabled (bool): Class-wide switch; False draws everything procedurally
+        render (callable): render(entity, surface, x, y) draws the sprite at (x, y)
+        size (tuple): Size of the scratch surface each pose is baked into
+        origin (tuple): Where the entity's (x, y) sits inside the scratch surface
+        dimensions (dict): Attribute name -> step or (step, period)
+        cache (dict): (variant, quantized state) -> (image, offset)
+        bakes (int): How many poses have been baked (for profiling)
+    """
+
+    enabled = BAKE_SPRITES
+
+    def __init__(self, render, size, origin, dimensions=None, max_entries=256):
+        """
+        Initialize the sprite baker
+
+        Args:
+            render (callable): render(entity, surface, x, y) - the procedural drawing code
+            size (tuple): (width, height) large enough to hold every pose
+            origin (tuple): (x, y) inside that surface where the entity is drawn
+            dimensions (dict): Animation attributes that change the sprite's look
+            max_entries (int): Cache size limit before it is cleared
+        """
+        self.render = render
+        self.size = size
+        self.origin = origin
+        self.dimensions = dimensions or {}
+        self.max_entries = max_entries
+        self.cache = {}
+        self.bakes = 0
+
+    def _dimension_spec(self, attr):
+        """Return (step, period) for one animation dimension"""
+        spec = self.dimensions[attr]
+        if isinstance(spec, tuple):
+            return spec
+        return spec, None
+
+    def quantize(self, entity):
+        """Return the entity's animation state as a tuple of whole-number steps"""
+        state = []
+        for attr in self.dimensions:
+            step, period = self._dimension_spec(attr)
+            value = getattr(entity, attr, 0)
+            if period:
+                steps_per_period = max(1, int(round(period / step)))
+                state.append(int(round((value % period) / step)) % steps_per_period)
+            else:
+                state.append(int(round(value / step)))
+        return tuple(state)
+
+    def bake(self, entity, state):
+        """
+        Draw one pose of the entity into a new transparent image
+
+        The entity's animation attributes are temporarily set to the
+        quantized values so the procedural code draws exactly that pose.
+
+        Returns:
+            tuple: (image, (offset_x, offset_y)) relative to the entity's position
+        """
+        scratch = pygame.Surface(self.size, pygame.SRCALPHA)
+        saved = {attr: getattr(entity, attr, 0) for attr in self.dimensions}
+        try:
+            for attr, steps in zip(self.dimensions, state):
+                step, period = self._dimension_spec(attr)
+                setattr(entity, attr, steps * step)
+            self.render(entity, scratch, *self.origin)
+        finally:
+            for attr, value in saved.items():
+                setattr(entity, attr, value)
+
+        # Crop away the empty border so each blit touches as few pixels as possible
+        bounds = scratch.get_bounding_rect()
+        image = self._optimize(scratch.subsurface(bounds).copy())
+        self.bakes += 1
+        return image, (bounds.x - self.origin[0], bounds.y - self.origin[1])
+
+    def _optimize(self, image):
+        """
+        Pick the fastest way to store a baked image
+
+        Procedural sprites are usually drawn with solid colors only, so every
+        pixel is either fully see-through or fully solid. Those become
+        colorkey surfaces with RLE acceleration, which blit several times
+        faster than per-pixel alpha. Anything else keeps its alpha channel.
+        """
+        if image.get_width() == 0 or image.get_height() == 0:
+            return image
+        alpha = pygame.surfarray.array_alpha(image)
+        solid = alpha == 255
+        colors = pygame.surfarray.array3d(image)
+        uses_key = np.all(colors[solid] == BAKE_COLORKEY, axis=-1).any()
+        if not np.all(solid | (alpha == 0)) or uses_key:
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+            return image
+
+        keyed = pygame.Surface(image.get_size())
+        keyed.fill(BAKE_COLORKEY)
+        keyed.blit(image, (0, 0))
+        if pygame.display.get_surface() is not None:
+            keyed = keyed.convert()
+        keyed.set_colorkey(BAKE_COLORKEY, pygame.RLEACCEL)
+        return keyed
+
+    def get_sprite(self, entity, variant=None):
+        """Return the cached (image, offset) for the entity's current pose"""
+        key = (variant, self.quantize(entity))
+        sprite = self.cache.get(key)
+        if sprite is None:
+            if len(self.cache) >= self.max_entries:
+                self.cache.clear()
+            sprite = self.bake(entity, key[1])
+            self.cache[key] = sprite
+        return sprite
+
+    def draw(self, entity, surface, x, y, variant=None):
+        """
+        Draw the entity at (x, y) from the cache (or procedurally if disabled)
+
+        Args:
+            entity: The object whose sprite is drawn
+            surface (pygame.Surface): Surface to draw on
+            x, y (float): Position the procedural code would have drawn at
+            variant: Extra cache key for entities sharing a baker (e.g. character type)
+        """
+        if not SpriteBaker.enabled:
+            self.render(entity, surface, x, y)
+            return
+        image, (offset_x, offset_y) = self.get_sprite(entity, variant)
+        surface.blit(image, (int(x) + offset_x, int(y) + offset_y))
+
+    def clear(self):
+        """Forget every baked pose (they are rebuilt on demand)"""
+        self.cache.clear()
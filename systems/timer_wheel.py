@@ -0,0 +1,227 @@
+"""
+Timer Wheel Module
+==================
+
+This module contains the TimerWheel class, a scheduler for things that
+should happen "N ticks from now": an enemy's next step, the next enemy or
+item spawn, the next puff of area particles, a delayed hit in battle.
+
+WHAT THIS MODULE DOES:
+======================
+Instead of every object counting its own timer down by one every frame,
+each timer is filed in the slot of the tick it is due. Advancing the
+wheel by one tick only looks at that one slot, so a thousand idle enemies
+waiting for their next step cost nothing until their turn comes.
+
+The wheel is "hierarchical", like the hands of a clock:
+- Level 0 has WHEEL_SLOTS slots of one tick each (the next 64 ticks)
+- Level 1 has WHEEL_SLOTS slots of 64 ticks each (the next 4,096 ticks)
+- ... and so on, WHEEL_LEVELS levels deep (about 77 hours at 60 ticks/s)
+- Timers even further away wait in an overflow list
+When the lower hand wraps around, the timers in the next slot of the
+level above are "cascaded" down into finer slots. Scheduling, cancelling
+and firing a timer each cost O(1), however many timers there are.
+
+- schedule() starts a callback `delay` ticks from now (optionally
+  repeating every `period` ticks) and returns its Timer
+- timer() makes a Timer that is not running yet (start it with reschedule)
+- Timer.cancel() stops a timer; Timer.reschedule() restarts it
+- advance() moves the wheel one tick on and runs the callbacks due
+
+Timers due on the same tick always run in the order the timers were
+created (a repeating or rescheduled timer keeps its place), so the game
+plays out the same way every time and replays stay in sync.
+
+FOR NOVICE CODERS:
+==================
+Think of it like a wall calendar instead of a stack of egg timers:
+- An egg timer has to tick every second, even if it rings in a week
+- A note on the calendar just sits there until you turn to its page
+
+    wheel = TimerWheel()
+    timer = wheel.schedule(60, enemy.step, period=60)  # Every second
+    wheel.advance()                                     # Once per tick
+    timer.remaining                                     # Ticks to go
+    timer.cancel()                                      # Never mind
+
+RESOURCE: This module provides the hierarchical timer wheel for game and entity timers.
+"""
+
+from config.constants import *
+
+# Slots per level (as a power of two: 2 ** 6 = 64)
+WHEEL_BITS = 6
+WHEEL_SLOTS = 1 << WHEEL_BITS
+
+# Levels of slots before the overflow list
+WHEEL_LEVELS = 4
+
+# Marks a timer that was taken out of its slot to run this tick
+_DUE = {}
+
+
+class Timer:
+    """
+    One scheduled callback on a TimerWheel
+
+    Attributes:
+        wheel (TimerWheel): The wheel the timer runs on
+        callback: Function called when the timer fires
+        args (tuple): Arguments passed to the callback
+        period (int): Ticks between repeats (None = fire once)
+        due (int): Wheel tick the timer fires on
+        order (int): Creation number (orders timers due on the same tick)
+        slot (dict): Slot the timer is filed in (None while not running)
+    """
+
+    __slots__ = ("wheel", "callback", "args", "period", "due", "order", "slot")
+
+    def __init__(self, wheel, callback, args, period, order):
+        self.wheel = wheel
+        self.callback = callback
+        self.args = args
+        self.period = period
+        self.due = None
+        self.order = order
+        self.slot = None
+
+    @property
+    def active(self):
+        """True while the timer is waiting to fire"""
+        return self.slot is not None
+
+    @property
+    def remaining(self):
+        """Ticks until the timer fires (0 when it is not running)"""
+        return self.due - self.wheel.now if self.active else 0
+
+    def cancel(self):
+        """Stop the timer; returns False if it was not running"""
+        return self.wheel.cancel(self)
+
+    def reschedule(self, delay, period=None):
+        """(Re)start the timer `delay` ticks from now, whether or not it was running"""
+        self.wheel.reschedule(self, delay, period)
+
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel, advanced one tick at a time
+
+    Attributes:
+        now (int): Ticks advanced so far
+        levels (list): Per level, WHEEL_SLOTS slots; each slot is {Timer: None}
+        overflow (dict): Timers due further away than the top level reaches
+        counter (int): Creation number given to the next timer
+        count (int): Timers running
+    """
+
+    def __init__(self, levels=WHEEL_LEVELS):
+        self.now = 0
+        self.levels = [[{} for _ in range(WHEEL_SLOTS)] for _ in range(levels)]
+        self.overflow = {}
+        self.counter = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def timer(self, callback, *args, period=None):
+        """Make a Timer that isn't running yet (start it with Timer.reschedule)"""
+        timer = Timer(self, callback, args, period, self.counter)
+        self.counter += 1
+        return timer
+
+    def schedule(self, delay, callback, *args, period=None):
+        """
+        Run callback(*args) `delay` ticks from now (at least one tick)
+
+        Args:
+            delay (int): Ticks to wait
+            callback: Function to call
+            period (int): Repeat every `period` ticks after that (None = once)
+
+        Returns:
+            Timer: Handle to cancel or reschedule the callback
+        """
+        timer = self.timer(callback, *args, period=period)
+        self.reschedule(timer, delay)
+        return timer
+
+    def reschedule(self, timer, delay, period=None):
+        """Move a timer to `delay` ticks from now (starting it if it was stopped)"""
+        self.cancel(timer)
+        if period is not None:
+            timer.period = period
+        timer.due = self.now + max(1, int(delay))
+        self._file(timer)
+        self.count += 1
+
+    def cancel(self, timer):
+        """Stop a timer; returns False if it was not running"""
+        slot = timer.slot
+        if slot is None:
+            return False
+        if slot is not _DUE:
+            del slot[timer]
+        timer.slot = None
+        self.count -= 1
+        return True
+
+    def _file(self, timer):
+        """Put a timer in the finest slot that reaches its due tick"""
+        delta = timer.due - self.now
+        for level, slots in enumerate(self.levels):
+            if delta < 1 << (WHEEL_BITS * (level + 1)):
+                slot = slots[(timer.due >> (WHEEL_BITS * level)) & (WHEEL_SLOTS - 1)]
+                break
+        else:
+            slot = self.overflow
+        slot[timer] = None
+        timer.slot = slot
+
+    def _cascade(self, slot):
+        """Refile the timers of a coarse slot now that they are close"""
+        timers = list(slot)
+        slot.clear()
+        for timer in timers:
+            self._file(timer)
+
+    def advance(self):
+        """
+        Move the wheel on one tick and run the callbacks that are due
+
+        Returns:
+            int: How many callbacks ran
+        """
+        self.now += 1
+        now = self.now
+        if now & ((1 << (WHEEL_BITS * len(self.levels))) - 1) == 0:
+            self._cascade(self.overflow)
+        # Coarsest level first, so timers can cascade through several levels at once
+        for level in range(len(self.levels) - 1, 0, -1):
+            shift = WHEEL_BITS * level
+            if now & ((1 << shift) - 1) == 0:
+                self._cascade(self.levels[level][(now >> shift) & (WHEEL_SLOTS - 1)])
+
+        slot = self.levels[0][now & (WHEEL_SLOTS - 1)]
+        if not slot:
+            return 0
+        due = sorted(slot, key=lambda timer: timer.order)
+        slot.clear()
+        for timer in due:
+            timer.slot = _DUE
+        fired = 0
+        for timer in due:
+            if timer.slot is not _DUE:
+                continue  # Cancelled or rescheduled by a callback that ran before it
+            timer.slot = None
+            self.count -= 1
+            if timer.period:
+                # Refiled before the call, so the callback may still cancel or reschedule it
+                timer.due = now + timer.period
+                self._file(timer)
+                self.count += 1
+            timer.callback(*timer.args)
+            fired += 1
+        return fired
@@ -0,0 +1,97 @@
+"""
+DRAGON'S LAIR RPG - Entity Store Tests
+======================================
+
+This module tests the array-backed entity store: handles stay valid
+while rows are swap-removed, per-area membership keeps spawn order, and
+Enemy/Item objects read and write their table rows as thin views.
+
+RESOURCE: This demonstrates the systems.entity_store.EntityStore class.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from config.constants import *
+from entities.enemy import Enemy
+from entities.item import Item
+from systems.entity_store import EntityStore
+
+
+def make_enemy(x, y):
+    enemy = Enemy(1)
+    enemy.x, enemy.y = x, y
+    return enemy
+
+
+def test_swap_remove_keeps_handles():
+    """Removing entities in any order never mixes up the survivors' fields"""
+    print("🧪 Testing entity store handles...")
+    store = EntityStore()
+    table = store.table("enemy")
+    enemies = [make_enemy(i * GRID_SIZE, i) for i in range(40)]
+    for enemy in enemies:
+        store.add("enemy", enemy, area=(0, 0))
+    generator = random.Random(3)
+    alive = list(enemies)
+    while alive:
+        enemy = alive.pop(generator.randrange(len(alive)))
+        x = enemy.x
+        assert store.remove(enemy) and not store.remove(enemy)
+        assert enemy.x == x and enemy.entity_handle is None  # Fields went back to the object
+        assert len(table) == len(alive)
+        for survivor in alive:
+            assert survivor.x == enemies.index(survivor) * GRID_SIZE
+        assert sorted(table.column("y")) == sorted(s.y for s in alive)
+    # Freed handles are given out again
+    store.add("enemy", enemies[0], area=(0, 0))
+    assert enemies[0].entity_handle < 40
+    print("  ✅ Handles survive swap-removes")
+
+
+def test_area_membership():
+    """Each area lists its own entities in spawn order"""
+    print("🧪 Testing per-area indexes...")
+    store = EntityStore()
+    a = [make_enemy(i, 0) for i in range(5)]
+    b = [make_enemy(i, 1) for i in range(3)]
+    for enemy in a:
+        store.add("enemy", enemy, area=(0, 0))
+    for enemy in b:
+        store.add("enemy", enemy, area=(1, 0))
+    store.remove(a[1])
+    assert store.members("enemy", (0, 0)) == [a[0], a[2], a[3], a[4]]
+    assert store.members("enemy", (1, 0)) == b
+    assert store.count("enemy", (0, 0)) == 4 and store.count("enemy", (2, 2)) == 0
+    item = Item()
+    item.x, item.y = 10, 20
+    store.add("item", item, area=(0, 0))
+    assert store.members("item", (0, 0)) == [item] and store.table("item").column("x")[0] == 10
+    print("  ✅ Areas keep their own ordered sets")
+
+
+def test_views_write_through():
+    """Changing an attribute of a stored enemy changes its row, and back"""
+    print("🧪 Testing entity views...")
+    store = EntityStore()
+    enemy = make_enemy(100, 200)
+    health = enemy.health
+    store.add("enemy", enemy, area=(0, 0))
+    assert "x" not in enemy.__dict__ and enemy.x == 100 and enemy.health == health
+    enemy.health -= 5
+    store.table("enemy").column("x")[:] += GRID_SIZE
+    assert enemy.health == health - 5 and enemy.x == 100 + GRID_SIZE
+    for _ in range(enemy.movement_delay * 3):
+        enemy.update(0, 0)  # Enemy.update runs unchanged on a stored enemy
+    store.remove(enemy)
+    assert enemy.__dict__["health"] == health - 5
+    print("  ✅ Enemy attributes are views of the table")
+
+
+if __name__ == "__main__":
+    test_swap_remove_keeps_handles()
+    test_area_membership()
+    test_views_write_through()
+    print("\n🎉 Entity store tests passed!")
@@ -0,0 +1,138 @@
+"""
+DRAGON'S LAIR RPG - Horde Mode Tests
+====================================
+
+This module tests the vectorized horde: one batched step follows the same
+cooldown and world-boundary rules as Enemy.update, the batched overlap
+and nearest-enemy checks agree with checking every enemy one by one, and
+a horde neither spawns on the player nor catches them again right after
+a battle.
+
+RESOURCE: This demonstrates the systems.horde module.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import random
+import numpy as np
+import pygame
+from config.constants import *
+from entities.enemy import Enemy
+from world.world_area import WorldArea
+from systems import horde
+
+
+def make_horde(count, seed=0):
+    """A horde area filled with `count` enemies at random grid spots"""
+    generator = random.Random(seed)
+    area = WorldArea(0, 0, "plains", horde=True)
+    for _ in range(count):
+        enemy = Enemy(1)
+        enemy.x = generator.randrange(0, AREA_WIDTH, GRID_SIZE)
+        enemy.y = generator.randrange(0, AREA_HEIGHT, GRID_SIZE)
+        enemy.movement_cooldown = generator.randint(0, 5)
+        enemy.movement_delay = generator.randint(1, 5)
+        area.add_enemy(enemy)
+    return area, generator
+
+
+def test_step_rules():
+    """Enemies step only when their cooldown runs out, one grid square, never off the world"""
+    print("🧪 Testing batched horde steps...")
+    area, _ = make_horde(500)
+    table = area.entities.table("enemy")
+    # Push some enemies against the world's edges
+    for enemy in area.enemies[:50]:
+        enemy.x, enemy.y = 0, WORLD_HEIGHT - GRID_SIZE
+    generator = np.random.default_rng(7)
+    for _ in range(40):
+        before = [(e.x, e.y, e.movement_cooldown, e.movement_delay) for e in area.enemies]
+        horde.step_horde(table, area.enemy_rows(), generator)
+        for enemy, (x, y, cooldown, delay) in zip(area.enemies, before):
+            if cooldown - 1 > 0:
+                assert (enemy.x, enemy.y, enemy.movement_cooldown) == (x, y, cooldown - 1)
+            else:
+                assert enemy.movement_cooldown == delay
+                assert abs(enemy.x - x) + abs(enemy.y - y) in (0, GRID_SIZE)
+            assert 0 <= enemy.x < WORLD_WIDTH and 0 <= enemy.y < WORLD_HEIGHT
+    print("  ✅ Cooldowns, grid steps and world bounds match Enemy.update")
+
+
+def test_queries_match_brute_force():
+    """first_overlap and nearest_enemy find what a linear scan finds"""
+    print("🧪 Testing batched horde queries...")
+    area, generator = make_horde(300, seed=3)
+    enemies = area.enemies
+    for _ in range(200):
+        x, y = generator.randint(-50, AREA_WIDTH), generator.randint(-50, AREA_HEIGHT)
+        box = pygame.Rect(x, y, PLAYER_SIZE, PLAYER_SIZE)
+        hits = [e for e in enemies if box.colliderect(pygame.Rect(e.x, e.y, ENEMY_SIZE, ENEMY_SIZE))]
+        assert area.enemy_at(x, y, PLAYER_SIZE, PLAYER_SIZE) is (hits[0] if hits else None)
+
+        closest = min(enemies, key=lambda e: math.hypot(e.x - x, e.y - y))
+        found = area.nearest_enemy(x, y)
+        assert math.hypot(found.x - x, found.y - y) == math.hypot(closest.x - x, closest.y - y)
+        within = area.nearest_enemy(x, y, max_radius=60)
+        assert (within is None) == (math.hypot(closest.x - x, closest.y - y) > 60)
+    assert WorldArea(1, 0, "plains", horde=True).nearest_enemy(0, 0) is None
+    print("  ✅ Overlap and nearest checks agree with a linear scan")
+
+
+def test_rows_follow_the_store():
+    """The cached row array is reused until an enemy is added or removed"""
+    print("🧪 Testing horde row cache...")
+    area, _ = make_horde(20)
+    rows = area.enemy_rows()
+    assert area.enemy_rows() is rows
+    first = area.enemies[0]
+    area.remove_enemy(first)
+    rows = area.enemy_rows()
+    assert len(rows) == 19 and first not in area.enemies
+    table = area.entities.table("enemy")
+    assert [table.views[table.handles[row]] for row in rows] == area.enemies
+    assert len(area.index) == 0  # Horde enemies stay out of the spatial hash
+    print("  ✅ Row arrays follow spawns and removals")
+
+
+def test_player_gets_room():
+    """Horde spawns keep HORDE_SAFE_RADIUS away; a battle is followed by a grace period"""
+    print("🧪 Testing horde spawn radius and battle grace...")
+    from core.game import Game
+    from entities.player_characters.character import Character
+    game = Game(dirty_rects=False, music_workers=0, horde=True)
+    game.player = Character("Warrior")
+    game.start_game()
+    game.state = "overworld"
+    area = game.world_map.get_current_area()
+    assert area.horde
+    game.spawn_enemy()
+    player = game.player
+    assert all(math.hypot(e.x - player.x, e.y - player.y) >= HORDE_SAFE_RADIUS for e in area.enemies)
+
+    # Walk an enemy onto the player: the first touch starts a battle...
+    area.enemies[0].x, area.enemies[0].y = player.x, player.y
+    game.update()
+    assert game.state == "battle"
+    # ...and straight after it, touching enemies are ignored until the grace period ends
+    game.battle_screen = None
+    game.state = "overworld"
+    for enemy in area.enemies[:2]:
+        enemy.x, enemy.y = player.x, player.y
+    game.update()
+    assert game.state == "overworld"
+    game.battle_grace_until = game.timers.now
+    game.update()
+    assert game.state == "battle"
+    game.music.shutdown()
+    print("  ✅ The player is never spawned on or caught again at once")
+
+
+if __name__ == "__main__":
+    test_step_rules()
+    test_queries_match_brute_force()
+    test_rows_follow_the_store()
+    test_player_gets_room()
+    print("\n🎉 Horde mode tests passed!")
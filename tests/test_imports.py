@@ -0,0 +1,73 @@
+"""
+DRAGON'S LAIR RPG - Import Tests
+================================
+
+This module tests that every game module can be the first thing a program
+imports. Each import runs in a fresh Python process, so an import cycle
+(like entities -> systems -> boss_system -> entities) can't hide behind a
+module some earlier import already loaded.
+
+RESOURCE: This demonstrates that the game's packages import cleanly on their own.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must work as a program's first import
+FIRST_IMPORTS = [
+    "entities.enemy",
+    "entities.item",
+    "entities.guard",
+    "entities.dark_knight",
+    "entities.dragon",
+    "entities.boss_dragons",
+    "entities.player_characters.warrior",
+    "entities.player_characters.mage",
+    "entities.player_characters.rogue",
+    "systems",
+    "systems.boss_system",
+    "world.world_area",
+    "ui.start_screen",
+    "core.game",
+]
+
+
+def import_alone(module_name):
+    """Import one module in a fresh interpreter; returns (ok, error output)"""
+    result = subprocess.run([sys.executable, "-c", f"import {module_name}"], cwd=ROOT,
+                            capture_output=True, text=True, timeout=120)
+    return result.returncode == 0, result.stderr.strip().splitlines()[-1:]
+
+
+def test_first_imports():
+    """Every module imports in a fresh process, whatever it pulls in"""
+    print("🧪 Testing first imports...")
+    failures = {}
+    for module_name in FIRST_IMPORTS:
+        ok, error = import_alone(module_name)
+        if not ok:
+            failures[module_name] = error
+    assert not failures, failures
+    print(f"  ✅ {len(FIRST_IMPORTS)} modules import on their own")
+
+
+def test_boss_system_export():
+    """systems.BossSystem still works, although it is only imported on first use"""
+    print("🧪 Testing the lazy BossSystem export...")
+    result = subprocess.run([sys.executable, "-c",
+                             "import systems; from systems.boss_system import BossSystem; "
+                             "assert systems.BossSystem is BossSystem"],
+                            cwd=ROOT, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    print("  ✅ BossSystem is still exported from systems")
+
+
+if __name__ == "__main__":
+    test_first_imports()
+    test_boss_system_export()
+    print("\n🎉 Import tests passed!")
@@ -0,0 +1,104 @@
+"""
+DRAGON'S LAIR RPG - Music Cache Tests
+=====================================
+
+This module tests the on-disk music cache: tracks come back exactly as
+they were stored, damaged files fall back to live synthesis, and old
+tracks are evicted when the cache gets too big.
+
+RESOURCE: This demonstrates the audio.music_cache.MusicCache class.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import time
+import numpy as np
+from audio.music_cache import MusicCache, PCM_HEADER, track_key
+from audio.music_system import MusicSystem, SYNTH_VERSION
+
+MELODY = [(440, 0.5), (523.25, 0.5), (0, 0.25), (659.25, 1)]
+BASS = [(110, 1), (130.81, 1.25)]
+
+
+def make_song(frames, seed=0):
+    """Random int16 stereo samples"""
+    return np.random.default_rng(seed).integers(-32768, 32767, (frames, 2), dtype=np.int16)
+
+
+def test_round_trip():
+    """A stored track loads back identical (and memory-mapped)"""
+    print("🧪 Testing music cache...")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = MusicCache(directory)
+        song = make_song(5000)
+        assert cache.load("abc") is None
+        assert cache.store("abc", song)
+        loaded = cache.load("abc")
+        assert isinstance(loaded, np.memmap) and np.array_equal(loaded, song)
+        assert (cache.hits, cache.misses) == (1, 1)
+        del loaded
+        assert not [name for name in os.listdir(directory) if name.endswith(".tmp")], "temp file left behind"
+    print("  ✅ Round trip")
+
+
+def test_damaged_files_fall_back():
+    """Cut-short, flipped-bit and garbage files are rejected and deleted"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = MusicCache(directory)
+        damage = {
+            "short": lambda data: data[:-10],
+            "flipped": lambda data: data[:PCM_HEADER.size + 7] + bytes([data[PCM_HEADER.size + 7] ^ 1])
+                                    + data[PCM_HEADER.size + 8:],
+            "garbage": lambda data: b"not a track",
+        }
+        for key, spoil in damage.items():
+            cache.store(key, make_song(1000))
+            with open(cache.path(key), "rb") as pcm_file:
+                data = pcm_file.read()
+            with open(cache.path(key), "wb") as pcm_file:
+                pcm_file.write(spoil(data))
+            assert cache.load(key) is None, f"{key} file was accepted"
+            assert not os.path.exists(cache.path(key)), f"{key} file was not deleted"
+    print("  ✅ Damaged files are re-synthesized")
+
+
+def test_eviction():
+    """The least recently used tracks go first when the cache is full"""
+    with tempfile.TemporaryDirectory() as directory:
+        track_bytes = PCM_HEADER.size + 1000 * 4
+        cache = MusicCache(directory, max_bytes=3 * track_bytes)
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.store(key, make_song(1000, i))
+            os.utime(cache.path(key), (time.time() - 100 + i, time.time() - 100 + i))
+        cache.load("a")  # "a" is now the most recently used
+        cache.store("d", make_song(1000, 3))
+        assert sorted(name[0] for name in os.listdir(directory)) == ["a", "c", "d"]
+    print("  ✅ Least recently used track evicted")
+
+
+def test_music_system_uses_cache():
+    """Cached songs are identical to live synthesis, and keys follow the notes"""
+    with tempfile.TemporaryDirectory() as directory:
+        music = MusicSystem.__new__(MusicSystem)
+        music.cache = MusicCache(directory)
+        expected = music.render_chiptune_song(MELODY, BASS, bpm=100, volume=0.3)
+        first = music.chiptune_song(MELODY, BASS, bpm=100, volume=0.3)
+        second = music.chiptune_song(MELODY, BASS, bpm=100, volume=0.3)
+        assert (music.cache.misses, music.cache.hits) == (1, 1)
+        assert np.array_equal(first, expected) and np.array_equal(second, expected)
+
+        key = track_key(SYNTH_VERSION, melody=MELODY, bass=BASS, bpm=100)
+        assert key != track_key(SYNTH_VERSION, melody=MELODY, bass=BASS, bpm=101)
+        assert key != track_key(SYNTH_VERSION + 1, melody=MELODY, bass=BASS, bpm=100)
+    print("  ✅ MusicSystem reads and writes the cache")
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_damaged_files_fall_back()
+    test_eviction()
+    test_music_system_uses_cache()
+    print("\n🎉 Music cache tests passed!")
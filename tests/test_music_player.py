@@ -0,0 +1,86 @@
+"""
+DRAGON'S LAIR RPG - Music Player Tests
+======================================
+
+This module tests music playback: long tracks are split into chunks
+that cover every sample exactly once, and switching tracks crossfades
+the old deck out while the new one fades in.
+
+RESOURCE: This demonstrates the audio.music_player.MusicPlayer class.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+from core import engine
+from audio.music_player import MusicPlayer, chunk_bounds
+
+
+def make_song(seconds):
+    """Quiet int16 stereo samples"""
+    return np.zeros((int(44100 * seconds), 2), dtype=np.int16)
+
+
+def fresh_player(**options):
+    """A MusicPlayer on a silent mixer, whatever earlier tests left playing"""
+    engine.init_audio()
+    pygame.mixer.stop()
+    return MusicPlayer(**options)
+
+
+def test_chunk_bounds():
+    """Chunks follow each other without gaps and end at the last frame"""
+    print("🧪 Testing music player...")
+    chunks = chunk_bounds(10_000, 3_000)
+    assert chunks == [(0, 3000), (3000, 6000), (6000, 9000), (9000, 10000)]
+    assert chunk_bounds(3_000, 3_000) == [(0, 3000)]
+    print("  ✅ Chunks cover the whole track")
+
+
+def test_streaming():
+    """Long tracks are streamed chunk by chunk, short ones are one looping Sound"""
+    player = fresh_player(crossfade_ms=0, chunk_seconds=0.5)
+    player.play("long", make_song(3), now=0.0)
+    deck = player.current
+    assert len(deck.chunks) == 6 and deck.channel.get_queue() is not None
+    assert deck.next_chunk == 2  # One chunk playing, one queued behind it
+
+    player.play("short", make_song(0.8), now=1.0)
+    assert player.current.name == "short" and player.current.chunks == [(0, 35280)]
+    player.stop_now()
+    print("  ✅ Long tracks stream, short tracks loop")
+
+
+def test_crossfade():
+    """The old track fades out while the new one fades in, then its deck is freed"""
+    player = fresh_player(volume=0.5, crossfade_ms=1000)
+    player.play("overworld", make_song(1), now=0.0)
+    player.update(now=1.0)
+    old = player.current
+    assert old.channel.get_volume() == 0.5
+
+    player.play("overworld", make_song(1), now=1.5)  # Same track: nothing happens
+    assert player.current is old and old.volume(1.5) == 1.0
+
+    player.play("battle", make_song(1), now=2.0)
+    new = player.current
+    assert new is not old and new.name == "battle"
+    player.update(now=2.5)
+    assert abs(old.channel.get_volume() - 0.25) < 0.01
+    assert abs(new.channel.get_volume() - 0.25) < 0.01
+
+    player.update(now=3.0)
+    assert old.name is None and not old.channel.get_busy()
+    assert abs(new.channel.get_volume() - 0.5) < 0.01
+    player.stop_now()
+    print("  ✅ Tracks crossfade")
+
+
+if __name__ == "__main__":
+    test_chunk_bounds()
+    test_streaming()
+    test_crossfade()
+    print("\n🎉 Music player tests passed!")
@@ -0,0 +1,82 @@
+"""
+DRAGON'S LAIR RPG - Chiptune Synthesizer Tests
+==============================================
+
+This module tests the chiptune synthesizer: every track keeps the exact
+length and note timing of the original algorithm, and notes start and
+end at silence so there are no clicks between them.
+
+RESOURCE: This demonstrates the audio.music_system.MusicSystem synthesizer.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from audio.music_system import MusicSystem, TRACKS
+
+
+def reference_length(melody, bass, percussion=None, lead=None, bpm=220, volume=0.16):
+    """Song length in samples of the original synthesizer (one np.linspace per note step)"""
+    voices = [[list(note) for note in voice] if voice is not None else []
+              for voice in (melody, bass, percussion, lead)]
+    positions = [0, 0, 0, 0]
+    length = 0
+    while any(position < len(voice) for position, voice in zip(positions, voices)):
+        notes = [voice[position] if position < len(voice) else (0, 0.25)
+                 for position, voice in zip(positions, voices)]
+        step_beats = min(beats for _, beats in notes)
+        length += int(44100 * (60 / bpm * step_beats))
+        for i, voice in enumerate(voices):
+            if positions[i] < len(voice):
+                voice[positions[i]][1] -= step_beats
+                if voice[positions[i]][1] <= 0:
+                    positions[i] += 1
+    return length
+
+
+def test_tracks_keep_timing():
+    """Every game track is as long as before and stays inside its volume"""
+    print("🧪 Testing chiptune synthesizer...")
+    music = MusicSystem.__new__(MusicSystem)  # No mixer needed to render arrays
+    for track in TRACKS:
+        recipe = music.track_recipe(track)
+        song = music.render_chiptune_song(**recipe)
+        assert song.dtype == np.int16 and song.shape == (reference_length(**recipe), 2), track
+        assert np.array_equal(song[:, 0], song[:, 1])
+        assert np.abs(song.astype(np.int32)).max() <= recipe["volume"] * 32767 + 1
+        print(f"  ✅ {track}: {len(song)} samples")
+
+
+def test_notes_do_not_click():
+    """Every note fades in from and out to silence"""
+    music = MusicSystem.__new__(MusicSystem)
+    melody = [(440, 0.5), (660, 0.5), (440, 0.5)]
+    song = music.render_chiptune_song(melody, [], bpm=120, volume=1.0)[:, 0].astype(np.int32)
+    length, notes = music.chiptune_notes(melody, [], bpm=120)
+    for start, samples, _ in notes[0]:
+        assert song[start] == 0 and abs(song[start + samples - 1]) < 300
+    # No jump between neighbouring samples is bigger than the wave itself makes
+    assert np.abs(np.diff(song)).max() < 32767 * 2 * np.pi * 660 / 44100 * 1.1
+
+
+def test_uneven_voices():
+    """Voices of different lengths, rests and a missing lead keep the original timing"""
+    music = MusicSystem.__new__(MusicSystem)
+    melody = [(440, 0.3), (0, 0.2), (523.25, 0.7)]
+    bass = [(110, 1.5)]
+    percussion = [(200, 0.1), (0, 0.15)] * 3
+    args = (melody, bass, percussion, None, 133, 0.9)  # Loud enough to clip
+    song = music.render_chiptune_song(*args)
+    assert len(song) == reference_length(*args)
+    length, notes = music.chiptune_notes(*args[:5])
+    assert [len(voice) for voice in notes] == [2, 1, 3, 0]  # Rests are left out
+    assert notes[0][1][0] == int(44100 * 60 / 133 * 0.1) * 5  # Second melody note starts after 0.5 beats
+
+
+if __name__ == "__main__":
+    test_tracks_keep_timing()
+    test_notes_do_not_click()
+    test_uneven_voices()
+    print("\n🎉 Chiptune synthesizer tests passed!")
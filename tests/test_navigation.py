@@ -0,0 +1,147 @@
+"""
+DRAGON'S LAIR RPG - Navigation Tests
+====================================
+
+This module tests enemy pursuit: navigation grids block exactly the squares
+the town's buildings and walls touch, flow fields agree with a plain
+breadth-first search, the area only searches again when the player changes
+square, and enemies (single or in a horde) step toward the player.
+
+RESOURCE: This demonstrates the systems.navigation module.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from collections import deque
+import numpy as np
+from config.constants import *
+from entities.enemy import Enemy
+from world.world_area import WorldArea
+from systems.navigation import NavGrid, FlowField, UNREACHED
+from systems import horde
+
+
+def brute_force_distances(blocked, target):
+    """Steps from every square to the target, one square at a time"""
+    rows, cols = blocked.shape
+    distance = {target: 0}
+    queue = deque([target])
+    while queue:
+        col, row = queue.popleft()
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            cell = (col + dx, row + dy)
+            if 0 <= cell[0] < cols and 0 <= cell[1] < rows and not blocked[cell[1], cell[0]] and cell not in distance:
+                distance[cell] = distance[(col, row)] + 1
+                queue.append(cell)
+    return distance
+
+
+def test_flow_matches_brute_force():
+    """Distances match a one-square-at-a-time search; every step gets one closer"""
+    print("🧪 Testing flow fields against a plain search...")
+    generator = random.Random(5)
+    for _ in range(30):
+        grid = NavGrid(0, 0, 20, 14)
+        grid.blocked[:] = np.array([[generator.random() < 0.3 for _ in range(20)] for _ in range(14)])
+        target = (generator.randrange(20), generator.randrange(14))
+        flow = FlowField(grid, target)
+        expected = brute_force_distances(grid.blocked, target)
+        for row in range(14):
+            for col in range(20):
+                steps = flow.distance[row, col]
+                assert steps == expected.get((col, row), UNREACHED), (col, row)
+                if 0 < steps < UNREACHED:
+                    dx, dy = flow.direction(col * GRID_SIZE + 1, row * GRID_SIZE + 1)
+                    assert abs(dx) + abs(dy) == 1
+                    assert flow.distance[row + dy, col + dx] == steps - 1
+        assert flow.direction(*[v * GRID_SIZE for v in target]) == (0, 0)
+        assert flow.direction(-1, 0) is None
+    print("  ✅ Distances and steps agree with a plain breadth-first search")
+
+
+def test_town_grid():
+    """Buildings, walls and towers block; the gate lets enemies through"""
+    print("🧪 Testing the town navigation grid...")
+    area = WorldArea(1, 1, "town")
+    grid = area.nav_grid
+    world_x, world_y = area.get_world_position()
+    assert (grid.origin_x, grid.origin_y) == (world_x, world_y)
+    assert grid.blocked[4, 0] and grid.blocked[4, 19]           # Wall
+    assert not grid.blocked[4, 9] and not grid.blocked[4, 10]   # Gate
+    assert grid.blocked[8, 9]                                   # Town hall
+    # Walking the field from the top-left corner reaches the player through the gate
+    flow = area.pursue(world_x + 150, world_y + 650)
+    x, y = world_x, world_y
+    crossed = []
+    for _ in range(100):
+        direction = flow.direction(x, y)
+        if direction == (0, 0):
+            break
+        x, y = x + direction[0] * GRID_SIZE, y + direction[1] * GRID_SIZE
+        assert not grid.blocked[grid.cell_of(x, y)[::-1]]
+        if grid.cell_of(x, y)[1] == 4:
+            crossed.append(grid.cell_of(x, y)[0])
+    assert grid.cell_of(x, y) == flow.target == (3, 13)
+    assert crossed and set(crossed) <= {9, 10}
+    print("  ✅ Enemies path around buildings and through the gate")
+
+
+def test_flow_cache():
+    """The field is only searched again when the player changes square or the layout changes"""
+    print("🧪 Testing the flow field cache...")
+    area = WorldArea(1, 1, "town")
+    world_x, world_y = area.get_world_position()
+    flow = area.pursue(world_x + 500, world_y + 650)
+    assert area.pursue(world_x + 510, world_y + 640) is flow
+    assert area.pursue(world_x + 550, world_y + 650) is not flow
+    grid = area.nav_grid
+    version = area.layout_version
+    area.buildings.append({"type": "house", "x": 0, "y": 0, "width": 50, "height": 50, "collision": True})
+    area.invalidate_town_layer()
+    assert area.layout_version == version + 1
+    assert area.nav_grid is not grid and area.nav_grid.blocked[0, 0]
+    assert area.pursue(world_x + 550, world_y + 650) is not flow
+    print("  ✅ Searches only run when something changed")
+
+
+def test_enemies_chase():
+    """Area enemies and horde enemies both close in on the player"""
+    print("🧪 Testing enemy pursuit...")
+    area = WorldArea(0, 0, "plains")
+    enemy = Enemy(1)
+    enemy.x, enemy.y = 900, 600
+    area.add_enemy(enemy)
+    for _ in range(enemy.movement_delay * 30):
+        area.tick(100, 100)
+    assert (enemy.x, enemy.y) == (100, 100)
+    assert area.index.query_rect(100, 100, 1, 1, kind="enemy") == [enemy]
+
+    crowd = WorldArea(0, 0, "plains", horde=True)
+    generator = random.Random(2)
+    for _ in range(200):
+        member = Enemy(1)
+        member.x = generator.randrange(0, AREA_WIDTH, GRID_SIZE)
+        member.y = generator.randrange(0, AREA_HEIGHT, GRID_SIZE)
+        crowd.add_enemy(member)
+    table = crowd.entities.table("enemy")
+    flow = crowd.pursue(500, 350)
+    xs, ys = table.columns["x"][crowd.enemy_rows()], table.columns["y"][crowd.enemy_rows()]
+    dx, dy, valid = flow.directions(xs, ys)
+    assert valid.all()
+    assert [flow.direction(x, y) for x, y in zip(xs, ys)] == list(zip(dx.tolist(), dy.tolist()))
+    before = [abs(m.x - 500) + abs(m.y - 350) for m in crowd.enemies]
+    horde.step_horde(table, crowd.enemy_rows(), np.random.default_rng(0), flow=flow)
+    after = [abs(m.x - 500) + abs(m.y - 350) for m in crowd.enemies]
+    assert all(b - a == GRID_SIZE or a == b == 0 for b, a in zip(before, after))
+    print("  ✅ Enemies step toward the player, one by one or all at once")
+
+
+if __name__ == "__main__":
+    test_flow_matches_brute_force()
+    test_town_grid()
+    test_flow_cache()
+    test_enemies_chase()
+    print("\n🎉 Navigation tests passed!")
@@ -0,0 +1,102 @@
+"""
+DRAGON'S LAIR RPG - Sound Effect Bank Tests
+===========================================
+
+This module tests the sound effect bank: every sound is rendered in a
+few pitch/gain versions in one pass, the bank survives the disk cache,
+and play() never repeats the version it played last. Effects never take the
+channels the music plays on.
+
+RESOURCE: This demonstrates the audio.sfx_bank.SfxBank class.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import numpy as np
+import pygame
+from audio.music_cache import MusicCache
+from audio.music_player import MusicPlayer
+from audio.oscillator import oscillator
+from audio.sfx_bank import SFX_ENVELOPE, SFX_RECIPES, SfxBank, render_bank, sound_samples
+
+RECIPES = {"arrow": SFX_RECIPES["arrow"], "magic": SFX_RECIPES["magic"]}
+
+
+def test_render_bank():
+    """One column per version; version 0 is the recipe exactly"""
+    print("🧪 Testing SFX bank rendering...")
+    bank = render_bank(RECIPES, variations=3)
+    longest = max(sound_samples(recipe) for recipe in RECIPES.values())
+    assert bank.shape == (longest, 6) and bank.dtype == np.int16
+
+    waveform, frequency, _, volume = RECIPES["arrow"]
+    samples = sound_samples(RECIPES["arrow"])
+    wave, _ = oscillator(waveform, frequency, samples)
+    expected = (wave * SFX_ENVELOPE.shape(samples) * volume * 32767).astype(np.int16)
+    assert np.abs(bank[:samples, 0].astype(int) - expected).max() <= 1
+    # The arrow sound is shorter than the magic one: silence after its end
+    assert not bank[samples:, :3].any()
+
+    for first in (0, 3):
+        versions = bank[:, first:first + 3].T
+        assert all(not np.array_equal(a, b) for i, a in enumerate(versions) for b in versions[i + 1:])
+    print("  ✅ Every sound has distinct versions, the first one as composed")
+
+
+def test_cache_round_trip():
+    """A second bank loads from the cache instead of rendering"""
+    print("🧪 Testing SFX bank cache...")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = MusicCache(directory)
+        bank = SfxBank.__new__(SfxBank)
+        first = bank.load_bank(RECIPES, 3, cache)
+        second = bank.load_bank(RECIPES, 3, cache)
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert np.array_equal(first, second)
+        assert np.array_equal(second, render_bank(RECIPES, 3))
+    print("  ✅ The bank is rendered once and loaded after that")
+
+
+def test_no_repeats():
+    """pick() never returns the version it returned last"""
+    print("🧪 Testing SFX variation picking...")
+    with tempfile.TemporaryDirectory() as directory:
+        sfx = SfxBank(RECIPES, variations=4, cache=MusicCache(directory))
+    assert set(sfx.sounds) == set(RECIPES)
+    assert all(len(sounds) == 4 for sounds in sfx.sounds.values())
+    picks = [sfx.pick("arrow") for _ in range(200)]
+    assert all(a != b for a, b in zip(picks, picks[1:]))
+    assert set(picks) == {0, 1, 2, 3}
+    sfx.play("arrow")
+    sfx.play("unknown")  # Unknown sounds are silently ignored
+    print("  ✅ Repeated sounds cycle through their versions")
+
+
+def test_music_keeps_its_channels():
+    """Effects played before the music starts leave the music channels free"""
+    print("🧪 Testing SFX and music channels...")
+    with tempfile.TemporaryDirectory() as directory:
+        sfx = SfxBank(RECIPES, variations=4, cache=MusicCache(directory))
+    pygame.mixer.stop()
+    # More effects than the mixer has channels
+    for _ in range(pygame.mixer.get_num_channels() * 2):
+        sfx.play("magic")
+    player = MusicPlayer(crossfade_ms=0, chunk_seconds=0.5)
+    player.play("long", np.zeros((44100 * 3, 2), dtype=np.int16), now=0.0)
+    deck = player.current
+    assert deck.channel.get_queue() is not None
+    assert deck.next_chunk == 2  # The deck's channel was free: one chunk playing, one queued
+    player.stop_now()
+    pygame.mixer.stop()
+    print("  ✅ The music deck still streams after a burst of effects")
+
+
+if __name__ == "__main__":
+    test_render_bank()
+    test_cache_round_trip()
+    test_no_repeats()
+    test_music_keeps_its_channels()
+    print("\n🎉 SFX bank tests passed!")
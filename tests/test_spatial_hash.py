@@ -0,0 +1,117 @@
+"""
+DRAGON'S LAIR RPG - Spatial Hash Tests
+======================================
+
+This module tests the spatial hash: its rectangle, radius and nearest
+queries give the same answers as checking every object one by one, and
+world areas keep it in step as enemies spawn, move and leave.
+
+RESOURCE: This demonstrates the systems.spatial_hash.SpatialHash class.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import random
+import pygame
+from config.constants import *
+from systems.spatial_hash import SpatialHash
+
+
+class Thing:
+    """A plain object with a position"""
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def make_things(count, seed=0):
+    """Random things inside one area, filed in a fresh SpatialHash"""
+    generator = random.Random(seed)
+    index = SpatialHash()
+    things = []
+    for i in range(count):
+        thing = Thing(generator.randint(0, AREA_WIDTH), generator.randint(0, AREA_HEIGHT))
+        things.append(thing)
+        index.insert(thing, thing.x, thing.y, ENEMY_SIZE, ENEMY_SIZE, kind="enemy" if i % 2 else "item")
+    return index, things, generator
+
+
+def test_queries_match_brute_force():
+    """Every query finds exactly what a linear scan finds, in insertion order"""
+    print("🧪 Testing spatial hash queries...")
+    index, things, generator = make_things(300)
+    for _ in range(200):
+        x, y = generator.randint(-50, AREA_WIDTH), generator.randint(-50, AREA_HEIGHT)
+        box = pygame.Rect(x, y, PLAYER_SIZE, PLAYER_SIZE)
+        expected = [t for t in things if box.colliderect(pygame.Rect(t.x, t.y, ENEMY_SIZE, ENEMY_SIZE))]
+        assert index.query_rect(x, y, PLAYER_SIZE, PLAYER_SIZE) == expected
+
+        radius = generator.randint(0, 300)
+        expected = [t for t in things if math.hypot(t.x - x, t.y - y) <= radius]
+        assert index.query_radius(x, y, radius) == expected
+
+        enemies = [t for i, t in enumerate(things) if i % 2]
+        expected = min(enemies, key=lambda t: math.hypot(t.x - x, t.y - y))
+        found = index.nearest(x, y, kind="enemy")
+        assert math.hypot(found.x - x, found.y - y) == math.hypot(expected.x - x, expected.y - y)
+        within = index.nearest(x, y, kind="enemy", max_radius=60)
+        assert (within is None) == (math.hypot(expected.x - x, expected.y - y) > 60)
+    assert SpatialHash().nearest(0, 0) is None
+    print("  ✅ Rectangle, radius and nearest queries agree with a linear scan")
+
+
+def test_move_and_remove():
+    """Moved objects are found at their new position only; removed ones nowhere"""
+    print("🧪 Testing spatial hash updates...")
+    index, things, _ = make_things(50)
+    thing = things[0]
+    index.move(thing, 2000, 2000)
+    assert thing not in index.query_rect(thing.x, thing.y, ENEMY_SIZE, ENEMY_SIZE)
+    assert index.query_rect(2000, 2000, 1, 1) == [thing]
+    assert index.remove(thing) and not index.remove(thing)
+    assert thing not in index and len(index) == 49
+    assert not index.query_rect(2000, 2000, 1, 1)
+    # Rectangles that only touch do not overlap (like pygame.Rect.colliderect)
+    index.insert(thing, 0, 0, GRID_SIZE, GRID_SIZE)
+    assert index.cell_range(0, 0, GRID_SIZE, GRID_SIZE) == (0, 0, 0, 0)
+    assert thing not in index.query_rect(GRID_SIZE, 0, 10, 10)
+    print("  ✅ Moves and removals keep the grid up to date")
+
+
+def test_world_area_index():
+    """WorldArea files enemies and items, and Enemy.update refiles enemies"""
+    print("🧪 Testing world area spatial index...")
+    from world.world_area import WorldArea
+    from entities.enemy import Enemy
+    from entities.item import Item
+    area = WorldArea(0, 0, "plains")
+    enemy, item = Enemy(1), Item()
+    enemy.x, enemy.y = 300, 300
+    item.x, item.y = 500, 300
+    area.add_enemy(enemy)
+    area.add_item(item)
+    assert area.index.query_rect(300, 300, 1, 1, kind="enemy") == [enemy]
+    assert area.index.query_rect(500, 300, 1, 1, kind="enemy") == []
+    for _ in range(enemy.movement_delay * 20):
+        enemy.update(0, 0)
+    assert area.index.query_rect(enemy.x, enemy.y, 1, 1, kind="enemy") == [enemy]
+    area.remove_enemy(enemy)
+    area.remove_item(item)
+    assert not area.enemies and not area.items and len(area.index) == 0
+
+    town = WorldArea(1, 2, "town")
+    building = town.buildings[0]
+    assert town.check_building_collision(building["x"], building["y"])
+    assert not town.check_building_collision(0, 0)
+    print("  ✅ Areas keep their index in step with their lists")
+
+
+if __name__ == "__main__":
+    test_queries_match_brute_force()
+    test_move_and_remove()
+    test_world_area_index()
+    print("\n🎉 Spatial hash tests passed!")
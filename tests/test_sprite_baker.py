@@ -0,0 +1,79 @@
+"""
+DRAGON'S LAIR RPG - Sprite Baker Tests
+======================================
+
+This module tests the SpriteBaker class to make sure baked sprites look
+the same as the procedural drawing code they replace.
+
+RESOURCE: This demonstrates the systems.sprite_baker.SpriteBaker class.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import pygame
+from config.constants import *
+from systems.sprite_baker import SpriteBaker
+from entities.guard import Guard
+from entities.dark_knight import DarkKnight
+from entities.dragon import Dragon
+
+
+def draw_twice(entity, pose):
+    """Draw the entity procedurally and baked, returning both results as bytes"""
+    results = []
+    for baked in (False, True):
+        SpriteBaker.enabled = baked
+        pose(entity)
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        surface.fill(BACKGROUND)
+        entity.draw(surface)
+        results.append(pygame.image.tobytes(surface, "RGB"))
+    SpriteBaker.enabled = True
+    return results
+
+
+def test_baked_sprites_match_procedural():
+    """Baked guard, dark knight and dragon match the procedural drawing exactly"""
+    print("🧪 Testing Sprite Baker...")
+
+    guard = Guard(300, 270)
+    for offset in (0, 2):
+        procedural, baked = draw_twice(guard, lambda g: setattr(g, 'animation_offset', offset))
+        assert procedural == baked, f"Guard differs at bob {offset}"
+    print("  ✅ Guard matches")
+
+    knight = DarkKnight(500, 300)
+    for offset in (0, 1.7, -1.3):
+        procedural, baked = draw_twice(knight, lambda k: setattr(k, 'animation_offset', offset))
+        assert procedural == baked, f"Dark Knight differs at bob {offset}"
+    print("  ✅ Dark Knight matches")
+
+    dragon = Dragon(250, 230)
+    for step in range(0, 64, 8):
+        phase = step * 2 * math.pi / 64
+        procedural, baked = draw_twice(dragon, lambda d: setattr(d, 'animation_frame', phase))
+        assert procedural == baked, f"Dragon differs at wing phase {step}"
+    print("  ✅ Dragon matches")
+
+
+def test_baker_cache():
+    """Each pose is baked once and then reused"""
+    baker = Dragon.sprite_baker
+    baker.clear()
+    dragon = Dragon(250, 230)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    for _ in range(200):
+        dragon.draw(surface)
+
+    print(f"  📦 {baker.bakes} bakes, {len(baker.cache)} cached poses after 200 frames")
+    assert len(baker.cache) <= 64, "Wing phase should wrap around to 64 poses"
+
+
+if __name__ == "__main__":
+    test_baked_sprites_match_procedural()
+    test_baker_cache()
+    print("\n🎉 Sprite baker tests passed!")
@@ -0,0 +1,94 @@
+"""
+DRAGON'S LAIR RPG - Stem Mixer Tests
+====================================
+
+This module tests the adaptive music: a theme's stems add up to the
+normal track, stem volumes follow the gameplay signals, and the mixer
+keeps the stems in step and falls back to cheap mixing when a block
+takes longer than its CPU budget.
+
+RESOURCE: This demonstrates the audio.stem_mixer.StemMixer class.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from audio.music_system import MusicSystem
+from audio.stem_mixer import StemLayer, StemMixer, stem_gains
+
+
+def song_and_stems(track):
+    """A track rendered both ways (without the cache)"""
+    music = MusicSystem.__new__(MusicSystem)
+    recipe = music.track_recipe(track)
+    return music.render_chiptune_song(**recipe), music.render_chiptune_stems(**recipe), recipe["volume"]
+
+
+def test_stems_add_up_to_song():
+    """Every stem at full volume, clipped like the synthesizer, gives the song back"""
+    print("🧪 Testing stem mixer...")
+    for track in ("town", "boss"):
+        song, stems, volume = song_and_stems(track)
+        assert stems.shape == (len(song), 4)
+        limit = volume * 32767
+        mixed = np.clip(stems.sum(axis=1, dtype=np.float64), -limit, limit)
+        assert np.abs(mixed - song[:, 0]).max() <= 4, track
+    print("  ✅ Stems add up to the track")
+
+
+def test_gains_follow_signals():
+    """Calm play thins the track out, danger brings every stem back"""
+    calm = stem_gains(0.0, 1.0, 0.0)
+    near = stem_gains(1.0, 1.0, 0.0)
+    dying = stem_gains(0.0, 0.1, 0.0)
+    boss = stem_gains(1.0, 1.0, 1.0)
+    assert calm[0] == 1.0 and (calm[1:] < 1.0).all()
+    assert near[2] > calm[2] and dying[3] > calm[3]
+    assert np.allclose(boss, 1.0)
+    print("  ✅ Stem volumes follow the game")
+
+
+def test_mix_block():
+    """Blocks advance one shared playhead and glide to new volumes"""
+    _, stems, volume = song_and_stems("town")
+    mixer = StemMixer(block_frames=512, crossfade_ms=0)
+    mixer.layers.append(StemLayer("town", stems, volume))  # play() would also start the thread
+    mixer.layers[0].gain = 1.0
+    mixer.set_signals(1.0, 1.0, 1.0)
+    mixer.mix_block()
+    assert mixer.layers[0].position == 512
+    # The glide starts at the calm volumes and moves one step per block
+    calm = stem_gains(0.0, 1.0, 0.0)
+    assert np.allclose(mixer.gains, np.minimum(calm + mixer.gain_step, 1.0))
+    for _ in range(100):
+        mixer.mix_block()
+    assert np.allclose(mixer.gains, 1.0)
+    # At full volume a block is the track itself, from the shared playhead
+    start = mixer.layers[0].position
+    block = mixer.mix_block()
+    full = np.clip(stems[start:start + 512].sum(axis=1, dtype=np.float64), -volume * 32767, volume * 32767)
+    assert np.abs(block[:, 0] - full).max() <= 1
+    print("  ✅ Blocks mix in step")
+
+
+def test_budget_fallback():
+    """A block over budget switches to one volume per block"""
+    _, stems, volume = song_and_stems("battle")
+    mixer = StemMixer(block_frames=256, budget_ms=0.0)
+    mixer.layers.append(StemLayer("battle", stems, volume))
+    mixer.mix_block()
+    assert mixer.overruns == 1 and not mixer.smooth
+    mixer.budget = 1.0
+    mixer.mix_block()
+    assert mixer.smooth
+    print("  ✅ Mixer stays within its CPU budget")
+
+
+if __name__ == "__main__":
+    test_stems_add_up_to_song()
+    test_gains_follow_signals()
+    test_mix_block()
+    test_budget_fallback()
+    print("\n🎉 Stem mixer tests passed!")
@@ -0,0 +1,116 @@
+"""
+DRAGON'S LAIR RPG - Timer Wheel Tests
+=====================================
+
+This module tests the hierarchical timer wheel: timers fire on exactly
+the tick they are due (near or far, across cascades), repeat, cancel and
+reschedule cleanly, and timers due together fire in creation order.
+
+RESOURCE: This demonstrates the systems.timer_wheel.TimerWheel class.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from config.constants import *
+from systems.timer_wheel import TimerWheel, WHEEL_SLOTS
+
+
+def test_fires_on_time():
+    """One-shot timers fire on their due tick, at any distance"""
+    print("🧪 Testing timer due ticks...")
+    wheel = TimerWheel(levels=3)  # Small enough that the overflow list is used too
+    generator = random.Random(1)
+    fired = []
+    expected = {}
+    for i in range(500):
+        delay = generator.choice([1, 2, 63, 64, 65, 4095, 4096, 4097, generator.randint(1, 300000)])
+        wheel.schedule(delay, fired.append, i)
+        expected[i] = delay
+    assert len(wheel) == 500
+    while len(wheel):
+        before = len(fired)
+        wheel.advance()
+        for i in fired[before:]:
+            assert expected[i] == wheel.now, (i, expected[i], wheel.now)
+    assert sorted(fired) == list(range(500))
+    print("  ✅ Every timer fired on its tick, through every level")
+
+
+def test_repeat_cancel_reschedule():
+    """Repeating timers keep their period; cancel and reschedule take effect at once"""
+    print("🧪 Testing repeats, cancels and reschedules...")
+    wheel = TimerWheel()
+    ticks = []
+    timer = wheel.schedule(3, lambda: ticks.append(wheel.now), period=5)
+    for _ in range(20):
+        wheel.advance()
+    assert ticks == [3, 8, 13, 18] and timer.remaining == 3
+    timer.reschedule(1)
+    wheel.advance()
+    assert ticks[-1] == 21
+    assert timer.cancel() and not timer.cancel() and not timer.active
+    for _ in range(WHEEL_SLOTS * 2):
+        wheel.advance()
+    assert ticks[-1] == 21 and len(wheel) == 0
+    # A timer made idle only runs once it is started
+    idle = wheel.timer(ticks.append, "idle")
+    wheel.advance()
+    assert ticks[-1] == 21 and idle.remaining == 0
+    idle.reschedule(2)
+    wheel.advance()
+    wheel.advance()
+    assert ticks[-1] == "idle"
+    print("  ✅ Periods, cancels and reschedules behave")
+
+
+def test_same_tick_order():
+    """Timers due on the same tick fire in creation order, even after repeating"""
+    print("🧪 Testing same-tick order...")
+    wheel = TimerWheel()
+    order = []
+    late = wheel.schedule(10, order.append, "late", period=10)
+    early = wheel.schedule(10, order.append, "early", period=10)
+    # Cancelling a timer from a callback on the same tick stops it from firing
+    victim = wheel.schedule(20, order.append, "victim")
+    wheel.schedule(20, victim.cancel)
+    for _ in range(20):
+        wheel.advance()
+    assert order == ["late", "early", "late", "early", "victim"]
+    late.reschedule(5)
+    early.reschedule(5)
+    for _ in range(5):
+        wheel.advance()
+    assert order[-2:] == ["late", "early"]
+    print("  ✅ Ties go to the timer created first")
+
+
+def test_area_enemy_timers():
+    """Area enemies step on their movement_timer like Enemy.update would"""
+    print("🧪 Testing area enemy timers...")
+    from world.world_area import WorldArea
+    from entities.enemy import Enemy
+    area = WorldArea(0, 0, "plains")
+    enemy = Enemy(1)
+    enemy.x, enemy.y = 300, 300
+    enemy.movement_cooldown = 5
+    area.add_enemy(enemy)
+    assert enemy.movement_timer.remaining == 5
+    for _ in range(enemy.movement_delay * 10):
+        area.tick()
+    assert area.index.query_rect(enemy.x, enemy.y, 1, 1, kind="enemy") == [enemy]
+    area.tick()
+    area.remove_enemy(enemy)
+    assert enemy.movement_timer is None and len(area.timers) == 0
+    assert 0 < enemy.movement_cooldown <= enemy.movement_delay
+    print("  ✅ Enemy steps are scheduled and cancelled with the area")
+
+
+if __name__ == "__main__":
+    test_fires_on_time()
+    test_repeat_cancel_reschedule()
+    test_same_tick_order()
+    test_area_enemy_timers()
+    print("\n🎉 Timer wheel tests passed!")
@@ -1,5 +1,5 @@
 # Action methods extracted from BattleScreen class
-import random
+from systems.rng import rng
 
 # These functions are meant to be used as methods of BattleScreen, so they expect 'self' as the first argument.
 def execute_attack(self):
@@ -12,7 +12,7 @@ def execute_attack(self):
     else:
         self.add_log(f"You dealt {damage} damage to {self.enemy.name}!")
         if self.enemy.enemy_type == "fiery":
-            self.particle_system.add_explosion(700 + 30, 250 + 30, FIRE_COLORS[0], count=30, size_range=(2, 6), speed_range=(1, 4), lifetime_range=(15, 30))
+            self.particle_system.add_explosion(700 + 30, 250 + 30, FIRE_COLORS[0], count=30, size_range=(2, 6), speed_range=(1, 4), lifetime_range=(15, 30), additive=True)
         elif self.enemy.enemy_type == "shadow":
             self.particle_system.add_explosion(700 + 30, 250 + 30, SHADOW_COLORS[1], count=20, size_range=(3, 8), speed_range=(0.5, 2), lifetime_range=(20, 40))
         else:
@@ -35,8 +35,8 @@ def execute_magic(self):
     self.damage_effect_timer = 20
     self.enemy.start_hit_animation()
     self.add_screen_shake(8, 10)
-    self.particle_system.add_beam(200 + 25, 350 + 15, 700 + 30, 250 + 30, self.magic_effect['color'], width=5, particle_count=15, speed=3)
-    self.particle_system.add_explosion(700 + 30, 250 + 30, self.magic_effect['color'], count=40, size_range=(3, 7), speed_range=(1, 5), lifetime_range=(15, 30))
+    self.particle_system.add_beam(200 + 25, 350 + 15, 700 + 30, 250 + 30, self.magic_effect['color'], width=5, particle_count=15, speed=3, additive=True)
+    self.particle_system.add_explosion(700 + 30, 250 + 30, self.magic_effect['color'], count=40, size_range=(3, 7), speed_range=(1, 5), lifetime_range=(15, 30), additive=True)
     self.state = "enemy_turn"
     self.action_cooldown = self.action_delay
 
@@ -45,14 +45,14 @@ def execute_item(self):
     self.player.health = min(self.player.max_health, self.player.health + heal_amount)
     self.add_log(f"Restored {heal_amount} HP!")
     for _ in range(20):
-        x = random.randint(200, 200 + PLAYER_SIZE)
-        y = random.randint(300, 300 + PLAYER_SIZE)
-        self.particle_system.add_particle(x, y, HEALTH_COLOR, (random.uniform(-0.5, 0.5), random.uniform(-1, -0.5)), 3, 30)
+        x = rng.vfx.randint(200, 200 + PLAYER_SIZE)
+        y = rng.vfx.randint(300, 300 + PLAYER_SIZE)
+        self.particle_system.add_particle(x, y, HEALTH_COLOR, (rng.vfx.uniform(-0.5, 0.5), rng.vfx.uniform(-1, -0.5)), 3, 30)
     self.state = "enemy_turn"
     self.action_cooldown = self.action_delay
 
 def execute_run(self):
-    if random.random() < 0.7:
+    if rng.combat.random() < 0.7:
         self.add_log("You successfully escaped!")
         self.battle_ended = True
         self.result = "escape"
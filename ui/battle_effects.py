@@ -1,6 +1,6 @@
 # Effect and animation methods extracted from BattleScreen class
 # These functions are designed to be used as methods of BattleScreen (pass self as first argument)
-import random
+from systems.rng import rng
 
 
 def add_screen_shake(self, intensity=5, duration=10):
@@ -37,21 +37,21 @@ def start_attack_animation(self):
             'target_y': 250 + 30,  # Enemy center
             'speed': 56,  # Slightly faster than knife
             'size': 12,
-            'color': random.choice(FIRE_COLORS),
+            'color': rng.vfx.choice(FIRE_COLORS),
             'trail_particles': [],
             'timer': 0,  # Timer for 0.8 seconds
             'max_timer': 48  # 0.8 seconds at 60 FPS
         }
         # Create fireball trail particles
         for _ in range(10):
-            angle = random.uniform(0, math.pi*2)
-            dist = random.uniform(0, 8)
+            angle = rng.vfx.uniform(0, math.pi*2)
+            dist = rng.vfx.uniform(0, 8)
             px = self.fireball_projectile['x'] + math.cos(angle) * dist
             py = self.fireball_projectile['y'] + math.sin(angle) * dist
             self.particle_system.add_particle(
                 px, py, self.fireball_projectile['color'],
                 (math.cos(angle) * 0.3, math.sin(angle) * 0.3),
-                2, 20
+                2, 20, additive=True
             )
     elif self.player.type == "Rogue":
         # Knife throw attack animation
@@ -71,8 +71,8 @@ def start_attack_animation(self):
         }
         # Create knife throw particles
         for _ in range(8):
-            angle = random.uniform(0, math.pi*2)
-            dist = random.uniform(0, 6)
+            angle = rng.vfx.uniform(0, math.pi*2)
+            dist = rng.vfx.uniform(0, 6)
             px = self.knife_projectile['x'] + math.cos(angle) * dist
             py = self.knife_projectile['y'] + math.sin(angle) * dist
             self.particle_system.add_particle(
@@ -84,13 +84,13 @@ def start_attack_animation(self):
         # Warrior/Paladin holy attack animation
         # Create holy energy particles around the player
         for _ in range(12):
-            angle = random.uniform(0, math.pi*2)
-            dist = random.uniform(0, 15)
+            angle = rng.vfx.uniform(0, math.pi*2)
+            dist = rng.vfx.uniform(0, 15)
             px = 200 + 25 + math.cos(angle) * dist
             py = 350 + 15 + math.sin(angle) * dist
             # Holy particle colors (gold, white, light blue)
             holy_colors = [(255, 215, 0), (255, 255, 255), (173, 216, 230)]
-            particle_color = random.choice(holy_colors)
+            particle_color = rng.vfx.choice(holy_colors)
             self.particle_system.add_particle(
                 px, py, 
                 particle_color,
@@ -110,15 +110,15 @@ def start_magic_animation(self):
         'y': 250 + 30,  # Enemy center y (where magic hits)
         'radius': 0,
         'max_radius': 100,
-        'color': random.choice(MAGIC_COLORS)
+        'color': rng.vfx.choice(MAGIC_COLORS)
     }
     for _ in range(20):
-        angle = random.uniform(0, math.pi*2)
-        dist = random.uniform(0, 10)
+        angle = rng.vfx.uniform(0, math.pi*2)
+        dist = rng.vfx.uniform(0, 10)
         px = self.magic_effect['x'] + math.cos(angle) * dist
         py = self.magic_effect['y'] + math.sin(angle) * dist
         self.particle_system.add_particle(
             px, py, self.magic_effect['color'],
             (math.cos(angle) * 0.5, math.sin(angle) * 0.5),
-            3, 30
+            3, 30, additive=True
         ) 
\ No newline at end of file
@@ -16,9 +16,12 @@ The BattleScreen handles:
 """
 
 import pygame
-import random
 import math
 from config.constants import *
+from systems.rng import rng
+from systems.glow_cache import glow_cache
+from systems.profiler import profiled
+from systems.timer_wheel import TimerWheel
 from ui.button import Button
 from systems.particle_system import ParticleSystem
 
@@ -80,9 +83,12 @@ class BattleScreen:
         self.screen_shake_duration = 0
         self.attack_effect_timer = 0
         
+        # Battle clock: delayed damage and effect timeouts are scheduled on it
+        self.timers = TimerWheel()
+        
         # Damage delay system (0.5 seconds = 30 frames at 60 FPS)
         self.pending_damage = None
-        self.damage_delay_timer = 0
+        self.damage_delay_timer = self.timers.timer(self.apply_pending_damage)
         self.damage_delay_frames = 30  # 0.5 seconds at 60 FPS
         
         # Magic effect system
@@ -97,7 +103,7 @@ class BattleScreen:
         # Check if this is a boss battle
         self.is_boss = hasattr(self.enemy, 'enemy_type') and "boss_dragon" in self.enemy.enemy_type
         self.pending_elemental_effect = None
-        self.elemental_effect_timer = 0
+        self.elemental_effect_timer = self.timers.timer(self.clear_elemental_effect)
         
     def start_transition(self):
         """Start the battle transition animation"""
@@ -128,7 +134,7 @@ class BattleScreen:
                 'target_y': 250 + 30,  # Enemy center
                 'speed': 56,  # Slightly faster than knife
                 'size': 12,
-                'color': random.choice(FIRE_COLORS),
+                'color': rng.vfx.choice(FIRE_COLORS),
                 'trail_particles': [],
                 'timer': 0,  # Timer for 0.8 seconds
                 'max_timer': 48  # 0.8 seconds at 60 FPS
@@ -136,14 +142,14 @@ class BattleScreen:
             
             # Create fireball trail particles
             for _ in range(10):
-                angle = random.uniform(0, math.pi*2)
-                dist = random.uniform(0, 8)
+                angle = rng.vfx.uniform(0, math.pi*2)
+                dist = rng.vfx.uniform(0, 8)
                 px = self.fireball_projectile['x'] + math.cos(angle) * dist
                 py = self.fireball_projectile['y'] + math.sin(angle) * dist
                 self.particle_system.add_particle(
                     px, py, self.fireball_projectile['color'],
                     (math.cos(angle) * 0.3, math.sin(angle) * 0.3),
-                    2, 20
+                    2, 20, additive=True
                 )
                 
         elif self.player.type == "Rogue":
@@ -165,8 +171,8 @@ class BattleScreen:
             
             # Create knife throw particles
             for _ in range(8):
-                angle = random.uniform(0, math.pi*2)
-                dist = random.uniform(0, 6)
+                angle = rng.vfx.uniform(0, math.pi*2)
+                dist = rng.vfx.uniform(0, 6)
                 px = self.knife_projectile['x'] + math.cos(angle) * dist
                 py = self.knife_projectile['y'] + math.sin(angle) * dist
                 self.particle_system.add_particle(
@@ -179,13 +185,13 @@ class BattleScreen:
             # Warrior/Paladin holy attack animation
             # Create holy energy particles around the player
             for _ in range(12):
-                angle = random.uniform(0, math.pi*2)
-                dist = random.uniform(0, 15)
+                angle = rng.vfx.uniform(0, math.pi*2)
+                dist = rng.vfx.uniform(0, 15)
                 px = 200 + 25 + math.cos(angle) * dist
                 py = 350 + 15 + math.sin(angle) * dist
                 # Holy particle colors (gold, white, light blue)
                 holy_colors = [(255, 215, 0), (255, 255, 255), (173, 216, 230)]
-                particle_color = random.choice(holy_colors)
+                particle_color = rng.vfx.choice(holy_colors)
                 self.particle_system.add_particle(
                     px, py, 
                     particle_color,
@@ -206,26 +212,26 @@ class BattleScreen:
             'y': 250 + 30,  # Enemy center y (where magic hits)
             'radius': 0,
             'max_radius': 100,
-            'color': random.choice(MAGIC_COLORS)
+            'color': rng.vfx.choice(MAGIC_COLORS)
         }
         
         # Add particle explosion at enemy location
         for _ in range(20):
-            angle = random.uniform(0, math.pi*2)
-            dist = random.uniform(0, 10)
+            angle = rng.vfx.uniform(0, math.pi*2)
+            dist = rng.vfx.uniform(0, 10)
             px = self.magic_effect['x'] + math.cos(angle) * dist
             py = self.magic_effect['y'] + math.sin(angle) * dist
             self.particle_system.add_particle(
                 px, py, self.magic_effect['color'],
                 (math.cos(angle) * 0.5, math.sin(angle) * 0.5),
-                3, 30
+                3, 30, additive=True
             )
         
         # Add beam effect from player to enemy
         self.particle_system.add_beam(
             200 + 25, 350 + 15,  # Staff top (player position)
             700 + 30, 250 + 30,  # Enemy center
-            self.magic_effect['color'], width=5, particle_count=15, speed=3
+            self.magic_effect['color'], width=5, particle_count=15, speed=3, additive=True
         )
     
     def execute_attack(self):
@@ -237,7 +243,7 @@ class BattleScreen:
             'amount': damage,
             'type': 'attack'
         }
-        self.damage_delay_timer = self.damage_delay_frames
+        self.damage_delay_timer.reschedule(self.damage_delay_frames)
         self.add_log(f"You prepare your attack...")
         self.state = "enemy_turn"
         self.action_cooldown = self.action_delay
@@ -251,7 +257,7 @@ class BattleScreen:
             'amount': damage,
             'type': 'magic'
         }
-        self.damage_delay_timer = self.damage_delay_frames
+        self.damage_delay_timer.reschedule(self.damage_delay_frames)
         old_mana = self.player.mana
         self.player.mana -= 20
         self.add_log(f"You channel your magic...")
@@ -266,11 +272,11 @@ class BattleScreen:
         
         # Add healing particle effects around the player
         for _ in range(20):
-            x = random.randint(200, 200 + PLAYER_SIZE)  # Player area x
-            y = random.randint(300, 300 + PLAYER_SIZE)  # Player area y
+            x = rng.vfx.randint(200, 200 + PLAYER_SIZE)  # Player area x
+            y = rng.vfx.randint(300, 300 + PLAYER_SIZE)  # Player area y
             self.particle_system.add_particle(
                 x, y, HEALTH_COLOR,  # Use health color for healing effect
-                (random.uniform(-0.5, 0.5), random.uniform(-1, -0.5)),  # Upward movement
+                (rng.vfx.uniform(-0.5, 0.5), rng.vfx.uniform(-1, -0.5)),  # Upward movement
                 3, 30  # Size and lifetime
             )
         
@@ -279,7 +285,7 @@ class BattleScreen:
     
     def execute_run(self):
         """Execute the run action with visual effects"""
-        if random.random() < 0.7:  # 70% chance to escape (matching legacy)
+        if rng.combat.random() < 0.7:  # 70% chance to escape (matching legacy)
             self.add_log("You successfully escaped!")
             self.battle_ended = True
             self.result = "escape"
@@ -287,11 +293,11 @@ class BattleScreen:
             
             # Add escape particles around the player
             for _ in range(15):
-                x = random.randint(200, 200 + PLAYER_SIZE)  # Player area x
-                y = random.randint(300, 300 + PLAYER_SIZE)  # Player area y
+                x = rng.vfx.randint(200, 200 + PLAYER_SIZE)  # Player area x
+                y = rng.vfx.randint(300, 300 + PLAYER_SIZE)  # Player area y
                 self.particle_system.add_particle(
                     x, y, (255, 215, 0),  # Gold color for escape
-                    (random.uniform(-1, 1), random.uniform(-2, -0.5)),  # Upward movement
+                    (rng.vfx.uniform(-1, 1), rng.vfx.uniform(-2, -0.5)),  # Upward movement
                     2, 25  # Size and lifetime
                 )
         else:
@@ -301,11 +307,11 @@ class BattleScreen:
             
             # Add failure particles and screen shake
             for _ in range(10):
-                x = random.randint(200, 200 + PLAYER_SIZE)
-                y = random.randint(300, 300 + PLAYER_SIZE)
+                x = rng.vfx.randint(200, 200 + PLAYER_SIZE)
+                y = rng.vfx.randint(300, 300 + PLAYER_SIZE)
                 self.particle_system.add_particle(
                     x, y, (255, 100, 100),  # Red color for failure
-                    (random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5)),
+                    (rng.vfx.uniform(-0.5, 0.5), rng.vfx.uniform(-0.5, 0.5)),
                     2, 20
                 )
             
@@ -326,6 +332,7 @@ class BattleScreen:
         self.battle_log.append(message)
         self.waiting_for_continue = True
         
+    @profiled("battle.draw")
     def draw(self, surface):
         """
         Draw the complete battle screen including characters, UI, and effects.
@@ -337,8 +344,8 @@ class BattleScreen:
         shake_offset_x = 0
         shake_offset_y = 0
         if self.screen_shake > 0:
-            shake_offset_x = random.randint(-self.shake_intensity, self.shake_intensity)
-            shake_offset_y = random.randint(-self.shake_intensity, self.shake_intensity)
+            shake_offset_x = rng.render.randint(-self.shake_intensity, self.shake_intensity)
+            shake_offset_y = rng.render.randint(-self.shake_intensity, self.shake_intensity)
             self.screen_shake -= 1
         
         # Create temporary surface for drawing
@@ -405,10 +412,10 @@ class BattleScreen:
             pygame.draw.ellipse(surface, (220, 80, 0), (enemy_x, enemy_y, 60, 60))
             for i in range(12):
                 angle = i * math.pi / 6
-                flame_length = random.randint(10, 20)
+                flame_length = rng.render.randint(10, 20)
                 flame_x = enemy_x + 30 + math.cos(angle) * flame_length
                 flame_y = enemy_y + 30 + math.sin(angle) * flame_length
-                flame_color = random.choice(FIRE_COLORS)
+                flame_color = rng.render.choice(FIRE_COLORS)
                 pygame.draw.line(surface, flame_color, 
                                (enemy_x + 30, enemy_y + 30),
                                (flame_x, flame_y), 3)
@@ -418,12 +425,11 @@ class BattleScreen:
             # Draw shadow enemy
             pygame.draw.ellipse(surface, (30, 30, 60), (enemy_x, enemy_y, 60, 60))
             for i in range(10):
-                offset_x = random.randint(-10, 10)
-                offset_y = random.randint(-10, 10)
-                size = random.randint(5, 15)
-                alpha = random.randint(50, 150)
-                smoke_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-                pygame.draw.circle(smoke_surf, (70, 70, 120, alpha), (size, size), size)
+                offset_x = rng.render.randint(-10, 10)
+                offset_y = rng.render.randint(-10, 10)
+                size = rng.render.randint(5, 15)
+                alpha = rng.render.randint(50, 150)
+                smoke_surf = glow_cache.circle(size, (70, 70, 120, alpha))
                 surface.blit(smoke_surf, (enemy_x + 30 - size + offset_x, enemy_y + 30 - size + offset_y))
             pygame.draw.circle(surface, (0, 255, 255), (enemy_x + 20, enemy_y + 25), 7)
             pygame.draw.circle(surface, (0, 255, 255), (enemy_x + 40, enemy_y + 25), 7)
@@ -432,7 +438,7 @@ class BattleScreen:
             pygame.draw.ellipse(surface, (180, 230, 255), (enemy_x, enemy_y, 60, 60))
             for i in range(8):
                 angle = i * math.pi / 4
-                crystal_length = random.randint(10, 20)
+                crystal_length = rng.render.randint(10, 20)
                 crystal_x = enemy_x + 30 + math.cos(angle) * crystal_length
                 crystal_y = enemy_y + 30 + math.sin(angle) * crystal_length
                 pygame.draw.line(surface, (220, 240, 255), 
@@ -527,9 +533,7 @@ class BattleScreen:
                 glow_size = size + i * 3
                 glow_alpha = 100 - i * 30
                 glow_color = (*color[:3], glow_alpha)
-                glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
-                surface.blit(glow_surf, (x - glow_size, y - glow_size))
+                surface.blit(glow_cache.circle(glow_size, glow_color), (x - glow_size, y - glow_size))
             
             # Main fireball
             pygame.draw.circle(surface, color, (x, y), size)
@@ -662,6 +666,41 @@ class BattleScreen:
             text = font_large.render(line, True, TEXT_COLOR)
             surface.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, 250 + i*60))
 
+    def apply_pending_damage(self):
+        """Deal the damage of the last attack or spell (damage_delay_timer calls this)"""
+        if not self.pending_damage:
+            return
+        # Apply the delayed damage
+        damage_info = self.pending_damage
+        damage_info['target'].health -= damage_info['amount']
+        
+        if damage_info['type'] == 'attack':
+            self.add_log(f"You deal {damage_info['amount']} damage!")
+        elif damage_info['type'] == 'magic':
+            self.add_log(f"Fireball deals {damage_info['amount']} damage!")
+            # Add magic explosion effect
+            self.particle_system.add_explosion(
+                700 + 30, 250 + 30,  # Enemy center position
+                self.magic_effect['color'] if hasattr(self, 'magic_effect') else MAGIC_COLORS[0],
+                count=40, size_range=(3, 7), speed_range=(1, 5), lifetime_range=(15, 30),
+                additive=True
+            )
+        
+        # Set up damage effects
+        self.damage_target = "enemy"
+        self.damage_amount = damage_info['amount']
+        self.damage_effect_timer = 20
+        self.enemy.start_hit_animation()
+        self.add_screen_shake(3, 5)
+        
+        # Clear pending damage
+        self.pending_damage = None
+    
+    def clear_elemental_effect(self):
+        """End the enemy's elemental effect (elemental_effect_timer calls this)"""
+        self.pending_elemental_effect = None
+    
+    @profiled("battle.update")
     def update(self):
         """
         Update the battle screen state, animations, and effects.
@@ -673,34 +712,8 @@ class BattleScreen:
         self.enemy.update_animation()
         self.particle_system.update()
         
-        # Update damage delay timer
-        if self.pending_damage and self.damage_delay_timer > 0:
-            self.damage_delay_timer -= 1
-            if self.damage_delay_timer <= 0:
-                # Apply the delayed damage
-                damage_info = self.pending_damage
-                damage_info['target'].health -= damage_info['amount']
-                
-                if damage_info['type'] == 'attack':
-                    self.add_log(f"You deal {damage_info['amount']} damage!")
-                elif damage_info['type'] == 'magic':
-                    self.add_log(f"Fireball deals {damage_info['amount']} damage!")
-                    # Add magic explosion effect
-                    self.particle_system.add_explosion(
-                        700 + 30, 250 + 30,  # Enemy center position
-                        self.magic_effect['color'] if hasattr(self, 'magic_effect') else MAGIC_COLORS[0],
-                        count=40, size_range=(3, 7), speed_range=(1, 5), lifetime_range=(15, 30)
-                    )
-                
-                # Set up damage effects
-                self.damage_target = "enemy"
-                self.damage_amount = damage_info['amount']
-                self.damage_effect_timer = 20
-                self.enemy.start_hit_animation()
-                self.add_screen_shake(3, 5)
-                
-                # Clear pending damage
-                self.pending_damage = None
+        # Delayed damage and effect timeouts
+        self.timers.advance()
         
         # Update magic effect
         if self.magic_effect['active']:
@@ -727,21 +740,21 @@ class BattleScreen:
                 
                 # Add trail particles
                 for _ in range(2):
-                    angle = random.uniform(0, math.pi*2)
-                    dist = random.uniform(0, 6)
+                    angle = rng.vfx.uniform(0, math.pi*2)
+                    dist = rng.vfx.uniform(0, 6)
                     px = self.fireball_projectile['x'] + math.cos(angle) * dist
                     py = self.fireball_projectile['y'] + math.sin(angle) * dist
                     self.particle_system.add_particle(
                         px, py, self.fireball_projectile['color'],
-                        (random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5)),
-                        2, 15
+                        (rng.vfx.uniform(-0.5, 0.5), rng.vfx.uniform(-0.5, 0.5)),
+                        2, 15, additive=True
                     )
             else:
                 # Timer expired - fireball hits target and explodes
                 self.particle_system.add_explosion(
                     700 + 30, 250 + 30,  # Enemy center position
                     self.fireball_projectile['color'], count=30, size_range=(3, 8), 
-                    speed_range=(2, 6), lifetime_range=(20, 35)
+                    speed_range=(2, 6), lifetime_range=(20, 35), additive=True
                 )
                 self.fireball_projectile['active'] = False
                 self.fireball_projectile['hit'] = True  # Mark as hit
@@ -773,13 +786,13 @@ class BattleScreen:
                 
                 # Add trail particles
                 for _ in range(1):
-                    angle = random.uniform(0, math.pi*2)
-                    dist = random.uniform(0, 4)
+                    angle = rng.vfx.uniform(0, math.pi*2)
+                    dist = rng.vfx.uniform(0, 4)
                     px = self.knife_projectile['x'] + math.cos(angle) * dist
                     py = self.knife_projectile['y'] + math.sin(angle) * dist
                     self.particle_system.add_particle(
                         px, py, (120, 120, 120),
-                        (random.uniform(-0.3, 0.3), random.uniform(-0.3, 0.3)),
+                        (rng.vfx.uniform(-0.3, 0.3), rng.vfx.uniform(-0.3, 0.3)),
                         1, 10
                     )
             else:
@@ -824,12 +837,6 @@ class BattleScreen:
             self.show_summary = True
             return True
         
-        # Update elemental effect
-        if self.elemental_effect_timer > 0:
-            self.elemental_effect_timer -= 1
-            if self.elemental_effect_timer == 0:
-                self.pending_elemental_effect = None
-        
         # Process current action steps
         if self.action_steps:
             step = self.action_steps.pop(0)
@@ -851,7 +858,8 @@ class BattleScreen:
             self.add_screen_shake(3, 5)
             # Elemental effect after dialog
             self.pending_elemental_effect = self.enemy.enemy_type
-            self.elemental_effect_timer = 20
+            # 20 ticks once the action cooldown is over
+            self.elemental_effect_timer.reschedule(self.action_delay + 20)
             self.state = "player_turn"
             self.add_log("It's your turn!")
             self.action_cooldown = self.action_delay
@@ -892,25 +900,25 @@ class BattleScreen:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RIGHT or event.key == pygame.K_d:
                     self.selected_option = (self.selected_option + 1) % 4
-                    if game and hasattr(game, 'SFX_ARROW') and game.SFX_ARROW: game.SFX_ARROW.play()
+                    if game and hasattr(game, 'sfx'): game.sfx.play("arrow")
                 elif event.key == pygame.K_LEFT or event.key == pygame.K_a:
                     self.selected_option = (self.selected_option - 1) % 4
-                    if game and hasattr(game, 'SFX_ARROW') and game.SFX_ARROW: game.SFX_ARROW.play()
+                    if game and hasattr(game, 'sfx'): game.sfx.play("arrow")
                 elif event.key == pygame.K_UP or event.key == pygame.K_w:
                     self.selected_option = (self.selected_option - 2) % 4
-                    if game and hasattr(game, 'SFX_ARROW') and game.SFX_ARROW: game.SFX_ARROW.play()
+                    if game and hasattr(game, 'sfx'): game.sfx.play("arrow")
                 elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
                     self.selected_option = (self.selected_option + 2) % 4
-                    if game and hasattr(game, 'SFX_ARROW') and game.SFX_ARROW: game.SFX_ARROW.play()
+                    if game and hasattr(game, 'sfx'): game.sfx.play("arrow")
                 elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                    if game and hasattr(game, 'SFX_ENTER') and game.SFX_ENTER: game.SFX_ENTER.play()
+                    if game and hasattr(game, 'sfx'): game.sfx.play("enter")
                     self.handle_action(game)
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = event.pos
                 for i, button in enumerate(self.buttons):
                     if button.rect.collidepoint(mouse_pos):
                         self.selected_option = i
-                        if game and hasattr(game, 'SFX_ENTER') and game.SFX_ENTER: game.SFX_ENTER.play()
+                        if game and hasattr(game, 'sfx'): game.sfx.play("enter")
                         self.handle_action(game)
     
     def handle_action(self, game=None):
@@ -923,7 +931,7 @@ class BattleScreen:
         if self.state != "player_turn" or self.battle_ended or self.action_cooldown > 0:
             return
         if self.selected_option == 0:  # Attack
-            if game and hasattr(game, 'SFX_ATTACK') and game.SFX_ATTACK: game.SFX_ATTACK.play()
+            if game and hasattr(game, 'sfx'): game.sfx.play("attack")
             self.action_steps = [
                 lambda: self.add_log("You attack!"),
                 lambda: self.start_attack_animation(),
@@ -931,23 +939,23 @@ class BattleScreen:
             ]
         elif self.selected_option == 1:  # Magic
             if self.player.mana >= 20:
-                if game and hasattr(game, 'SFX_MAGIC') and game.SFX_MAGIC: game.SFX_MAGIC.play()
+                if game and hasattr(game, 'sfx'): game.sfx.play("magic")
                 self.action_steps = [
                     lambda: self.add_log("You cast a fireball!"),
                     lambda: self.start_magic_animation(),
                     lambda: self.execute_magic()
                 ]
             else:
-                if game and hasattr(game, 'SFX_CLICK') and game.SFX_CLICK: game.SFX_CLICK.play()
+                if game and hasattr(game, 'sfx'): game.sfx.play("click")
                 self.add_log("Not enough mana!")
         elif self.selected_option == 2:  # Item
-            if game and hasattr(game, 'SFX_ITEM') and game.SFX_ITEM: game.SFX_ITEM.play()
+            if game and hasattr(game, 'sfx'): game.sfx.play("item")
             self.action_steps = [
                 lambda: self.add_log("You used a health potion!"),
                 lambda: self.execute_item()
             ]
         elif self.selected_option == 3:  # Run
-            if game and hasattr(game, 'SFX_CLICK') and game.SFX_CLICK: game.SFX_CLICK.play()
+            if game and hasattr(game, 'sfx'): game.sfx.play("click")
             self.action_steps = [
                 lambda: self.add_log("You attempt to escape..."),
                 lambda: self.execute_run()
@@ -7,6 +7,7 @@ This module contains the Button class for UI elements.
 
 import pygame
 from config.constants import *
+from systems.glow_cache import glow_cache
 
 class Button:
     """
@@ -29,8 +30,8 @@ class Button:
         """Draw the button with glow effects and selection state"""
         if self.glow > 0 or self.selected:
             glow_radius = max(self.glow, 8 if self.selected else 0)
-            glow_surf = pygame.Surface((self.rect.width + glow_radius*2, self.rect.height + glow_radius*2), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surf, (*self.current_color[:3], 50), glow_surf.get_rect(), border_radius=12)
+            glow_surf = glow_cache.rect(self.rect.width + glow_radius*2, self.rect.height + glow_radius*2,
+                                        (*self.current_color[:3], 50), border_radius=12)
             surface.blit(glow_surf, (self.rect.x - glow_radius, self.rect.y - glow_radius))
         
         pygame.draw.rect(surface, UI_BG, self.rect, border_radius=8)
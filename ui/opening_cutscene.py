@@ -14,9 +14,9 @@ The OpeningCutscene features:
 """
 
 import pygame
-import random
 import math
 from config.constants import *
+from systems.rng import rng
 from systems.particle_system import ParticleSystem
 
 
@@ -78,12 +78,12 @@ class OpeningCutscene:
         # Add particles for scene 2 (dragon scene)
         if self.scene_index == 1 and self.timer % 5 == 0:
             self.particle_system.add_particle(
-                random.randint(0, SCREEN_WIDTH),
+                rng.vfx.randint(0, SCREEN_WIDTH),
                 -10,
-                random.choice(FIRE_COLORS),
-                (random.uniform(-0.5, 0.5), random.uniform(1, 3)),
-                random.randint(3, 7),
-                random.randint(40, 80)
+                rng.vfx.choice(FIRE_COLORS),
+                (rng.vfx.uniform(-0.5, 0.5), rng.vfx.uniform(1, 3)),
+                rng.vfx.randint(3, 7),
+                rng.vfx.randint(40, 80)
             )
         
         # Scroll text for scene 3 (story scene)
@@ -184,7 +184,7 @@ class OpeningCutscene:
         
         # Draw mountains silhouette
         for i in range(10):
-            height = 150 + random.randint(0, 50)
+            height = 150 + rng.render.randint(0, 50)
             pygame.draw.polygon(screen, (30, 30, 60), [
                 (i * 100, SCREEN_HEIGHT),
                 (i * 100 + 50, SCREEN_HEIGHT - height),
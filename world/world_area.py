@@ -13,6 +13,16 @@ import pygame
 import random
 import math
 from config.constants import *
+from systems.rng import rng
+from systems.profiler import profiled
+from systems.spatial_hash import SpatialHash
+from systems.entity_store import EntityStore
+from systems.timer_wheel import TimerWheel
+from systems import horde as horde_system
+from systems.navigation import NavGrid, FlowField
+
+# Fixed seed for the town ground and path texture (keeps it identical every launch)
+TOWN_TEXTURE_SEED = 42
 
 class WorldArea:
     """
@@ -21,12 +31,26 @@ class WorldArea:
     
     Area Types: forest, desert, mountain, swamp, volcano, town, ice, castle, cave, beach
     """
-    def __init__(self, area_x, area_y, area_type="forest"):
+    def __init__(self, area_x, area_y, area_type="forest", seed=None, entities=None, horde=False):
         self.area_x = area_x  # Grid position (0-2)
         self.area_y = area_y  # Grid position (0-2)
         self.area_type = area_type
-        self.enemies = []
-        self.items = []
+        # Per-area seed for decorations, so each area always looks the same
+        self.seed = seed if seed is not None else area_y * WORLD_SIZE + area_x
+        # Enemies and items are rows in the (world's) EntityStore, indexed by area
+        self.entities = entities if entities is not None else EntityStore()
+        # Grid of the area's enemies, items and buildings for collision and proximity checks
+        self.index = SpatialHash()
+        # Horde areas hold thousands of enemies, moved and checked as whole arrays
+        # (systems/horde.py) instead of one by one through the spatial index
+        self.horde = horde
+        # Enemy steps, particle puffs and cutscene animation are scheduled here;
+        # the wheel only turns while this is the current area (see tick())
+        self.timers = TimerWheel()
+        # Walkable squares (built on first use) and the flow field toward the player
+        # that enemies follow (see pursue())
+        self._nav_grid = None
+        self.flow = None
         self.visited = False
         
         # ========================================
@@ -68,9 +92,18 @@ class WorldArea:
             self.town_boundaries = []
             self.decorations = []
             self._generate_town_layout()
+            # Pre-rendered static layer (built lazily on first draw), and the
+            # layout version it was drawn from
+            self.layout_version = 0  # Bumped by invalidate_town_layer()
+            self._town_layer = None
+            self._town_layer_key = None
+        
+        # Cached background surfaces, keyed by whether the grid is drawn
+        self._background_cache = {}
+        self._background_cache_key = None
         
         # Area-specific particle effects
-        self.particle_timer = 0
+        self.particle_timer = None  # Repeating Timer, started by the Game (it owns the particles)
         self.particle_interval = 30  # Frames between particle spawns (faster)
         
         # Initialize cutscene attributes for all areas
@@ -169,8 +202,9 @@ class WorldArea:
             {"x": 180, "y": 570},  # Blacksmith chimney
             {"x": 820, "y": 570},  # Library chimney
         ]
+        self.index_buildings()
     
-    def _draw_scenic_background(self, surface):
+    def _draw_scenic_background(self, surface, rng):
         """Draw scenic background with massive fantasy castle and sunset"""
         # Sunset sky gradient
         for y in range(200):
@@ -340,23 +374,23 @@ class WorldArea:
         pygame.draw.rect(surface, self.background_color, (0, 250, 1000, 450))
         
         # Scattered dirt/earth spots for texture (static, not moving)
-        # Use fixed seed for consistent positioning
-        random.seed(42)  # Fixed seed for town ground texture
+        # The caller passes a private seeded RNG so positions are consistent
+        # and the global random module (used by enemy spawning) is untouched
         for _ in range(50):  # Just a few scattered spots
-            dirt_x = random.randint(0, 1000)
-            dirt_y = random.randint(250, 700)
-            dirt_color = (100 + random.randint(0, 30), 60 + random.randint(0, 20), 40 + random.randint(0, 15))
-            pygame.draw.circle(surface, dirt_color, (dirt_x, dirt_y), random.randint(1, 3))
+            dirt_x = rng.randint(0, 1000)
+            dirt_y = rng.randint(250, 700)
+            dirt_color = (100 + rng.randint(0, 30), 60 + rng.randint(0, 20), 40 + rng.randint(0, 15))
+            pygame.draw.circle(surface, dirt_color, (dirt_x, dirt_y), rng.randint(1, 3))
         
         # Grass texture overlay (solid grass appearance) - STATIC positions
         for x in range(0, 1000, 10):  # More frequent grass
             for y in range(250, 700, 8):  # More frequent grass
-                if random.random() < 0.6:  # Higher density
-                    grass_color = (60 + random.randint(0, 40), 100 + random.randint(0, 40), 40 + random.randint(0, 20))
+                if rng.random() < 0.6:  # Higher density
+                    grass_color = (60 + rng.randint(0, 40), 100 + rng.randint(0, 40), 40 + rng.randint(0, 20))
                     # Fixed positions for grass (no random offset)
                     pygame.draw.circle(surface, grass_color, (x, y), 3)  # Larger grass, fixed position
     
-    def _draw_town_paths(self, surface):
+    def _draw_town_paths(self, surface, rng):
         """Draw red dirt paths connecting buildings"""
         # Main path from gate to town center
         path_points = [(500, 260), (500, 350), (500, 400)]
@@ -388,20 +422,51 @@ class WorldArea:
                 t = i / max(abs(x2-x1) + abs(y2-y1), 1)
                 px = x1 + (x2-x1) * t
                 py = y1 + (y2-y1) * t
-                if random.random() < 0.4:
+                if rng.random() < 0.4:
                     pygame.draw.circle(surface, (100, 60, 40), (int(px), int(py)), 2)
     
+    def _render_town_layer(self):
+        """Render everything static in the town into a new display-format surface"""
+        layer = pygame.Surface((AREA_WIDTH, AREA_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        
+        # One private RNG for the whole layer keeps the ground and path texture
+        # identical between rebuilds
+        rng = random.Random(TOWN_TEXTURE_SEED)
+        self._draw_scenic_background(layer, rng)
+        self._draw_town_paths(layer, rng)
+        self._draw_town_structures(layer)
+        return layer
+    
+    def get_town_layer(self):
+        """Return the cached static town layer, rebuilding it if the layout changed"""
+        if self._town_layer is None or self.layout_version != self._town_layer_key:
+            self._town_layer = self._render_town_layer()
+            self._town_layer_key = self.layout_version
+        return self._town_layer
+    
+    def invalidate_town_layer(self):
+        """Force the static town layer to be rebuilt on the next draw (call after changing the layout)"""
+        self.layout_version += 1
+        self._town_layer = None
+        self._town_layer_key = None
+        self._nav_grid = None
+        self.flow = None
+        self.index_buildings()
+    
     def draw_town(self, surface):
         """Draw the scenic town with unique building styles and red dirt paths"""
         if self.area_type != "town":
             return
-            
-        # Draw scenic background first
-        self._draw_scenic_background(surface)
-        
-        # Draw red dirt paths
-        self._draw_town_paths(surface)
         
+        # Sky, castle, ground, paths, walls, buildings and decorations never
+        # move, so they are blitted from a pre-rendered layer. Animated parts
+        # (guard, chimney smoke particles, cutscene) are drawn live on top.
+        surface.blit(self.get_town_layer(), (0, 0))
+    
+    def _draw_town_structures(self, surface):
+        """Draw town walls, buildings and decorations (static town layer pass)"""
         # Draw town boundaries first (walls and gates) - 3D style
         for boundary in self.town_boundaries:
             if boundary["type"] == "gate":
@@ -763,31 +828,31 @@ class WorldArea:
             
         # Generate smoke from chimneys
         for smoke_source in self.smoke_sources:
-            if random.random() < 0.3:  # 30% chance each frame
+            if rng.vfx.random() < 0.3:  # 30% chance each frame
                 particle_system.add_particle(
                     smoke_source["x"], smoke_source["y"],
                     (100, 100, 100),
-                    (random.uniform(-0.2, 0.2), random.uniform(-1, -0.5)),
+                    (rng.vfx.uniform(-0.2, 0.2), rng.vfx.uniform(-1, -0.5)),
                     4, 60
                 )
         
         # Generate fountain particles (if near town center)
-        if random.random() < 0.2:  # 20% chance each frame
+        if rng.vfx.random() < 0.2:  # 20% chance each frame
             particle_system.add_particle(
                 500, 450,  # Town center
                 (150, 200, 255),
-                (random.uniform(-0.3, 0.3), random.uniform(-0.5, -0.2)),
+                (rng.vfx.uniform(-0.3, 0.3), rng.vfx.uniform(-0.5, -0.2)),
                 3, 40
             )
         
         # Generate leaf particles from trees
-        if random.random() < 0.1:  # 10% chance each frame
+        if rng.vfx.random() < 0.1:  # 10% chance each frame
             tree_positions = [(50, 250), (920, 250), (50, 700), (920, 700)]
-            tree_x, tree_y = random.choice(tree_positions)
+            tree_x, tree_y = rng.vfx.choice(tree_positions)
             particle_system.add_particle(
                 tree_x, tree_y,
                 (100, 150, 50),
-                (random.uniform(-0.2, 0.2), random.uniform(0.2, 0.5)),
+                (rng.vfx.uniform(-0.2, 0.2), rng.vfx.uniform(0.2, 0.5)),
                 3, 50
             )
     
@@ -813,16 +878,147 @@ class WorldArea:
         """Check if player collides with any building"""
         if self.area_type != "town":
             return False
-            
-        player_rect = pygame.Rect(player_x, player_y, PLAYER_SIZE, PLAYER_SIZE)
-        
+        return bool(self.index.query_rect(player_x, player_y, PLAYER_SIZE, PLAYER_SIZE, kind="building"))
+    
+    def index_buildings(self):
+        """File the solid buildings in the spatial index (again, after a layout change)"""
         for building in self.buildings:
+            self.index.remove(building)
             if building.get("collision", False):
-                building_rect = pygame.Rect(building["x"], building["y"], 
-                                          building["width"], building["height"])
-                if player_rect.colliderect(building_rect):
-                    return True
-        return False
+                self.index.insert(building, building["x"], building["y"],
+                                  building["width"], building["height"], kind="building")
+    
+    # ========================================
+    # ENEMIES AND ITEMS
+    # ========================================
+    # Always add and remove through these, so the entity store and the
+    # spatial index stay in step
+    @property
+    def key(self):
+        """Grid position, the area's key in the entity store"""
+        return (self.area_x, self.area_y)
+    
+    @property
+    def enemies(self):
+        """The area's enemies, in the order they spawned (a new list each time)"""
+        return self.entities.members("enemy", self.key)
+    
+    @property
+    def items(self):
+        """The area's items, in the order they spawned (a new list each time)"""
+        return self.entities.members("item", self.key)
+    
+    def add_enemy(self, enemy):
+        """Add an enemy to the area (its steps keep its index entry up to date)"""
+        self.entities.add("enemy", enemy, self.key)
+        if not self.horde:
+            self.index.insert(enemy, enemy.x, enemy.y, ENEMY_SIZE, ENEMY_SIZE, kind="enemy")
+            enemy.spatial_index = self.index
+            # A cooldown of 0 means "step on the next tick", like Enemy.update
+            enemy.movement_timer = self.timers.schedule(enemy.movement_cooldown, self.step_enemy, enemy,
+                                                        period=enemy.movement_delay)
+    
+    def remove_enemy(self, enemy):
+        """Remove an enemy from the area (e.g. when a battle with it starts)"""
+        if enemy.movement_timer is not None:
+            enemy.movement_cooldown = enemy.movement_timer.remaining
+            enemy.movement_timer.cancel()
+            enemy.movement_timer = None
+        self.entities.remove(enemy)
+        self.index.remove(enemy)
+        enemy.spatial_index = None
+    
+    def enemy_rows(self):
+        """Rows of the area's enemies in the entity store's enemy table, in spawn order"""
+        return self.entities.table("enemy").area_rows(self.key)
+    
+    def tick(self, player_x=None, player_y=None):
+        """
+        Run one overworld tick of the area: fire its due timers (enemy steps,
+        particles) and move its horde. Enemies waiting for their next step
+        cost nothing here.
+        
+        With the player's position (and ENEMY_PURSUIT on), enemies step
+        toward the player; without it they wander.
+        """
+        if ENEMY_PURSUIT and player_x is not None and self.entities.count("enemy", self.key):
+            self.pursue(player_x, player_y)
+        else:
+            self.flow = None
+        self.timers.advance()
+        if self.horde:
+            horde_system.step_horde(self.entities.table("enemy"), self.enemy_rows(), flow=self.flow)
+    
+    def step_enemy(self, enemy):
+        """One grid step of an enemy: along the flow field toward the player, or a random one"""
+        direction = None
+        if self.flow is not None:
+            direction = self.flow.direction(enemy.x + ENEMY_SIZE / 2, enemy.y + ENEMY_SIZE / 2)
+        enemy.step(direction)
+    
+    # ========================================
+    # ENEMY PURSUIT
+    # ========================================
+    def nav_solids(self):
+        """Rectangles (area coordinates) enemies can't walk through: solid buildings, walls and towers"""
+        if self.area_type != "town":
+            return []
+        solids = [building for building in self.buildings if building.get("collision", False)]
+        solids += [part for part in self.town_boundaries if part["type"] != "gate"]
+        return [(part["x"], part["y"], part["width"], part["height"]) for part in solids]
+    
+    @property
+    def nav_grid(self):
+        """The area's NavGrid (built on first use and again after invalidate_town_layer)"""
+        if self._nav_grid is None:
+            world_x, world_y = self.get_world_position()
+            self._nav_grid = NavGrid.from_rects(world_x, world_y, self.nav_solids())
+            self.flow = None
+        return self._nav_grid
+    
+    def pursue(self, player_x, player_y):
+        """
+        Point the area's flow field at the player's grid square
+        
+        The breadth-first search only runs again when the player has moved
+        to another square (or the layout changed); otherwise the field from
+        the last call is kept.
+        
+        Returns:
+            FlowField: The field, or None when the player is outside the area
+        """
+        grid = self.nav_grid
+        target = grid.cell_of(player_x + PLAYER_SIZE / 2, player_y + PLAYER_SIZE / 2)
+        if target is None:
+            self.flow = None
+        elif self.flow is None or self.flow.target != target:
+            self.flow = FlowField(grid, target)
+        return self.flow
+    
+    def enemy_at(self, x, y, width, height):
+        """The first spawned enemy overlapping a rectangle, or None"""
+        if self.horde:
+            return horde_system.first_overlap(self.entities.table("enemy"), self.enemy_rows(),
+                                              x, y, width, height)
+        hits = self.index.query_rect(x, y, width, height, kind="enemy")
+        return hits[0] if hits else None
+    
+    def nearest_enemy(self, x, y, max_radius=None):
+        """The enemy closest to a point, or None (also when none is within max_radius)"""
+        if self.horde:
+            return horde_system.nearest_enemy(self.entities.table("enemy"), self.enemy_rows(),
+                                              x, y, max_radius)
+        return self.index.nearest(x, y, kind="enemy", max_radius=max_radius)
+    
+    def add_item(self, item):
+        """Add a collectible item to the area"""
+        self.entities.add("item", item, self.key)
+        self.index.insert(item, item.x, item.y, ITEM_SIZE, ITEM_SIZE, kind="item")
+    
+    def remove_item(self, item):
+        """Remove an item from the area (e.g. when it is picked up)"""
+        self.entities.remove(item)
+        self.index.remove(item)
     
     def _create_town_guard(self):
         """Create the town guard NPC for the entrance cutscene"""
@@ -837,7 +1033,7 @@ class WorldArea:
             "height": 60,
             "color": (100, 150, 200),  # Blue uniform
             "animation_offset": 0,
-            "animation_timer": 0,
+            "bob_timer": None,  # Started with the cutscene
             "dialogue": [
                 "Halt! Welcome to our fair town, traveler.",
                 "I am Captain Marcus, keeper of the peace.",
@@ -866,6 +1062,7 @@ class WorldArea:
             self.cutscene_active = True
             self.cutscene_timer = 0
             self.cutscene_phase = 0
+            self.guard["bob_timer"] = self.timers.schedule(10, self._bob_guard, period=10)
             return True
         return False
     
@@ -876,12 +1073,6 @@ class WorldArea:
             
         self.cutscene_timer += 1
         
-        # Update guard animation
-        self.guard["animation_timer"] += 1
-        if self.guard["animation_timer"] >= 10:
-            self.guard["animation_timer"] = 0
-            self.guard["animation_offset"] = 2 if self.guard["animation_offset"] == 0 else 0
-        
         # Cutscene phases
         if self.cutscene_phase == 0:  # Guard approaches
             if self.cutscene_timer > 5:  # Much faster spawn (reduced from 15 to 5)
@@ -900,6 +1091,11 @@ class WorldArea:
                 # Hide the guard after cutscene
                 if self.guard:
                     self.guard["visible"] = False
+                    self.guard["bob_timer"].cancel()
+    
+    def _bob_guard(self):
+        """Move the cutscene guard up or down (every 10 ticks while the cutscene runs)"""
+        self.guard["animation_offset"] = 2 if self.guard["animation_offset"] == 0 else 0
     
     def draw_cutscene(self, surface):
         """Draw the entrance cutscene"""
@@ -1055,40 +1251,87 @@ class WorldArea:
         # Position dialogue box at bottom of screen
         surface.blit(dialogue_box, (100, SCREEN_HEIGHT - 200))
     
-    def draw(self, surface, world_map=None):
-        """Draw the area based on its type"""
+    def _background_key(self):
+        """Everything the cached background depends on"""
+        key = (self.area_type, self.background_color, self.grid_color, self.seed)
         if self.area_type == "town":
-            self.draw_town(surface)
+            key += (self.layout_version,)
+        return key
+    
+    def _draw_area_decorations(self, surface, rng):
+        """Draw area-specific decorations (trees, dunes, peaks) using the area RNG"""
+        if self.area_type == "forest":
+            # Draw trees
+            for i in range(5):
+                x = rng.randint(50, SCREEN_WIDTH - 50)
+                y = rng.randint(50, SCREEN_HEIGHT - 50)
+                pygame.draw.circle(surface, (50, 100, 50), (x, y), 30)
+        elif self.area_type == "desert":
+            # Draw sand dunes
+            for i in range(3):
+                x = rng.randint(100, SCREEN_WIDTH - 100)
+                y = rng.randint(100, SCREEN_HEIGHT - 100)
+                pygame.draw.ellipse(surface, (120, 110, 80), (x, y, 80, 40))
+        elif self.area_type == "mountain":
+            # Draw mountain peaks
+            points = [(0, SCREEN_HEIGHT), (200, SCREEN_HEIGHT - 100), 
+                     (400, SCREEN_HEIGHT - 150), (600, SCREEN_HEIGHT - 120),
+                     (800, SCREEN_HEIGHT - 130), (SCREEN_WIDTH, SCREEN_HEIGHT)]
+            pygame.draw.polygon(surface, (80, 80, 100), points)
+    
+    def _draw_grid(self, surface, width=2):
+        """Draw the movement grid for this area"""
+        for x in range(0, SCREEN_WIDTH, GRID_SIZE):
+            pygame.draw.line(surface, self.grid_color, (x, 0), (x, SCREEN_HEIGHT), width)
+        for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
+            pygame.draw.line(surface, self.grid_color, (0, y), (SCREEN_WIDTH, y), width)
+    
+    def _render_background(self, with_grid):
+        """Render the full static background (fill, decorations, grid) for this area"""
+        if self.area_type == "town":
+            background = self.get_town_layer().copy()
         else:
-            # Draw regular area background
-            surface.fill(self.background_color)
-            
-            # Draw grid overlay
-            for x in range(0, SCREEN_WIDTH, GRID_SIZE):
-                pygame.draw.line(surface, self.grid_color, (x, 0), (x, SCREEN_HEIGHT), 1)
-            for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
-                pygame.draw.line(surface, self.grid_color, (0, y), (SCREEN_WIDTH, y), 1)
-            
-            # Draw area-specific decorations
-            if self.area_type == "forest":
-                # Draw trees
-                for i in range(5):
-                    x = random.randint(50, SCREEN_WIDTH - 50)
-                    y = random.randint(50, SCREEN_HEIGHT - 50)
-                    pygame.draw.circle(surface, (50, 100, 50), (x, y), 30)
-            elif self.area_type == "desert":
-                # Draw sand dunes
-                for i in range(3):
-                    x = random.randint(100, SCREEN_WIDTH - 100)
-                    y = random.randint(100, SCREEN_HEIGHT - 100)
-                    pygame.draw.ellipse(surface, (120, 110, 80), (x, y, 80, 40))
-            elif self.area_type == "mountain":
-                # Draw mountain peaks
-                points = [(0, SCREEN_HEIGHT), (200, SCREEN_HEIGHT - 100), 
-                         (400, SCREEN_HEIGHT - 150), (600, SCREEN_HEIGHT - 120),
-                         (800, SCREEN_HEIGHT - 130), (SCREEN_WIDTH, SCREEN_HEIGHT)]
-                pygame.draw.polygon(surface, (80, 80, 100), points)
+            background = pygame.Surface((AREA_WIDTH, AREA_HEIGHT))
+            if pygame.display.get_surface() is not None:
+                background = background.convert()
+            background.fill(self.background_color)
+            if not with_grid:
+                # Thin grid under the decorations when the thick grid is hidden
+                self._draw_grid(background, 1)
+            self._draw_area_decorations(background, random.Random(self.seed))
+        
+        if with_grid:
+            self._draw_grid(background)
+        return background
+    
+    def get_background(self, with_grid=True):
+        """
+        Return the cached background surface for this area.
+        
+        The surface is built on first use and reused until the area's look
+        changes (colors, seed or town layout), so decorations stay put.
+        """
+        background_key = self._background_key()
+        if background_key != self._background_cache_key:
+            self._background_cache = {}
+            self._background_cache_key = background_key
+        if with_grid not in self._background_cache:
+            self._background_cache[with_grid] = self._render_background(with_grid)
+        return self._background_cache[with_grid]
+    
+    def invalidate_background(self):
+        """Force every cached background surface to be rebuilt on the next draw"""
+        self._background_cache = {}
+        self._background_cache_key = None
+        if self.area_type == "town":
+            self.invalidate_town_layer()
+    
+    @profiled("world_area.draw")
+    def draw(self, surface, world_map=None):
+        """Draw the area based on its type"""
+        # The grid is hidden while the town cutscene plays
+        surface.blit(self.get_background(with_grid=not self.cutscene_active), (0, 0))
         
         # Draw town cutscene if active
         if self.cutscene_active:
-            self.draw_cutscene(surface) 
\ No newline at end of file
+            self.draw_cutscene(surface) 
@@ -9,13 +9,14 @@ camera positioning, and area transitions.
 import pygame
 from config.constants import *
 from world.world_area import WorldArea
+from systems.entity_store import EntityStore
 
 class WorldMap:
     """
     Manages the entire 3x3 world grid, camera positioning, and area transitions.
     Handles coordinate conversion between world and screen space.
     """
-    def __init__(self):
+    def __init__(self, horde=False):
         self.areas = {}
         self.current_area_x = 1  # Start in center area
         self.current_area_y = 1
@@ -23,6 +24,8 @@ class WorldMap:
         self.camera_y = 0
         self.area_transition_alpha = 0
         self.transitioning = False
+        # Every enemy and item in the world (each area indexes its own)
+        self.entities = EntityStore()
         
         # Initialize all areas
         area_types = [
@@ -34,7 +37,9 @@ class WorldMap:
         for y in range(WORLD_SIZE):
             for x in range(WORLD_SIZE):
                 area_type = area_types[y][x]
-                self.areas[(x, y)] = WorldArea(x, y, area_type)
+                # In horde mode every area outside the town fills with a horde
+                self.areas[(x, y)] = WorldArea(x, y, area_type, entities=self.entities,
+                                               horde=horde and area_type != "town")
         
         # Mark starting area as visited
         self.areas[(1, 1)].visited = True